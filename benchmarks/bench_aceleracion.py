@@ -0,0 +1,105 @@
+"""
+Benchmark - Aceleracion de Anderson y Chebyshev
+===============================================
+
+Compara la cantidad de barridos y el tiempo de jacobi y gauss_seidel
+contra sus versiones aceleradas (acelerar) en un conjunto de problemas de
+convergencia lenta. Todas las corridas usan el mismo criterio de parada
+(||x_{k+1} - x_k||_inf < tolerancia) y el mismo tope de barridos.
+
+Uso:
+    python benchmarks/bench_aceleracion.py [tolerancia] [max_iter]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from metodos_numericos.sistemas_lineales import (
+    MatrizCSR, acelerar, gauss_seidel, jacobi, matriz_poisson
+)
+
+
+def problemas():
+    """(nombre, A, b, rho_J) con rho_J el radio espectral de Jacobi si se conoce"""
+    rng = np.random.default_rng(0)
+
+    n = 200
+    yield "poisson 1D n=200", matriz_poisson((n,)), np.ones(n), np.cos(np.pi / (n + 1))
+
+    m = 40
+    yield "poisson 2D 40x40", matriz_poisson((m, m)), np.ones(m * m), np.cos(np.pi / (m + 1))
+
+    # Conveccion-difusion 2D (no simetrica) con el esquema upwind
+    m = 30
+    filas, columnas, valores = [], [], []
+    for i in range(m):
+        for j in range(m):
+            k = i * m + j
+            filas.append(k); columnas.append(k); valores.append(4.5)
+            for di, dj, v in ((-1, 0, -1.5), (1, 0, -1.0), (0, -1, -1.0), (0, 1, -1.0)):
+                if 0 <= i + di < m and 0 <= j + dj < m:
+                    filas.append(k); columnas.append((i + di) * m + j + dj); valores.append(v)
+    A = MatrizCSR.desde_tripletes(filas, columnas, valores, (m * m, m * m))
+    yield "conveccion-difusion 30x30", A, rng.standard_normal(m * m), None
+
+    # Densa apenas diagonal dominante
+    n = 300
+    A = rng.random((n, n))
+    A += np.diag(1.02 * (A.sum(axis=1) - np.diag(A)))
+    yield "densa debilmente dominante", A, rng.standard_normal(n), None
+
+
+def medir(funcion):
+    t0 = time.perf_counter()
+    _, iteraciones, info = funcion()
+    return iteraciones, time.perf_counter() - t0, info['residuo']
+
+
+def main():
+    tolerancia = float(sys.argv[1]) if len(sys.argv) > 1 else 1e-8
+    max_iter = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    print(f"Benchmark: aceleracion de metodos estacionarios, tolerancia={tolerancia:g}, "
+          f"max_iter={max_iter}")
+    for nombre, A, b, rho in problemas():
+        print()
+        print(nombre)
+        print(f"{'metodo':>32} {'barridos':>9} {'tiempo (s)':>11} {'||b - Ax||':>11}")
+        print("-" * 66)
+
+        corridas = [
+            ("jacobi", lambda: jacobi(A, b, tolerancia=tolerancia, max_iter=max_iter,
+                                      devolver_info=True)),
+            ("jacobi + anderson(5)", lambda: acelerar(
+                A, b, tolerancia=tolerancia, max_iter=max_iter, devolver_info=True)),
+        ]
+        if rho is not None:
+            corridas.append(("jacobi + chebyshev", lambda: acelerar(
+                A, b, aceleracion='chebyshev', limites=(-rho, rho), tolerancia=tolerancia,
+                max_iter=max_iter, devolver_info=True)))
+        if isinstance(A, MatrizCSR):
+            def gs():
+                x, k = gauss_seidel(A, b, tolerancia=tolerancia, max_iter=max_iter)
+                return x, k, {'residuo': float(np.linalg.norm(b - A.producto(np.asarray(x))))}
+            corridas += [
+                ("gauss_seidel", gs),
+                ("gauss_seidel + anderson(5)", lambda: acelerar(
+                    A, b, metodo='gauss_seidel', tolerancia=tolerancia, max_iter=max_iter,
+                    devolver_info=True)),
+            ]
+
+        for etiqueta, funcion in corridas:
+            iteraciones, t, residuo = medir(funcion)
+            # Cada aceleracion se compara con el metodo sin acelerar
+            if '+' not in etiqueta:
+                base = iteraciones
+            print(f"{etiqueta:>32} {iteraciones:>9} {t:>11.3f} {residuo:>11.2e}  "
+                  f"({base / iteraciones:5.1f}x menos barridos)")
+
+
+if __name__ == "__main__":
+    main()
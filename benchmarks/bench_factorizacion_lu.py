@@ -0,0 +1,68 @@
+"""
+Benchmark - Factorizacion LU reutilizable
+=========================================
+
+Compara resolver muchos lados derechos con la misma matriz llamando a
+eliminacion_gaussiana una vez por vector contra factorizar una sola vez
+con FactorizacionLU y luego resolver cada vector (o todos juntos).
+
+Uso:
+    python benchmarks/bench_factorizacion_lu.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metodos_numericos.sistemas_lineales import eliminacion_gaussiana, FactorizacionLU
+
+
+def matriz_aleatoria(n, semilla=0):
+    """Matriz densa aleatoria diagonalmente dominante"""
+    rng = random.Random(semilla)
+    A = [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+    for i in range(n):
+        A[i][i] += n
+    return A
+
+
+def main():
+    print("Benchmark: FactorizacionLU vs eliminacion_gaussiana por cada b")
+    print("-" * 64)
+    print(f"{'n':>5} {'rhs':>5} {'por b (s)':>12} {'LU+resolver (s)':>16} {'aceleracion':>12}")
+
+    for n, m in [(20, 200), (50, 200), (100, 100)]:
+        A = matriz_aleatoria(n)
+        rng = random.Random(1)
+        bs = [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(m)]
+
+        t0 = time.perf_counter()
+        xs_ref = [eliminacion_gaussiana(A, b) for b in bs]
+        t_ref = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        lu = FactorizacionLU(A)
+        xs = [lu.resolver(b) for b in bs]
+        t_lu = time.perf_counter() - t0
+
+        # Los resultados deben coincidir exactamente
+        assert xs == xs_ref
+
+        print(f"{n:>5} {m:>5} {t_ref:>12.4f} {t_lu:>16.4f} {t_ref / t_lu:>11.1f}x")
+
+    # Resolucion por lotes: B con los lados derechos como columnas
+    n, m = 50, 200
+    A = matriz_aleatoria(n)
+    rng = random.Random(2)
+    B = [[rng.uniform(-1, 1) for _ in range(m)] for _ in range(n)]
+    t0 = time.perf_counter()
+    X = FactorizacionLU(A).resolver(B)
+    t_lote = time.perf_counter() - t0
+    print()
+    print(f"resolver(B) con n={n} y {m} columnas: {t_lote:.4f} s ({len(X)}x{len(X[0])})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark - Jacobi paralelo con memoria compartida
+==================================================
+
+Mide el escalado de jacobi_paralelo al variar la cantidad de procesos y
+verifica que el resultado coincida, salvo redondeo, con el de jacobi
+vectorizado serial.
+
+Uso:
+    python benchmarks/bench_jacobi_paralelo.py [n] [iteraciones]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from metodos_numericos.sistemas_lineales import jacobi, jacobi_paralelo
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    iteraciones = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    # Matriz densa diagonalmente dominante
+    rng = np.random.default_rng(0)
+    A = rng.standard_normal((n, n))
+    A += np.diag(np.abs(A).sum(axis=1))
+    b = rng.standard_normal(n)
+
+    print(f"Benchmark: jacobi_paralelo, n={n}, {iteraciones} barridos, "
+          f"{os.cpu_count()} nucleos disponibles")
+    print("-" * 64)
+
+    t0 = time.perf_counter()
+    x_serial, _ = jacobi(A, b, tolerancia=0.0, max_iter=iteraciones)
+    t_serial = time.perf_counter() - t0
+    print(f"{'serial':>10} {t_serial:>10.3f} s")
+
+    procesos = 1
+    while procesos <= max(1, os.cpu_count() or 1):
+        t0 = time.perf_counter()
+        x, _ = jacobi_paralelo(A, b, tolerancia=0.0, max_iter=iteraciones, procesos=procesos)
+        t = time.perf_counter() - t0
+        diferencia = np.abs(x - x_serial).max() / np.abs(x_serial).max()
+        print(f"{procesos:>10} {t:>10.3f} s  aceleracion {t_serial / t:5.2f}x  "
+              f"diferencia relativa {diferencia:.1e}")
+        procesos *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+"""
+Benchmark - Suite de metodos de sistemas_lineales
+=================================================
+
+Genera familias de matrices de prueba (diagonal dominante, SPD,
+tridiagonal, dispersa general y mal condicionada tipo Hilbert) en varios
+tamanos, corre cada metodo aplicable y registra tiempo, memoria pico
+(tracemalloc, en una corrida aparte para no distorsionar el tiempo),
+iteraciones y residuo relativo ||b - Ax|| / ||b||.
+
+Los tiempos se toman como en timeit: una primera corrida (que llena las
+caches por identidad de A) y luego --repeticiones mediciones de un lote
+de corridas cuyo tamano se ajusta para durar al menos 0.2 s. Se guardan
+el minimo ('tiempo', el que se compara), la mediana y la primera corrida.
+
+Los resultados se guardan en JSON o CSV (segun la extension de --salida)
+para comparar versiones; --comparar marca los casos que se volvieron mas
+lentos respecto de un JSON anterior.
+
+Uso:
+    python benchmarks/bench_sistemas_lineales.py
+    python benchmarks/bench_sistemas_lineales.py --tamanos 10,100,1000 --salida resultados.json
+    python benchmarks/bench_sistemas_lineales.py --familias spd --comparar anterior.json
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from metodos_numericos.sistemas_lineales import (
+    FactorizacionCholesky, FactorizacionLU, MatrizCSR, acelerar, bicgstab,
+    eliminacion_gaussiana, gauss_seidel, gauss_seidel_bloques, gmres, gradiente_conjugado,
+    jacobi, jacobi_bloques, jacobi_paralelo, ldlt, matriz_a_banda, matriz_poisson, multigrid,
+    relajacion, resolver, resolver_banda
+)
+
+TAMANOS = (10, 100, 1000, 10000, 100000)
+FAMILIAS = ('dominante', 'spd', 'tridiagonal', 'dispersa', 'hilbert')
+TOLERANCIA = 1e-8
+MAX_ITER = 2000
+REPETICIONES = 5
+
+# Ordenes maximos: por encima el metodo tarda demasiado para una corrida de rutina
+MAX_DENSA = 2000
+MAX_ESCALAR = 1000
+
+
+# Familias de matrices
+
+def _dispersa_aleatoria(n, por_fila, rng):
+    filas = np.repeat(np.arange(n), por_fila)
+    columnas = rng.integers(0, n, n * por_fila)
+    valores = rng.standard_normal(n * por_fila)
+    return filas, columnas, valores
+
+
+def familia_dominante(n, rng):
+    """Dispersa aleatoria con diagonal 1.1 veces la suma de la fila"""
+    filas, columnas, valores = _dispersa_aleatoria(n, 5, rng)
+    fuera = filas != columnas
+    suma = np.bincount(filas[fuera], np.abs(valores[fuera]), minlength=n)
+    A = MatrizCSR.desde_tripletes(np.r_[filas[fuera], np.arange(n)], np.r_[columnas[fuera], np.arange(n)],
+                                  np.r_[valores[fuera], 1.1 * suma + 1.0], (n, n))
+    return {'A': A}
+
+
+def familia_spd(n, rng):
+    """Laplaciano 2-D de 5 puntos en una grilla m x m con m = 2^k - 1"""
+    m = max(3, 2 ** int(round(np.log2(np.sqrt(n) + 1))) - 1)
+    return {'A': matriz_poisson((m, m)), 'forma': (m, m)}
+
+
+def familia_tridiagonal(n, rng):
+    """Tridiagonal aleatoria con diagonal dominante"""
+    sub, sobre = rng.uniform(-1, 1, n - 1), rng.uniform(-1, 1, n - 1)
+    diagonal = 2.0 + rng.uniform(0, 1, n)
+    i = np.arange(n)
+    A = MatrizCSR.desde_tripletes(np.r_[i, i[1:], i[:-1]], np.r_[i, i[:-1], i[1:]],
+                                  np.r_[diagonal, sub, sobre], (n, n))
+    return {'A': A}
+
+
+def familia_dispersa(n, rng):
+    """Dispersa aleatoria no simetrica ni dominante (diagonal desplazada para ser regular)"""
+    filas, columnas, valores = _dispersa_aleatoria(n, 5, rng)
+    i = np.arange(n)
+    A = MatrizCSR.desde_tripletes(np.r_[filas, i], np.r_[columnas, i], np.r_[valores, np.full(n, 3.0)],
+                                  (n, n))
+    return {'A': A}
+
+
+def familia_hilbert(n, rng):
+    """Matriz de Hilbert (SPD y muy mal condicionada), solo densa"""
+    if n > MAX_DENSA:
+        return None
+    i = np.arange(n)
+    return {'A': 1.0 / (i[:, None] + i[None, :] + 1)}
+
+
+GENERADORES = {
+    'dominante': familia_dominante,
+    'spd': familia_spd,
+    'tridiagonal': familia_tridiagonal,
+    'dispersa': familia_dispersa,
+    'hilbert': familia_hilbert,
+}
+
+
+# Metodos: (nombre, familias, orden maximo, funcion(caso, b) -> (x, iteraciones))
+
+def _densa(caso):
+    A = caso['A']
+    if 'densa' not in caso:
+        caso['densa'] = A.a_densa() if isinstance(A, MatrizCSR) else A
+    return caso['densa']
+
+
+def _dispersa(caso):
+    A = caso['A']
+    if 'dispersa' not in caso:
+        caso['dispersa'] = A if isinstance(A, MatrizCSR) else MatrizCSR.desde_densa(A)
+    return caso['dispersa']
+
+
+def _lu(caso, b):
+    return FactorizacionLU(_densa(caso)).resolver(b), 0
+
+
+def _lu_mixta(caso, b):
+    return eliminacion_gaussiana(_densa(caso), b, precision='mixta'), 0
+
+
+def _cholesky(caso, b):
+    return FactorizacionCholesky(_densa(caso)).resolver(b), 0
+
+
+def _ldlt(caso, b):
+    return ldlt(_densa(caso), b), 0
+
+
+def _banda(caso, b):
+    return resolver_banda(matriz_a_banda(caso['A'], 1, 1), b, 1, 1), 0
+
+
+def _jacobi(caso, b):
+    return jacobi(_dispersa(caso), b, tolerancia=TOLERANCIA, max_iter=MAX_ITER)
+
+
+def _jacobi_bloques(caso, b):
+    return jacobi_bloques(_dispersa(caso), b, tolerancia=TOLERANCIA, max_iter=MAX_ITER)
+
+
+def _jacobi_paralelo(caso, b):
+    return jacobi_paralelo(_dispersa(caso), b, tolerancia=TOLERANCIA, max_iter=MAX_ITER)
+
+
+def _jacobi_anderson(caso, b):
+    return acelerar(_dispersa(caso), b, tolerancia=TOLERANCIA, max_iter=MAX_ITER)
+
+
+def _gauss_seidel(caso, b):
+    return gauss_seidel(_dispersa(caso), b, tolerancia=TOLERANCIA, max_iter=MAX_ITER)
+
+
+def _gauss_seidel_multicolor(caso, b):
+    return gauss_seidel(_dispersa(caso), b, tolerancia=TOLERANCIA, max_iter=MAX_ITER,
+                        ordenamiento='multicolor')
+
+
+def _gauss_seidel_bloques(caso, b):
+    return gauss_seidel_bloques(_dispersa(caso), b, tolerancia=TOLERANCIA, max_iter=MAX_ITER)
+
+
+def _sor(caso, b):
+    return relajacion(_dispersa(caso), b, omega=1.5, tolerancia=TOLERANCIA,
+                      max_iter=MAX_ITER, ordenamiento='multicolor')
+
+
+def _sor_adaptativo(caso, b):
+    return relajacion(_dispersa(caso), b, omega='adaptativo', tolerancia=TOLERANCIA,
+                      max_iter=MAX_ITER, ordenamiento='multicolor')
+
+
+def _cg(caso, b):
+    return gradiente_conjugado(_dispersa(caso), b, tolerancia=TOLERANCIA, max_iter=MAX_ITER,
+                               precondicionador='cholesky_incompleto')
+
+
+def _gmres(caso, b):
+    return gmres(_dispersa(caso), b, tolerancia=TOLERANCIA, max_iter=MAX_ITER,
+                 precondicionador='jacobi')
+
+
+def _bicgstab(caso, b):
+    return bicgstab(_dispersa(caso), b, tolerancia=TOLERANCIA, max_iter=MAX_ITER,
+                    precondicionador='jacobi')
+
+
+def _multigrid(caso, b):
+    return multigrid(b, caso['forma'], tolerancia=TOLERANCIA)
+
+
+def _resolver(caso, b):
+    x, info = resolver(caso['A'], b, tolerancia=TOLERANCIA)
+    return x, info['iteraciones']
+
+
+ESTACIONARIOS = ('dominante', 'tridiagonal', 'spd')
+METODOS = [
+    ('eliminacion_gaussiana', FAMILIAS, MAX_DENSA, _lu),
+    ('eliminacion_gaussiana mixta', FAMILIAS, MAX_DENSA, _lu_mixta),
+    ('cholesky', ('spd', 'hilbert'), MAX_DENSA, _cholesky),
+    ('ldlt', ('spd', 'hilbert'), MAX_DENSA, _ldlt),
+    ('resolver_banda', ('tridiagonal',), None, _banda),
+    ('jacobi', ('dominante', 'tridiagonal'), None, _jacobi),
+    ('jacobi_bloques', ('dominante', 'tridiagonal'), None, _jacobi_bloques),
+    ('jacobi_paralelo', ('dominante', 'tridiagonal'), None, _jacobi_paralelo),
+    ('jacobi + anderson(5)', ESTACIONARIOS, None, _jacobi_anderson),
+    ('gauss_seidel', ESTACIONARIOS, MAX_ESCALAR, _gauss_seidel),
+    ('gauss_seidel multicolor', ESTACIONARIOS, None, _gauss_seidel_multicolor),
+    ('gauss_seidel_bloques', ESTACIONARIOS, MAX_ESCALAR, _gauss_seidel_bloques),
+    ('relajacion omega=1.5', ('spd',), None, _sor),
+    ('relajacion adaptativa', ('spd',), None, _sor_adaptativo),
+    ('gradiente_conjugado IC(0)', ('spd',), None, _cg),
+    ('gmres jacobi', ('dominante', 'dispersa', 'tridiagonal'), None, _gmres),
+    ('bicgstab jacobi', ('dominante', 'dispersa', 'tridiagonal'), None, _bicgstab),
+    ('multigrid', ('spd',), None, _multigrid),
+    ('resolver', FAMILIAS, None, _resolver),
+]
+
+
+def medir(funcion, caso, b, con_memoria, repeticiones=REPETICIONES):
+    """Retorna ({'tiempo', 'tiempo_mediana', 'tiempo_primera'}, memoria pico en
+    bytes o None, iteraciones, residuo relativo); tiempos en segundos por corrida"""
+    t0 = time.perf_counter()
+    x, iteraciones = funcion(caso, b)
+    primera = time.perf_counter() - t0
+
+    temporizador = timeit.Timer(lambda: funcion(caso, b))
+    numero = temporizador.autorange()[0] if primera < 0.2 else 1
+    tiempos = [t / numero for t in temporizador.repeat(repeticiones, numero)]
+    tiempos = {'tiempo': min(tiempos), 'tiempo_mediana': float(np.median(tiempos)),
+               'tiempo_primera': primera}
+
+    pico = None
+    if con_memoria:
+        tracemalloc.start()
+        funcion(caso, b)
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    A = _dispersa(caso)
+    residuo = np.linalg.norm(b - A.producto(np.asarray(x, dtype=float))) / np.linalg.norm(b)
+    return tiempos, pico, int(iteraciones), float(residuo)
+
+
+def correr(tamanos, familias, con_memoria, semilla, repeticiones=REPETICIONES):
+    resultados = []
+    print(f"{'familia':>12} {'n':>7} {'metodo':>28} {'minimo (s)':>11} {'mediana (s)':>11} "
+          f"{'memoria (MB)':>13} {'iter':>6} {'residuo':>9}")
+    print("-" * 106)
+    for familia in familias:
+        for n in tamanos:
+            rng = np.random.default_rng(semilla)
+            caso = GENERADORES[familia](n, rng)
+            if caso is None:
+                continue
+            n_real = len(caso['A'])
+            b = rng.standard_normal(n_real)
+            for nombre, aplicables, maximo, funcion in METODOS:
+                if familia not in aplicables or (maximo is not None and n_real > maximo):
+                    continue
+                try:
+                    tiempos, pico, iteraciones, residuo = medir(funcion, caso, b, con_memoria,
+                                                                repeticiones)
+                    error = None
+                except (ZeroDivisionError, ValueError, RuntimeError, np.linalg.LinAlgError) as e:
+                    tiempos = dict.fromkeys(('tiempo', 'tiempo_mediana', 'tiempo_primera'))
+                    pico = iteraciones = residuo = None
+                    error = str(e)
+                resultados.append({
+                    'familia': familia, 'n': n_real, 'nnz': _dispersa(caso).nnz, 'metodo': nombre,
+                    **tiempos, 'memoria_pico': pico, 'iteraciones': iteraciones,
+                    'residuo': residuo, 'error': error,
+                })
+                if error is None:
+                    memoria = f"{pico / 2**20:13.2f}" if pico is not None else f"{'-':>13}"
+                    print(f"{familia:>12} {n_real:>7} {nombre:>28} {tiempos['tiempo']:>11.4g} "
+                          f"{tiempos['tiempo_mediana']:>11.4g} {memoria} "
+                          f"{iteraciones:>6} {residuo:>9.1e}")
+                else:
+                    print(f"{familia:>12} {n_real:>7} {nombre:>28}  error: {error}")
+    return resultados
+
+
+def guardar(resultados, ruta, semilla, repeticiones=REPETICIONES):
+    if ruta.endswith('.csv'):
+        with open(ruta, 'w', newline='') as archivo:
+            escritor = csv.DictWriter(archivo, fieldnames=list(resultados[0]))
+            escritor.writeheader()
+            escritor.writerows(resultados)
+        return
+    metadatos = {
+        'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'plataforma': platform.platform(),
+        'semilla': semilla,
+        'tolerancia': TOLERANCIA,
+        'repeticiones': repeticiones,
+    }
+    with open(ruta, 'w') as archivo:
+        json.dump({'metadatos': metadatos, 'resultados': resultados}, archivo, indent=1)
+
+
+def comparar(resultados, ruta, umbral):
+    """Imprime los casos cuyo tiempo minimo supera umbral veces el del JSON anterior"""
+    with open(ruta) as archivo:
+        anteriores = {(r['familia'], r['n'], r['metodo']): r for r in json.load(archivo)['resultados']}
+    print()
+    print(f"Comparacion con {ruta} (regresion si tarda mas de {umbral:g}x)")
+    regresiones = 0
+    for r in resultados:
+        anterior = anteriores.get((r['familia'], r['n'], r['metodo']))
+        if not anterior or r['tiempo'] is None or not anterior['tiempo']:
+            continue
+        razon = r['tiempo'] / anterior['tiempo']
+        if razon > umbral:
+            regresiones += 1
+            print(f"  {r['familia']:>12} {r['n']:>7} {r['metodo']:>28}  "
+                  f"{anterior['tiempo']:.4f} s -> {r['tiempo']:.4f} s ({razon:.2f}x)")
+    print(f"  {regresiones} regresiones")
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--tamanos', default=','.join(map(str, TAMANOS)),
+                        help="ordenes separados por comas")
+    parser.add_argument('--familias', default=','.join(FAMILIAS),
+                        help="familias separadas por comas: " + ', '.join(FAMILIAS))
+    parser.add_argument('--salida', help="archivo .json o .csv para los resultados")
+    parser.add_argument('--comparar', help="JSON de una corrida anterior")
+    parser.add_argument('--umbral', type=float, default=1.5,
+                        help="razon de tiempos considerada regresion (por defecto 1.5)")
+    parser.add_argument('--sin-memoria', action='store_true',
+                        help="no medir la memoria pico (evita la segunda corrida)")
+    parser.add_argument('--repeticiones', type=int, default=REPETICIONES,
+                        help=f"mediciones por caso (por defecto {REPETICIONES})")
+    parser.add_argument('--semilla', type=int, default=0)
+    argumentos = parser.parse_args()
+
+    tamanos = [int(t) for t in argumentos.tamanos.split(',')]
+    familias = argumentos.familias.split(',')
+    for familia in familias:
+        if familia not in GENERADORES:
+            parser.error(f"familia desconocida: {familia}")
+
+    print(f"Benchmark: sistemas_lineales, tolerancia={TOLERANCIA:g}, max_iter={MAX_ITER}")
+    resultados = correr(tamanos, familias, not argumentos.sin_memoria, argumentos.semilla,
+                        argumentos.repeticiones)
+    if argumentos.salida:
+        guardar(resultados, argumentos.salida, argumentos.semilla, argumentos.repeticiones)
+        print(f"\nResultados en {argumentos.salida}")
+    if argumentos.comparar:
+        comparar(resultados, argumentos.comparar, argumentos.umbral)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ Este paquete contiene implementaciones de diversos metodos numericos para:
 Modulos disponibles:
 - funciones: Definicion de funciones matematicas comunes
 - localizacion_raices: Metodos para encontrar raices de ecuaciones
+- localizacion_raices_lotes: Las mismas busquedas sobre arreglos de problemas
 - sistemas_lineales: Metodos para resolver sistemas de ecuaciones
 - interpolacion: Metodos de interpolacion y regresion
 - integracion: Metodos de integracion numerica
@@ -29,10 +30,23 @@ from .funciones import (
     verificar_cambio_signo, evaluar_funcion_segura, crear_funcion_personalizada
 )
 from .localizacion_raices import (
-    biseccion, newton_raphson, regula_falsi, punto_fijo, secante
+    biseccion, newton_raphson, regula_falsi, punto_fijo, secante, brent
+)
+from .localizacion_raices_lotes import (
+    biseccion_lotes, regula_falsi_lotes, secante_lotes
 )
 from .sistemas_lineales import (
-    eliminacion_gaussiana, jacobi, gauss_seidel, relajacion
+    eliminacion_gaussiana, jacobi, gauss_seidel, relajacion,
+    FactorizacionLU, eliminacion_gaussiana_lotes, MatrizCSR, coloreo_grafo,
+    gradiente_conjugado, precondicionador_jacobi, precondicionador_cholesky_incompleto,
+    gmres, bicgstab, matriz_a_banda, resolver_banda, resolver_tridiagonal,
+    resolver_pentadiagonal, matriz_poisson, restriccion, prolongacion, multigrid,
+    jacobi_paralelo, abrir_matriz_disco, tripletes_a_disco, texto_a_disco,
+    FactorizacionCholesky, FactorizacionLDL, cholesky, ldlt, es_spd_probable, factorizar,
+    empaquetar_simetrica, desempaquetar_simetrica, resolver, analizar_matriz,
+    crear_barrido, aceleracion_anderson, aceleracion_chebyshev, acelerar,
+    jacobi_bloques, gauss_seidel_bloques, detectar_bloques, SesionSistemas,
+    leer_matrix_market, escribir_matrix_market, leer_csr_binario, escribir_csr_binario
 )
 from .interpolacion import (
     lagrange, sistema_ecuaciones, spline_cubica, cuadrados_minimos
@@ -1,5 +1,11 @@
 # Modulo de Interpolacion
 
+import numpy as np
+
+from .sistemas_lineales import (
+    eliminacion_gaussiana, resolver_tridiagonal, UMBRAL_VECTORIZADO
+)
+
 def sistema_ecuaciones(x_vals, y_vals):
     """Resuelve un sistema de ecuaciones para interpolacion polinomial"""
     n = len(x_vals)
@@ -27,6 +33,10 @@ def sistema_ecuaciones(x_vals, y_vals):
 def eliminacion_gaussiana_simple(A, b):
     """Eliminacion gaussiana simple para resolver Ax = b"""
     n = len(A)
+
+    # Para ndarrays o sistemas grandes se usa el nucleo vectorizado
+    if isinstance(A, np.ndarray) or n >= UMBRAL_VECTORIZADO:
+        return eliminacion_gaussiana(A, b)
     
     # Crear matriz aumentada
     for i in range(n):
@@ -123,26 +133,17 @@ def spline_cubica(xv, yv, x):
     h = [xv[i+1] - xv[i] for i in range(n-1)]
 
     # diagonales (condicion natural: extremos fijos)
-    a = [0.0] + h[:-1]                              # subdiagonal
+    a = [0.0] + h[:-1] + [0.0]                      # subdiagonal
     b = [1.0] + [2.0*(h[i-1]+h[i]) for i in range(1, n-1)] + [1.0]  # diagonal
-    c = h[1:] + [0.0]                               # superdiagonal
+    c = [0.0] + h[1:] + [0.0]                       # superdiagonal
 
     # lado derecho del sistema (extremos en 0 por condicion natural)
     d = [0.0]*n
     for i in range(1, n-1):
         d[i] = 6.0 * ((yv[i+1]-yv[i]) / h[i] - (yv[i]-yv[i-1]) / h[i-1])
 
-    # paso 2: resolver A*M = d con resolucion tridiagonal paso a paso
-    # eliminacion hacia adelante
-    for i in range(1, n):
-        w = a[i] / b[i-1]
-        b[i] -= w * c[i-1]
-        d[i] -= w * d[i-1]
-    # sustitucion hacia atras
-    M = [0.0]*n
-    M[-1] = d[-1] / b[-1]
-    for i in range(n-2, -1, -1):
-        M[i] = (d[i] - c[i]*M[i+1]) / b[i]
+    # paso 2: resolver A*M = d con el algoritmo de Thomas
+    M = resolver_tridiagonal(a, b, c, d)
 
     # paso 3: extrapolacion lineal si x esta fuera del rango
     if x < xv[0]:
@@ -1,5 +1,7 @@
 # Modulo de Localizacion de Raices
 
+import sys
+
 def calcular_error(valor_nuevo, valor_anterior, tipo='absoluto'):
     if tipo == 'absoluto':
         return abs(valor_nuevo - valor_anterior)
@@ -144,3 +146,60 @@ def secante(f, x0, x1, tolerancia=1e-5, tipo_error='absoluto', max_iter=100):
         x0, x1 = x1, x_nuevo
     
     return x1, f(x1), error
+
+def brent(f, a, b, tolerancia=1e-5, max_iter=100):
+    # Combina interpolacion cuadratica inversa, secante y biseccion manteniendo
+    # siempre un intervalo [b, c] con cambio de signo. Retorna la raiz, f en la
+    # raiz, la cota del error (mitad del intervalo) y las evaluaciones de f
+    fa = f(a)
+    fb = f(b)
+    evaluaciones = 2
+    if fa * fb > 0:
+        raise ValueError("No hay cambio de signo en el intervalo")
+    
+    c, fc = b, fb
+    d = e = b - a
+    error = abs(b - a) / 2
+    
+    for _ in range(max_iter):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        
+        tolerancia_actual = 2 * sys.float_info.epsilon * abs(b) + tolerancia / 2
+        medio = (c - b) / 2
+        error = abs(medio)
+        if error <= tolerancia_actual or fb == 0:
+            return b, fb, error, evaluaciones
+        
+        if abs(e) >= tolerancia_actual and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secante
+                p = 2 * medio * s
+                q = 1 - s
+            else:
+                # Interpolacion cuadratica inversa
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * medio * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * medio * q - abs(tolerancia_actual * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = medio
+        else:
+            d = e = medio
+        
+        a, fa = b, fb
+        b += d if abs(d) > tolerancia_actual else (tolerancia_actual if medio > 0 else -tolerancia_actual)
+        fb = f(b)
+        evaluaciones += 1
+    
+    return b, fb, error, evaluaciones
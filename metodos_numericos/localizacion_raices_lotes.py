@@ -0,0 +1,134 @@
+# Modulo de Localizacion de Raices por Lotes
+
+import numpy as np
+
+# Versiones por lotes de biseccion, regula_falsi y secante (ver
+# localizacion_raices): resuelven muchos problemas a la vez con la misma f.
+# f recibe un arreglo de x y los arreglos de parametros args (uno por
+# problema) y se evalua solo sobre los problemas que aun no convergieron.
+# Retornan arreglos (raices, residuos, iteraciones) con la forma de los datos.
+
+def calcular_error_lotes(valor_nuevo, valor_anterior, tipo='absoluto'):
+    diferencia = np.abs(valor_nuevo - valor_anterior)
+    if tipo == 'absoluto':
+        return diferencia
+    with np.errstate(divide='ignore', invalid='ignore'):
+        error = np.where(valor_nuevo != 0, diferencia / np.abs(valor_nuevo), np.inf)
+    if tipo == 'porcentual':
+        error = error * 100
+    return error
+
+def _preparar_lotes(valores, args):
+    arreglos = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in valores],
+                                   *[np.asarray(p) for p in args])
+    forma = arreglos[0].shape
+    planos = [np.array(v).ravel() for v in arreglos]
+    return forma, planos[:len(valores)], planos[len(valores):]
+
+def _evaluar_lotes(f, x, args):
+    return np.broadcast_to(np.asarray(f(x, *args), dtype=float), x.shape)
+
+def _retirar_lotes(terminados, activos, estado, args):
+    quedan = ~terminados
+    return activos[quedan], [v[quedan] for v in estado], [p[quedan] for p in args]
+
+def _intervalos_lotes(f, a, b, tolerancia, tipo_error, max_iter, args, punto):
+    if max_iter < 1:
+        raise ValueError("max_iter debe ser al menos 1")
+    forma, (a, b), args = _preparar_lotes((a, b), args)
+    fa = _evaluar_lotes(f, a, args)
+    fb = _evaluar_lotes(f, b, args)
+    
+    raices = np.empty(a.size)
+    residuos = np.empty(a.size)
+    iteraciones = np.full(a.size, max_iter, dtype=np.int64)
+    activos = np.arange(a.size)
+    
+    # Los intervalos sin cambio de signo terminan con raiz y residuo nan sin iterar
+    sin_cambio = ~(fa * fb < 0)
+    if np.any(sin_cambio):
+        raices[sin_cambio] = np.nan
+        residuos[sin_cambio] = np.nan
+        iteraciones[sin_cambio] = 0
+        activos, (a, b, fa, fb), args = _retirar_lotes(sin_cambio, activos, (a, b, fa, fb), args)
+    c = fc = c_viejo = np.full(a.size, np.nan)
+    
+    for iteracion in range(1, max_iter + 1):
+        if not len(activos):
+            break
+        c = punto(a, b, fa, fb)
+        fc = _evaluar_lotes(f, c, args)
+        
+        if iteracion > 1:
+            convergidos = calcular_error_lotes(c, c_viejo, tipo_error) <= tolerancia
+            if np.any(convergidos):
+                indices = activos[convergidos]
+                raices[indices] = c[convergidos]
+                residuos[indices] = fc[convergidos]
+                iteraciones[indices] = iteracion
+                activos, (a, b, fa, fb, c, fc), args = _retirar_lotes(
+                    convergidos, activos, (a, b, fa, fb, c, fc), args)
+                if not len(activos):
+                    break
+        
+        izquierda = fa * fc < 0
+        b = np.where(izquierda, c, b)
+        fb = np.where(izquierda, fc, fb)
+        a = np.where(izquierda, a, c)
+        fa = np.where(izquierda, fa, fc)
+        c_viejo = c
+    
+    raices[activos] = c
+    residuos[activos] = fc
+    return raices.reshape(forma), residuos.reshape(forma), iteraciones.reshape(forma)
+
+def biseccion_lotes(f, a, b, tolerancia=1e-5, tipo_error='absoluto', max_iter=100, args=()):
+    return _intervalos_lotes(f, a, b, tolerancia, tipo_error, max_iter, args,
+                             lambda a, b, fa, fb: (a + b) / 2)
+
+def regula_falsi_lotes(f, a, b, tolerancia=1e-5, tipo_error='absoluto', max_iter=100, args=()):
+    return _intervalos_lotes(f, a, b, tolerancia, tipo_error, max_iter, args,
+                             lambda a, b, fa, fb: (a * fb - b * fa) / (fb - fa))
+
+def secante_lotes(f, x0, x1, tolerancia=1e-5, tipo_error='absoluto', max_iter=100, args=()):
+    # Los problemas con f(x1) - f(x0) casi nulo terminan con raiz y residuo nan
+    forma, (x0, x1), args = _preparar_lotes((x0, x1), args)
+    fx0 = _evaluar_lotes(f, x0, args)
+    fx1 = _evaluar_lotes(f, x1, args)
+    
+    raices = np.empty(x0.size)
+    residuos = np.empty(x0.size)
+    iteraciones = np.full(x0.size, max_iter, dtype=np.int64)
+    activos = np.arange(x0.size)
+    
+    for i in range(max_iter):
+        fallidos = np.abs(fx1 - fx0) < 1e-12
+        if np.any(fallidos):
+            indices = activos[fallidos]
+            raices[indices] = np.nan
+            residuos[indices] = np.nan
+            iteraciones[indices] = i
+            activos, (x0, x1, fx0, fx1), args = _retirar_lotes(
+                fallidos, activos, (x0, x1, fx0, fx1), args)
+            if not len(activos):
+                break
+        
+        x_nuevo = x1 - fx1 * (x1 - x0) / (fx1 - fx0)
+        f_nuevo = _evaluar_lotes(f, x_nuevo, args)
+        x0, fx0, x1, fx1 = x1, fx1, x_nuevo, f_nuevo
+        
+        if i > 0:
+            convergidos = calcular_error_lotes(x1, x0, tipo_error) <= tolerancia
+            if np.any(convergidos):
+                indices = activos[convergidos]
+                raices[indices] = x1[convergidos]
+                residuos[indices] = fx1[convergidos]
+                iteraciones[indices] = i + 1
+                activos, (x0, x1, fx0, fx1), args = _retirar_lotes(
+                    convergidos, activos, (x0, x1, fx0, fx1), args)
+                if not len(activos):
+                    break
+    
+    raices[activos] = x1
+    residuos[activos] = fx1
+    return raices.reshape(forma), residuos.reshape(forma), iteraciones.reshape(forma)
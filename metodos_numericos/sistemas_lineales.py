@@ -1,45 +1,1166 @@
 # Modulo de Sistemas Lineales
 
-def eliminacion_gaussiana(A, b):
-    """Eliminacion gaussiana con pivoteo parcial"""
-    n = len(A)
-    
-    # Copiar matrices para no modificar originales
-    A_copy = [fila[:] for fila in A]
-    b_copy = b[:]
-    
-    # Eliminacion hacia adelante
+import mmap
+import multiprocessing
+import os
+import threading
+import warnings
+import weakref
+import zlib
+from collections import OrderedDict
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+
+import numpy as np
+
+# A partir de este orden las listas se resuelven con el nucleo vectorizado
+UMBRAL_VECTORIZADO = 32
+
+# Datos derivados de una matriz (coloreo, etc.) cacheados por identidad
+_CACHE_MATRICES = OrderedDict()
+_TAMANO_CACHE = 32
+_CLAVES_POR_MATRIZ = 8
+
+
+def _huella(A, valores):
+    """Resumen (forma, crc32) de A para detectar modificaciones in situ.
+
+    Con valores=False solo se resume el patron de no nulos. Los ndarrays
+    se recorren por bloques de filas, asi que un np.memmap no se carga
+    entero en memoria.
+    """
+    if isinstance(A, MatrizCSR):
+        partes = [A.indices, A.punteros] + ([A.valores] if valores else [])
+        forma = A.forma
+    elif not isinstance(A, np.ndarray):
+        return None
+    else:
+        A = np.asarray(A)
+        forma = A.shape
+        filas = max(1, BYTES_BLOQUE_DISCO // max(A[:1].nbytes, 1))
+        partes = (A[i:i + filas] if valores else A[i:i + filas] != 0
+                  for i in range(0, len(A), filas))
+    crc = 0
+    for parte in partes:
+        crc = zlib.crc32(np.ascontiguousarray(parte), crc)
+    return forma, crc
+
+
+def _memorizar(A, clave, calcular, valores=False):
+    """Devuelve calcular(A) cacheado por la identidad de A.
+
+    Cada entrada guarda una huella de A (solo el patron, o tambien los
+    valores con valores=True) y se recalcula si A se modifico in situ.
+    Solo se cachean objetos que admiten weakref, que salen de la cache al
+    liberarse; las listas se recalculan en cada llamada. Cada matriz
+    guarda a lo sumo _CLAVES_POR_MATRIZ claves.
+    """
+    try:
+        ref = weakref.ref(A)
+    except TypeError:
+        return calcular(A)
+
+    entrada = _CACHE_MATRICES.get(id(A))
+    if entrada is None or entrada[0]() is not A:
+        ref = weakref.ref(A, lambda _, k=id(A): _CACHE_MATRICES.pop(k, None))
+        entrada = (ref, OrderedDict())
+        _CACHE_MATRICES[id(A)] = entrada
+        if len(_CACHE_MATRICES) > _TAMANO_CACHE:
+            _CACHE_MATRICES.popitem(last=False)
+    else:
+        _CACHE_MATRICES.move_to_end(id(A))
+
+    datos = entrada[1]
+    huella = _huella(A, valores)
+    if clave in datos and datos[clave][0] == huella:
+        datos.move_to_end(clave)
+        return datos[clave][1]
+    datos[clave] = (huella, calcular(A))
+    datos.move_to_end(clave)
+    if len(datos) > _CLAVES_POR_MATRIZ:
+        datos.popitem(last=False)
+    return datos[clave][1]
+
+
+def _factorizar_lu_np(A, dtype=None):
+    """Nucleo vectorizado de la factorizacion LU con pivoteo parcial.
+
+    Cada paso de pivoteo actualiza toda la submatriz restante con una
+    sola operacion de rango 1. Devuelve (LU, perm) como ndarrays.
+    dtype fija la precision de la factorizacion (por defecto la de A, al
+    menos float64).
+    """
+    A = np.asarray(A)
+    LU = A.astype(np.result_type(A.dtype, float) if dtype is None else dtype)
+    n = LU.shape[0]
+    perm = np.arange(n)
+
     for k in range(n):
         # Pivoteo parcial
-        max_fila = k
-        for i in range(k+1, n):
-            if abs(A_copy[i][k]) > abs(A_copy[max_fila][k]):
-                max_fila = i
-        
-        # Intercambiar filas
-        A_copy[k], A_copy[max_fila] = A_copy[max_fila], A_copy[k]
-        b_copy[k], b_copy[max_fila] = b_copy[max_fila], b_copy[k]
-        
-        # Eliminacion
-        for i in range(k+1, n):
-            if A_copy[k][k] != 0:
-                factor = A_copy[i][k] / A_copy[k][k]
-                for j in range(k, n):
-                    A_copy[i][j] -= factor * A_copy[k][j]
-                b_copy[i] -= factor * b_copy[k]
-    
-    # Sustitucion hacia atras
-    x = [0] * n
+        max_fila = k + int(np.argmax(np.abs(LU[k:, k])))
+        if max_fila != k:
+            LU[[k, max_fila]] = LU[[max_fila, k]]
+            perm[[k, max_fila]] = perm[[max_fila, k]]
+
+        # Eliminacion de rango 1 sobre la submatriz restante
+        if LU[k, k] != 0:
+            LU[k+1:, k] /= LU[k, k]
+            LU[k+1:, k+1:] -= np.outer(LU[k+1:, k], LU[k, k+1:])
+
+    return LU, perm
+
+
+class FactorizacionLU:
+    """Factorizacion LU con pivoteo parcial (PA = LU) reutilizable
+
+    La factorizacion se calcula una sola vez en O(n^3) y cada llamada a
+    resolver cuesta O(n^2). Los multiplicadores de L se guardan debajo de
+    la diagonal de U y la permutacion de filas en perm.
+
+    Si A es un ndarray, o una lista de orden >= UMBRAL_VECTORIZADO, se usa
+    el nucleo vectorizado de NumPy. El resultado de resolver es un ndarray
+    si b lo es y una lista en otro caso.
+
+    dtype (por ejemplo np.float32) fuerza el nucleo vectorizado y guarda
+    los factores en esa precision; las sustituciones se hacen en la
+    precision mayor entre la de los factores y la de b.
+
+    determinante, factor_crecimiento y estimar_condicion diagnostican el
+    sistema con O(n^2) operaciones extra sobre los factores.
+    """
+
+    def __init__(self, A, dtype=None):
+        n = len(A)
+        self.n = n
+        self.vectorizado = (isinstance(A, np.ndarray) or n >= UMBRAL_VECTORIZADO
+                            or dtype is not None)
+        # Normas de A para factor_crecimiento y estimar_condicion
+        if self.vectorizado:
+            absolutos = np.abs(np.asarray(A, dtype=float)).reshape(n, n)
+            self.norma_1 = float(absolutos.sum(axis=0).max(initial=0.0))
+            self.maximo = float(absolutos.max(initial=0.0))
+            self.LU, self.perm = _factorizar_lu_np(A, dtype)
+            return
+
+        self.norma_1 = max((sum(abs(fila[j]) for fila in A) for j in range(n)), default=0.0)
+        self.maximo = max((abs(a) for fila in A for a in fila), default=0.0)
+
+        LU = [fila[:] for fila in A]
+        perm = list(range(n))
+
+        for k in range(n):
+            # Pivoteo parcial
+            max_fila = k
+            for i in range(k+1, n):
+                if abs(LU[i][k]) > abs(LU[max_fila][k]):
+                    max_fila = i
+
+            # Intercambiar filas (los multiplicadores viajan con la fila)
+            LU[k], LU[max_fila] = LU[max_fila], LU[k]
+            perm[k], perm[max_fila] = perm[max_fila], perm[k]
+
+            # Eliminacion guardando el factor en la posicion anulada
+            if LU[k][k] != 0:
+                fila_k = LU[k]
+                for i in range(k+1, n):
+                    fila_i = LU[i]
+                    factor = fila_i[k] / fila_k[k]
+                    fila_i[k] = factor
+                    for j in range(k+1, n):
+                        fila_i[j] -= factor * fila_k[j]
+
+        self.LU = LU
+        self.perm = perm
+
+    def resolver(self, b):
+        """Resuelve Ax = b para un vector b o una matriz B (n x m) de lados derechos"""
+        if self.vectorizado:
+            x = self._resolver_np(np.asarray(b))
+            return x if isinstance(b, np.ndarray) else x.tolist()
+        if isinstance(b, np.ndarray):
+            return np.array(self.resolver(b.tolist()))
+        if len(b) > 0 and isinstance(b[0], (list, tuple)):
+            m = len(b[0])
+            columnas = [self._resolver_vector([fila[c] for fila in b]) for c in range(m)]
+            return [[columnas[c][i] for c in range(m)] for i in range(self.n)]
+        return self._resolver_vector(b)
+
+    def _resolver_vector(self, b):
+        n = self.n
+        LU = self.LU
+
+        # Sustitucion hacia adelante (Ly = Pb)
+        x = [b[p] for p in self.perm]
+        for k in range(n):
+            for i in range(k+1, n):
+                x[i] -= LU[i][k] * x[k]
+
+        # Sustitucion hacia atras (Ux = y)
+        for i in range(n-1, -1, -1):
+            for j in range(i+1, n):
+                x[i] -= LU[i][j] * x[j]
+            x[i] /= LU[i][i]
+
+        return x
+
+    def _resolver_np(self, b):
+        LU = self.LU
+        if np.any(np.diag(LU) == 0):
+            raise ZeroDivisionError("La matriz es singular")
+
+        # Sustitucion hacia adelante (Ly = Pb), b puede ser (n,) o (n, m)
+        x = np.array(b[self.perm], dtype=np.result_type(LU.dtype, b.dtype))
+        for i in range(1, self.n):
+            x[i] -= LU[i, :i] @ x[:i]
+
+        # Sustitucion hacia atras (Ux = y)
+        for i in range(self.n-1, -1, -1):
+            x[i] -= LU[i, i+1:] @ x[i+1:]
+            x[i] /= LU[i, i]
+
+        return x
+
+    def _factores_np(self):
+        return self.LU if self.vectorizado else np.array(self.LU, dtype=float)
+
+    def resolver_transpuesta(self, b):
+        """Resuelve A^T x = b con los mismos factores (A^T = U^T L^T P)"""
+        LU = self._factores_np()
+        if np.any(np.diag(LU) == 0):
+            raise ZeroDivisionError("La matriz es singular")
+        b_arr = np.asarray(b)
+        x = np.array(b_arr, dtype=np.result_type(LU.dtype, b_arr.dtype, float))
+
+        # Sustitucion hacia adelante con U^T
+        for i in range(self.n):
+            x[i] -= LU[:i, i] @ x[:i]
+            x[i] /= LU[i, i]
+
+        # Sustitucion hacia atras con L^T (diagonal unitaria)
+        for i in range(self.n-2, -1, -1):
+            x[i] -= LU[i+1:, i] @ x[i+1:]
+
+        # Deshacer la permutacion: P x_final = x
+        y = np.empty_like(x)
+        y[np.asarray(self.perm)] = x
+        return y if isinstance(b, np.ndarray) else y.tolist()
+
+    def determinante(self, logaritmo=False):
+        """Determinante de A a partir de la diagonal de U y la paridad de perm.
+
+        Con logaritmo=True retorna (signo, log|det|), que no desborda en
+        matrices grandes (como np.linalg.slogdet).
+        """
+        diagonal = np.diag(self._factores_np()).astype(float)
+
+        # Paridad de la permutacion: (-1)^(n - ciclos)
+        perm = list(self.perm)
+        visitados = [False] * self.n
+        ciclos = 0
+        for i in range(self.n):
+            if not visitados[i]:
+                ciclos += 1
+                j = i
+                while not visitados[j]:
+                    visitados[j] = True
+                    j = perm[j]
+        signo = (-1.0) ** (self.n - ciclos) * float(np.prod(np.sign(diagonal)))
+
+        if logaritmo:
+            with np.errstate(divide='ignore'):
+                return signo, float(np.log(np.abs(diagonal)).sum())
+        return signo * float(np.prod(np.abs(diagonal)))
+
+    def factor_crecimiento(self):
+        """Crecimiento de pivotes max|u_ij| / max|a_ij|.
+
+        Valores grandes (del orden de 1/eps) indican que la eliminacion
+        perdio exactitud aunque la matriz este bien condicionada.
+        """
+        maximo_U = float(np.abs(np.triu(self._factores_np())).max(initial=0.0))
+        return maximo_U / self.maximo if self.maximo > 0 else 1.0
+
+    def estimar_condicion(self, max_iter=5):
+        """Estimacion del numero de condicion en norma 1, ||A||_1 ||A^-1||_1.
+
+        Metodo de Hager con la mejora de Higham (el de LAPACK xGECON): busca
+        el vector que maximiza ||A^-1 x||_1 con unas pocas resoluciones con
+        A y A^T, O(n^2) cada una. Suele acertar el orden de magnitud y, salvo
+        redondeo, es una cota inferior. Retorna inf si hay un pivote nulo.
+        """
+        n = self.n
+        if n == 0:
+            return 0.0
+        if np.any(np.diag(self._factores_np()) == 0):
+            return float('inf')
+
+        x = np.full(n, 1.0 / n)
+        estimacion = 0.0
+        for iteracion in range(max_iter):
+            y = self.resolver(x)
+            nueva = float(np.abs(y).sum())
+            if iteracion > 0 and nueva <= estimacion:
+                break
+            estimacion = nueva
+            z = self.resolver_transpuesta(np.where(y >= 0, 1.0, -1.0))
+            j = int(np.argmax(np.abs(z)))
+            if iteracion > 0 and abs(z[j]) <= z @ x:
+                break
+            x = np.zeros(n)
+            x[j] = 1.0
+
+        # Vector alternativo de Higham para matrices donde Hager falla
+        alternativo = (-1.0) ** np.arange(n) * (1 + np.arange(n) / max(n - 1, 1))
+        estimacion = max(estimacion, 2 * float(np.abs(self.resolver(alternativo)).sum()) / (3 * n))
+        return self.norma_1 * estimacion
+
+
+def _refinamiento_mixto(A, b, max_refinamientos):
+    """Factoriza en float32 y refina x con residuos en float64.
+
+    Cada paso resuelve A d = r con los factores de simple precision y
+    suma la correccion. Se detiene cuando el residuo cumple el criterio de
+    LAPACK (dsgesv): ||r|| <= ||A|| ||x|| eps sqrt(n). Retorna
+    (x, refinamientos, convergido); no converge si la correccion deja de
+    reducirse a la mitad, o si la factorizacion en float32 falla.
+    """
+    n = A.shape[0]
+    umbral = np.abs(A).sum(axis=1).max(initial=0.0) * np.finfo(float).eps * n ** 0.5
+    try:
+        lu = FactorizacionLU(A, dtype=np.float32)
+        x = lu.resolver(b)
+    except ZeroDivisionError:
+        return None, 0, False
+    norma_anterior = np.inf
+
+    for paso in range(max_refinamientos + 1):
+        if not np.all(np.isfinite(x)):
+            return x, paso, False
+        r = b - A @ x
+        if np.abs(r).max(initial=0.0) <= umbral * np.abs(x).max(initial=0.0):
+            return x, paso, True
+        if paso == max_refinamientos:
+            break
+        d = lu.resolver(r)
+        norma = np.abs(d).max(initial=0.0)
+        # Refinamiento estancado: A esta mal condicionada para float32
+        if norma > 0.5 * norma_anterior:
+            return x, paso, False
+        x += d
+        norma_anterior = norma
+
+    return x, max_refinamientos, False
+
+
+def eliminacion_gaussiana(A, b, precision='doble', devolver_info=False,
+                          max_refinamientos=30):
+    """Eliminacion gaussiana con pivoteo parcial
+
+    precision: 'doble' factoriza en float64; 'mixta' factoriza en float32
+    (la mitad de memoria y mas rapido) y aplica refinamiento iterativo con
+    residuos en float64 hasta la exactitud de doble precision. Si el
+    refinamiento se estanca (A mal condicionada) se refactoriza en float64.
+    devolver_info: si es True retorna (x, info) con 'precision' usada al
+    final, 'refinamientos' aplicados y 'respaldo' (True si hubo que
+    refactorizar en float64).
+    """
+    if precision == 'doble':
+        x = FactorizacionLU(A).resolver(b)
+        if devolver_info:
+            return x, {'precision': 'doble', 'refinamientos': 0, 'respaldo': False}
+        return x
+    if precision != 'mixta':
+        raise ValueError("precision debe ser 'doble' o 'mixta'")
+
+    A64 = np.asarray(A, dtype=float)
+    b64 = np.asarray(b, dtype=float)
+    x, refinamientos, convergido = _refinamiento_mixto(A64, b64, max_refinamientos)
+    if not convergido:
+        x = FactorizacionLU(A64).resolver(b64)
+    if not isinstance(b, np.ndarray):
+        x = x.tolist()
+
+    if devolver_info:
+        return x, {'precision': 'mixta' if convergido else 'doble',
+                   'refinamientos': refinamientos, 'respaldo': not convergido}
+    return x
+
+def _factorizar_lu_lotes(A):
+    """Factorizacion LU con pivoteo parcial de una pila (k, n, n) de matrices.
+
+    Todas las matrices se eliminan a la vez, un pivote por paso. Devuelve
+    (LU, perm, validos) donde validos marca las matrices sin pivote nulo.
+    """
+    A = np.asarray(A)
+    LU = A.astype(np.result_type(A.dtype, float))
+    k, n, _ = LU.shape
+    perm = np.tile(np.arange(n), (k, 1))
+    validos = np.ones(k, dtype=bool)
+    sistemas = np.arange(k)
+    # Pivotes por debajo de eps * n * max|A| se consideran nulos
+    umbral = np.finfo(LU.dtype).eps * n * (np.abs(LU).max(axis=(1, 2)) if n else np.zeros(k))
+
+    for c in range(n):
+        # Pivoteo parcial independiente en cada sistema
+        max_fila = c + np.argmax(np.abs(LU[:, c:, c]), axis=1)
+        fila_c = LU[sistemas, c].copy()
+        LU[sistemas, c] = LU[sistemas, max_fila]
+        LU[sistemas, max_fila] = fila_c
+        p_c = perm[sistemas, c].copy()
+        perm[sistemas, c] = perm[sistemas, max_fila]
+        perm[sistemas, max_fila] = p_c
+
+        # Un pivote (numericamente) nulo marca el sistema como singular sin cortar el lote
+        pivote = LU[:, c, c]
+        singular = ~(np.abs(pivote) > umbral)
+        validos &= ~singular
+        pivote = np.where(singular, 1.0, pivote)
+
+        LU[:, c+1:, c] /= pivote[:, None]
+        LU[:, c+1:, c+1:] -= LU[:, c+1:, c, None] * LU[:, c, None, c+1:]
+
+    return LU, perm, validos
+
+
+def _resolver_lu_lotes(LU, perm, b):
+    """Sustitucion hacia adelante y hacia atras para una pila de factorizaciones"""
+    n = LU.shape[1]
+    x = np.take_along_axis(np.asarray(b, dtype=LU.dtype), perm, axis=1)
+
+    for i in range(1, n):
+        x[:, i] -= np.einsum('kj,kj->k', LU[:, i, :i], x[:, :i])
+
     for i in range(n-1, -1, -1):
-        x[i] = b_copy[i]
-        for j in range(i+1, n):
-            x[i] -= A_copy[i][j] * x[j]
-        x[i] /= A_copy[i][i]
-    
+        x[:, i] -= np.einsum('kj,kj->k', LU[:, i, i+1:], x[:, i+1:])
+        x[:, i] /= LU[:, i, i]
+
     return x
 
-def jacobi(A, b, x0=None, tolerancia=1e-5, max_iter=100):
-    """Metodo de Jacobi para sistemas lineales"""
+
+def eliminacion_gaussiana_lotes(A, b):
+    """Resuelve k sistemas densos independientes A[s] x[s] = b[s] a la vez.
+
+    A tiene forma (k, n, n) y b forma (k, n). La eliminacion con pivoteo
+    parcial se aplica a todos los sistemas en cada paso, evitando el costo
+    por llamada de eliminacion_gaussiana en sistemas chicos.
+
+    Retorna (x, validos): x de forma (k, n) y una mascara booleana de
+    longitud k. Los sistemas singulares (algun pivote con modulo menor que
+    eps * n * max|A[s]|) quedan con validos[s] = False y x[s] lleno de NaN
+    en lugar de lanzar una excepcion.
+    """
+    LU, perm, validos = _factorizar_lu_lotes(A)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x = _resolver_lu_lotes(LU, perm, b)
+    x[~validos] = np.nan
+    return x, validos
+
+
+# Columnas por panel en las factorizaciones simetricas empaquetadas
+_BLOQUE_SIMETRICO = 32
+
+
+def _desplazamientos(n):
+    """Inicio de cada fila en el almacenamiento triangular inferior empaquetado"""
+    i = np.arange(n + 1, dtype=np.int64)
+    return i * (i + 1) // 2
+
+
+def _orden_empaquetado(m):
+    n = int(round(((8 * m + 1) ** 0.5 - 1) / 2))
+    if n * (n + 1) // 2 != m:
+        raise ValueError("la longitud no corresponde a una matriz triangular empaquetada")
+    return n
+
+
+def empaquetar_simetrica(A):
+    """Triangulo inferior de A guardado por filas en un arreglo 1D.
+
+    El elemento (i, j) con j <= i queda en la posicion i(i+1)/2 + j, de
+    modo que una matriz simetrica ocupa n(n+1)/2 valores en lugar de n^2.
+    """
+    A = np.asarray(A, dtype=float)
+    filas, columnas = np.tril_indices(A.shape[0])
+    return A[filas, columnas]
+
+
+def desempaquetar_simetrica(P):
+    """Matriz simetrica densa a partir de su triangulo inferior empaquetado"""
+    P = np.asarray(P, dtype=float)
+    n = _orden_empaquetado(len(P))
+    A = np.zeros((n, n))
+    A[np.tril_indices(n)] = P
+    return A + np.tril(A, -1).T
+
+
+def _factorizar_simetrica(P, n, raiz, bloque=_BLOQUE_SIMETRICO):
+    """Cholesky (raiz=True) o LDL^T (raiz=False) en el lugar sobre P empaquetada.
+
+    Variante por paneles hacia la derecha: las columnas k0:k1 se copian a
+    un panel denso, se eliminan con actualizaciones de rango 1 y luego cada
+    fila restante se actualiza con un solo producto. Con raiz=True P queda
+    con L (diagonal incluida); con raiz=False con L unitaria debajo de la
+    diagonal y D en la diagonal.
+
+    Retorna k, la cantidad de columnas factorizadas. Si k < n el pivote k
+    no sirve (no positivo en Cholesky, nulo en LDL^T): las columnas :k de
+    P ya tienen L y las filas y columnas k: conservan el complemento de
+    Schur actualizado hasta la columna k0 del panel; el resto del panel se
+    devuelve en Lp (filas k:, columnas k0:k) para completar ese
+    complemento.
+    """
+    desplazamiento = _desplazamientos(n)
+    for k0 in range(0, n, bloque):
+        k1 = min(n, k0 + bloque)
+        ancho = k1 - k0
+        filas = np.arange(k0, n)
+        columnas = np.arange(k0, k1)
+        inferior = filas[:, None] >= columnas
+        posiciones = np.where(inferior, desplazamiento[filas][:, None] + columnas, 0)
+        W = P[posiciones]
+
+        for c in range(ancho):
+            d = W[c, c]
+            if not (d > 0 if raiz else d != 0):
+                fallo = inferior[:, :c]
+                P[posiciones[:, :c][fallo]] = W[:, :c][fallo]
+                return k0 + c, W[c:, :c]
+            if raiz:
+                W[c, c] = d = d ** 0.5
+                W[c+1:, c] /= d
+                W[c+1:, c+1:] -= np.outer(W[c+1:, c], W[c+1:ancho, c])
+            else:
+                v = W[c+1:ancho, c].copy()
+                W[c+1:, c] /= d
+                W[c+1:, c+1:] -= np.outer(W[c+1:, c], v)
+
+        P[posiciones[inferior]] = W[inferior]
+
+        # Actualizacion de las filas restantes: A[i, k1:i+1] -= L[i] D L[k1:i+1]^T
+        V = W[ancho:]
+        U = V if raiz else V * np.diag(W)[:ancho]
+        for r, i in enumerate(range(k1, n)):
+            P[desplazamiento[i] + k1:desplazamiento[i] + i + 1] -= V[:r+1] @ U[r]
+
+    return n, None
+
+
+class FactorizacionCholesky:
+    """Factorizacion de Cholesky (A = L L^T) en almacenamiento empaquetado
+
+    A es simetrica definida positiva, densa (solo se lee el triangulo
+    inferior) o ya empaquetada con empaquetar_simetrica. Se guardan
+    n(n+1)/2 valores y se hace la mitad de operaciones que FactorizacionLU.
+
+    Si aparece un pivote no positivo en la columna k (A no es definida
+    positiva) no se descarta lo hecho: las k columnas de L se conservan y
+    el complemento de Schur restante se factoriza con FactorizacionLU.
+    completa indica si la factorizacion de Cholesky termino.
+    """
+
+    raiz = True
+
+    def __init__(self, A):
+        P = np.asarray(A, dtype=float)
+        if P.ndim == 1:
+            P = P.copy()
+            n = _orden_empaquetado(len(P))
+        else:
+            n = P.shape[0]
+            P = empaquetar_simetrica(P)
+        self.n = n
+        self.P = P
+        self.desplazamiento = _desplazamientos(n)
+        self.k, Lp = _factorizar_simetrica(P, n, self.raiz)
+        self.completa = self.k == n
+        self.schur = None if self.completa else FactorizacionLU(self._complemento_schur(Lp))
+
+    def _diagonal(self):
+        return self.P[self.desplazamiento[:-1] + np.arange(self.n)]
+
+    def _complemento_schur(self, Lp):
+        """S = A22 - L21 D L21^T a partir de lo que dejo la factorizacion parcial"""
+        k = self.k
+        S = desempaquetar_simetrica(np.concatenate(
+            [self.P[self.desplazamiento[i] + k:self.desplazamiento[i] + i + 1]
+             for i in range(k, self.n)]))
+        if Lp.shape[1]:
+            k0 = k - Lp.shape[1]
+            if self.raiz:
+                S -= Lp @ Lp.T
+            else:
+                S -= (Lp * self._diagonal()[k0:k]) @ Lp.T
+        return S
+
+    def resolver(self, b):
+        """Resuelve Ax = b para un vector b o una matriz B (n x m) de lados derechos"""
+        x = np.array(b, dtype=float)
+        n, k, P, desplazamiento = self.n, self.k, self.P, self.desplazamiento
+        diagonal = self._diagonal()
+
+        # Sustitucion hacia adelante con [L11 0; L21 I]
+        for i in range(k):
+            x[i] -= P[desplazamiento[i]:desplazamiento[i] + i] @ x[:i]
+            if self.raiz:
+                x[i] /= diagonal[i]
+        for i in range(k, n):
+            x[i] -= P[desplazamiento[i]:desplazamiento[i] + k] @ x[:k]
+
+        # Bloque central: D (solo LDL^T) y el complemento de Schur
+        if not self.raiz:
+            x[:k] = (x[:k].T / diagonal[:k]).T
+        if self.schur is not None:
+            x[k:] = self.schur.resolver(x[k:])
+
+        # Sustitucion hacia atras con [L11^T L21^T; 0 I], por columnas de L^T
+        for i in range(n - 1, k - 1, -1):
+            x[:k] -= np.multiply.outer(P[desplazamiento[i]:desplazamiento[i] + k], x[i])
+        for i in range(k - 1, -1, -1):
+            if self.raiz:
+                x[i] /= diagonal[i]
+            x[:i] -= np.multiply.outer(P[desplazamiento[i]:desplazamiento[i] + i], x[i])
+
+        return x if isinstance(b, np.ndarray) else x.tolist()
+
+
+class FactorizacionLDL(FactorizacionCholesky):
+    """Factorizacion A = L D L^T sin raices en almacenamiento empaquetado
+
+    Sirve tambien para matrices simetricas indefinidas cuyos pivotes no se
+    anulan (no hay pivoteo). Un pivote nulo se trata como en
+    FactorizacionCholesky: se sigue con LU sobre el complemento de Schur.
+    """
+
+    raiz = False
+
+
+def cholesky(A, b):
+    """Metodo de Cholesky para A simetrica definida positiva (ver FactorizacionCholesky)"""
+    return FactorizacionCholesky(A).resolver(b)
+
+
+def ldlt(A, b):
+    """Factorizacion LDL^T para A simetrica (ver FactorizacionLDL)"""
+    return FactorizacionLDL(A).resolver(b)
+
+
+def es_spd_probable(A, tolerancia=1e-10):
+    """Prueba barata de que A sea simetrica definida positiva.
+
+    Comprueba la simetria, que la diagonal sea positiva y que cada menor
+    principal 2x2 lo sea (|a_ij| <= sqrt(a_ii a_jj)). Cuesta O(n^2), u
+    O(nnz) para MatrizCSR, frente a O(n^3) de factorizar. Si retorna False
+    A no es SPD; si retorna True probablemente lo es (Cholesky lo confirma).
+    Un arreglo 1D se toma como triangulo inferior empaquetado.
+    """
+    if isinstance(A, MatrizCSR):
+        if A.forma[0] != A.forma[1]:
+            return False
+        T = A.transpuesta()
+        if (not np.array_equal(A.punteros, T.punteros)
+                or not np.array_equal(A.indices, T.indices)
+                or not np.allclose(A.valores, T.valores, rtol=tolerancia, atol=0)):
+            return False
+        filas = np.repeat(np.arange(A.forma[0]), np.diff(A.punteros))
+        columnas, valores = A.indices, A.valores
+        diagonal = A.diagonal()
+    else:
+        A = np.asarray(A, dtype=float)
+        if A.ndim == 1:
+            n = _orden_empaquetado(len(A))
+            filas, columnas = np.tril_indices(n)
+            valores = A
+            diagonal = A[_desplazamientos(n)[:-1] + np.arange(n)]
+        else:
+            if A.ndim != 2 or A.shape[0] != A.shape[1]:
+                return False
+            if not np.allclose(A, A.T, rtol=tolerancia, atol=0):
+                return False
+            filas, columnas = np.tril_indices(A.shape[0])
+            valores = A[filas, columnas]
+            diagonal = np.diag(A)
+
+    if not np.all(diagonal > 0):
+        return False
+    return bool(np.all(np.abs(valores) <= (1 + tolerancia) * np.sqrt(diagonal[filas] * diagonal[columnas])))
+
+
+def factorizar(A):
+    """Elige la factorizacion segun A: Cholesky si es_spd_probable(A), LU en otro caso"""
+    if es_spd_probable(A):
+        return FactorizacionCholesky(A)
+    if isinstance(A, np.ndarray) and A.ndim == 1:
+        return FactorizacionLDL(A)
+    return FactorizacionLU(A)
+
+class MatrizCSR:
+    """Matriz dispersa en formato CSR (filas comprimidas)
+
+    Los no nulos de la fila i son valores[punteros[i]:punteros[i+1]] y sus
+    columnas indices[punteros[i]:punteros[i+1]], ordenadas en forma
+    creciente. Un barrido sobre la matriz cuesta O(nnz) en lugar de O(n^2).
+    """
+
+    def __init__(self, valores, indices, punteros, forma):
+        self.valores = np.asarray(valores, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.punteros = np.asarray(punteros, dtype=np.int64)
+        self.forma = (int(forma[0]), int(forma[1]))
+        if len(self.punteros) != self.forma[0] + 1:
+            raise ValueError("punteros debe tener longitud n_filas + 1")
+        if len(self.valores) != len(self.indices) or self.punteros[-1] != len(self.valores):
+            raise ValueError("valores, indices y punteros no son consistentes")
+
+    @classmethod
+    def desde_tripletes(cls, filas, columnas, valores, forma=None):
+        """Construye la matriz a partir de tripletes (fila, columna, valor).
+
+        Los tripletes repetidos se suman. Si no se da la forma se toma la
+        menor que contiene a todos los indices.
+        """
+        filas = np.asarray(filas, dtype=np.int64)
+        columnas = np.asarray(columnas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+        if not (len(filas) == len(columnas) == len(valores)):
+            raise ValueError("filas, columnas y valores deben tener la misma longitud")
+        if forma is None:
+            forma = (int(filas.max()) + 1 if len(filas) else 0,
+                     int(columnas.max()) + 1 if len(columnas) else 0)
+        if len(filas) and (filas.min() < 0 or filas.max() >= forma[0]
+                           or columnas.min() < 0 or columnas.max() >= forma[1]):
+            raise ValueError("hay tripletes fuera de la forma indicada")
+
+        # Ordenar por fila y luego por columna
+        orden = np.lexsort((columnas, filas))
+        filas, columnas, valores = filas[orden], columnas[orden], valores[orden]
+
+        # Sumar tripletes repetidos
+        if len(filas):
+            nuevo = np.ones(len(filas), dtype=bool)
+            nuevo[1:] = (filas[1:] != filas[:-1]) | (columnas[1:] != columnas[:-1])
+            inicios = np.flatnonzero(nuevo)
+            valores = np.add.reduceat(valores, inicios)
+            filas, columnas = filas[inicios], columnas[inicios]
+
+        punteros = np.zeros(forma[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(filas, minlength=forma[0]), out=punteros[1:])
+        return cls(valores, columnas, punteros, forma)
+
+    @classmethod
+    def desde_densa(cls, A):
+        """Construye la matriz a partir de una matriz densa (lista o ndarray)"""
+        A = np.asarray(A, dtype=float)
+        filas, columnas = np.nonzero(A)
+        return cls.desde_tripletes(filas, columnas, A[filas, columnas], A.shape)
+
+    @property
+    def nnz(self):
+        return len(self.valores)
+
+    def __len__(self):
+        return self.forma[0]
+
+    def diagonal(self):
+        """Devuelve la diagonal como ndarray (ceros donde no hay entrada)"""
+        n = min(self.forma)
+        d = np.zeros(n)
+        filas = np.repeat(np.arange(self.forma[0]), np.diff(self.punteros))
+        en_diagonal = filas == self.indices
+        d[filas[en_diagonal]] = self.valores[en_diagonal]
+        return d
+
+    def producto(self, x, out=None):
+        """Producto matriz-vector A @ x en O(nnz).
+
+        Con out se escribe el resultado en ese arreglo; los temporales se
+        reutilizan entre llamadas, asi que no se reserva memoria por producto.
+        """
+        if not hasattr(self, '_temporal'):
+            # Un cero extra al final permite usar reduceat con filas vacias al final
+            self._temporal = np.zeros(self.nnz + 1)
+            self._inicios = np.minimum(self.punteros[:-1], self.nnz)
+            self._vacias = np.flatnonzero(np.diff(self.punteros) == 0)
+        if out is None:
+            out = np.empty(self.forma[0])
+        if self.forma[0] == 0:
+            return out
+
+        temporal = self._temporal[:self.nnz]
+        np.take(np.asarray(x, dtype=float), self.indices, out=temporal)
+        np.multiply(temporal, self.valores, out=temporal)
+        np.add.reduceat(self._temporal, self._inicios, out=out)
+        if len(self._vacias):
+            out[self._vacias] = 0.0
+        return out
+
+    def submatriz_filas(self, filas):
+        """Devuelve la matriz formada por las filas indicadas (en ese orden)"""
+        filas = np.asarray(filas, dtype=np.int64)
+        largos = self.punteros[filas + 1] - self.punteros[filas]
+        punteros = np.zeros(len(filas) + 1, dtype=np.int64)
+        np.cumsum(largos, out=punteros[1:])
+        posiciones = (np.repeat(self.punteros[filas] - punteros[:-1], largos)
+                      + np.arange(punteros[-1]))
+        return MatrizCSR(self.valores[posiciones], self.indices[posiciones],
+                         punteros, (len(filas), self.forma[1]))
+
+    def transpuesta(self):
+        """Devuelve la matriz transpuesta en formato CSR"""
+        filas = np.repeat(np.arange(self.forma[0]), np.diff(self.punteros))
+        return MatrizCSR.desde_tripletes(self.indices, filas, self.valores,
+                                         (self.forma[1], self.forma[0]))
+
+    def sin_diagonal(self):
+        """Devuelve una copia de la matriz sin las entradas de la diagonal"""
+        filas = np.repeat(np.arange(self.forma[0]), np.diff(self.punteros))
+        fuera = filas != self.indices
+        return MatrizCSR.desde_tripletes(filas[fuera], self.indices[fuera],
+                                         self.valores[fuera], self.forma)
+
+    def a_densa(self):
+        """Devuelve la matriz como ndarray denso"""
+        A = np.zeros(self.forma)
+        filas = np.repeat(np.arange(self.forma[0]), np.diff(self.punteros))
+        A[filas, self.indices] = self.valores
+        return A
+
+    def _filas_sin_diagonal(self):
+        """Filas como listas de pares (j, a_ij) sin la diagonal, mas la diagonal"""
+        valores = self.valores.tolist()
+        indices = self.indices.tolist()
+        punteros = self.punteros.tolist()
+        filas = []
+        diagonal = [0.0] * self.forma[0]
+        for i in range(self.forma[0]):
+            fila = []
+            for k in range(punteros[i], punteros[i+1]):
+                if indices[k] == i:
+                    diagonal[i] = valores[k]
+                else:
+                    fila.append((indices[k], valores[k]))
+            filas.append(fila)
+        return filas, diagonal
+
+
+class _Control:
+    """Criterio de parada de jacobi, gauss_seidel y relajacion
+
+    criterio: 'paso' (||x_k+1 - x_k||_inf < tolerancia), 'paso_relativo'
+    (||x_k+1 - x_k||_inf <= tolerancia ||x_k+1||_inf) o 'residuo'
+    (||b - Ax||_2 <= tolerancia ||b||_2). Con intervalo = k solo se
+    controla cada k barridos. Si historial es True cada medida se guarda en
+    un arreglo preasignado de ceil(max_iter / intervalo) flotantes.
+    """
+
+    CRITERIOS = ('paso', 'paso_relativo', 'residuo')
+
+    def __init__(self, tolerancia, max_iter, criterio='paso', intervalo=1,
+                 historial=False, A=None, b=None):
+        if criterio not in self.CRITERIOS:
+            raise ValueError("criterio debe ser 'paso', 'paso_relativo' o 'residuo'")
+        if intervalo < 1:
+            raise ValueError("intervalo_control debe ser al menos 1")
+        self.tolerancia = tolerancia
+        self.criterio = criterio
+        self.intervalo = int(intervalo)
+        self.medidas = np.empty(-(-max_iter // self.intervalo)) if historial else None
+        self.controles = 0
+        self.diferencia = None
+        if criterio == 'residuo':
+            self.b = np.asarray(b, dtype=float)
+            norma_b = np.linalg.norm(self.b)
+            self.umbral = tolerancia * (norma_b if norma_b > 0 else 1.0)
+            self.producto = (lambda v: _producto_disco(A, v)) if isinstance(A, np.memmap) else _operador(A)
+
+    def toca(self, iteracion):
+        """True si el barrido iteracion (desde 0) se controla"""
+        return (iteracion + 1) % self.intervalo == 0
+
+    def usa_paso(self, iteracion):
+        """True si el control de este barrido necesita el iterado anterior"""
+        return self.criterio != 'residuo' and self.toca(iteracion)
+
+    def convergio(self, iteracion, x, x_viejo):
+        """Evalua el criterio despues del barrido iteracion (x_viejo es el iterado previo)"""
+        if not self.toca(iteracion):
+            return False
+        if self.criterio == 'residuo':
+            medida = float(np.linalg.norm(self.b - self.producto(np.asarray(x, dtype=float))))
+            convergio = medida <= self.umbral
+        else:
+            if isinstance(x, np.ndarray):
+                if self.diferencia is None or len(self.diferencia) != len(x):
+                    self.diferencia = np.empty(len(x))
+                diferencia = np.subtract(x, x_viejo, out=self.diferencia)
+                np.abs(diferencia, out=diferencia)
+            else:
+                diferencia = np.abs(np.subtract(x, x_viejo, dtype=float))
+            medida = diferencia.max() if len(diferencia) else 0.0
+            if self.criterio == 'paso':
+                convergio = medida < self.tolerancia
+            else:
+                convergio = medida <= self.tolerancia * np.abs(x).max(initial=0.0)
+
+        if self.medidas is not None:
+            self.medidas[self.controles] = medida
+        self.controles += 1
+        return convergio
+
+    def info(self, info):
+        """Agrega el historial de medidas a info (si se pidio)"""
+        if self.medidas is not None:
+            info['historial'] = self.medidas[:self.controles]
+        return info
+
+
+def _jacobi_csr(A, b, x0, tolerancia, max_iter, control=None):
+    """Jacobi sobre MatrizCSR: cada barrido recorre solo los no nulos"""
+    control = control or _Control(tolerancia, max_iter)
+    n = len(A)
+    filas, diagonal = A._filas_sin_diagonal()
+    x = [0.0] * n if x0 is None else list(x0)
+    x_nuevo = [0.0] * n
+
+    for iteracion in range(max_iter):
+        for i in range(n):
+            suma = 0
+            for j, a_ij in filas[i]:
+                suma += a_ij * x[j]
+            x_nuevo[i] = (b[i] - suma) / diagonal[i]
+
+        if control.convergio(iteracion, x_nuevo, x):
+            return x_nuevo, iteracion + 1
+
+        x, x_nuevo = x_nuevo, x
+
+    return x, max_iter
+
+
+def _relajacion_csr(A, b, x0, omega, tolerancia, max_iter, control=None, filas=None):
+    """Gauss-Seidel (omega = 1) o SOR sobre MatrizCSR en O(nnz) por barrido.
+
+    filas: resultado de A._filas_sin_diagonal() si ya se calculo.
+    """
+    control = control or _Control(tolerancia, max_iter)
+    n = len(A)
+    filas, diagonal = filas or A._filas_sin_diagonal()
+    x = [0.0] * n if x0 is None else list(x0)
+
+    for iteracion in range(max_iter):
+        x_viejo = x[:] if control.usa_paso(iteracion) else None
+
+        for i in range(n):
+            suma = 0
+            for j, a_ij in filas[i]:
+                suma += a_ij * x[j]
+            x_gs = (b[i] - suma) / diagonal[i]
+            x[i] = x_gs if omega == 1 else (1 - omega) * x[i] + omega * x_gs
+
+        if control.convergio(iteracion, x, x_viejo):
+            return x, iteracion + 1
+
+    return x, max_iter
+
+def _producto(A, x):
+    """Producto A @ x para A en lista, ndarray o MatrizCSR"""
+    if isinstance(A, MatrizCSR):
+        return A.producto(x)
+    if isinstance(A, np.memmap):
+        return _producto_disco(A, np.asarray(x, dtype=float))
+    return np.asarray(A, dtype=float) @ np.asarray(x, dtype=float)
+
+
+def _norma_residuo(A, b, x):
+    """Norma euclidea del residuo b - Ax"""
+    return float(np.linalg.norm(np.asarray(b, dtype=float) - _producto(A, x)))
+
+
+def _jacobi_vectorizado(A, b, x0, tolerancia, max_iter, control=None):
+    """Jacobi como una expresion de arreglos por iteracion.
+
+    La inversa de la diagonal y la parte fuera de la diagonal se calculan
+    una vez; cada iteracion hace x_nuevo = D^-1 (b - R x) sobre dos buffers
+    preasignados que intercambian su rol, sin reservar memoria.
+    """
+    if isinstance(A, MatrizCSR):
+        inv_diagonal = 1.0 / A.diagonal()
+        R = A.sin_diagonal()
+        producto = R.producto
+    else:
+        R = np.array(A, dtype=float)
+        inv_diagonal = 1.0 / np.diag(R).copy()
+        np.fill_diagonal(R, 0.0)
+
+        def producto(v, out):
+            return np.dot(R, v, out=out)
+
+    n = len(inv_diagonal)
+    b = np.asarray(b, dtype=float)
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    x_nuevo = np.empty(n)
+    control = control or _Control(tolerancia, max_iter)
+
+    for iteracion in range(max_iter):
+        producto(x, out=x_nuevo)
+        np.subtract(b, x_nuevo, out=x_nuevo)
+        np.multiply(x_nuevo, inv_diagonal, out=x_nuevo)
+
+        if control.convergio(iteracion, x_nuevo, x):
+            return x_nuevo, iteracion + 1
+
+        x, x_nuevo = x_nuevo, x
+
+    return x, max_iter
+
+
+def matriz_a_banda(A, inferiores, superiores):
+    """Convierte una matriz densa a la forma compacta por diagonales.
+
+    El resultado tiene forma (inferiores + superiores + 1, n) con
+    ab[superiores + i - j, j] = A[i][j] (la convencion de LAPACK).
+    Acepta tambien una MatrizCSR (los no nulos fuera de la banda se ignoran).
+    """
+    if isinstance(A, MatrizCSR):
+        n = A.forma[0]
+        filas = np.repeat(np.arange(n), np.diff(A.punteros))
+        columnas = A.indices
+        dentro = (filas - columnas <= inferiores) & (columnas - filas <= superiores)
+        ab = np.zeros((inferiores + superiores + 1, n))
+        np.add.at(ab, (superiores + filas[dentro] - columnas[dentro], columnas[dentro]),
+                  A.valores[dentro])
+        return ab
+    A = np.asarray(A, dtype=float)
+    n = A.shape[0]
+    ab = np.zeros((inferiores + superiores + 1, n))
+    for desplazamiento in range(-inferiores, superiores + 1):
+        diagonal = np.diagonal(A, desplazamiento)
+        fila = superiores - desplazamiento
+        if desplazamiento >= 0:
+            ab[fila, desplazamiento:] = diagonal
+        else:
+            ab[fila, :n + desplazamiento] = diagonal
+    return ab
+
+
+def resolver_banda(ab, d, inferiores, superiores, pivoteo=False):
+    """Resuelve un sistema banda guardado en forma compacta por diagonales.
+
+    ab tiene forma (inferiores + superiores + 1, n) con
+    ab[superiores + i - j, j] = A[i][j] (ver matriz_a_banda). d puede ser un
+    vector (n,) o una matriz (n, m) con varios lados derechos. El costo es
+    O(n * ancho^2) y cada paso trabaja solo dentro de la banda.
+
+    Con pivoteo=True se hace pivoteo parcial dentro de la banda; U gana
+    a lo sumo 'inferiores' diagonales extra de relleno. Un pivote nulo
+    lanza ZeroDivisionError.
+
+    El bucle por fila en Python pesa mas que la aritmetica en bandas
+    angostas: un sistema tridiagonal con n = 1e5 tarda unas 20 veces mas
+    que resolver_tridiagonal, que conviene cuando no hace falta pivotear.
+    """
+    ab = np.asarray(ab, dtype=float)
+    p, q = inferiores, superiores
+    if ab.shape[0] != p + q + 1:
+        raise ValueError("ab debe tener inferiores + superiores + 1 filas")
+    n = ab.shape[1]
+    x = np.array(d, dtype=float)
+    D = x.reshape(n, -1)
+
+    # Copia de trabajo con lugar para el relleno del pivoteo
+    qu = q + p if pivoteo else q
+    W = np.zeros((p + qu + 1, n))
+    W[qu - q:] = ab
+
+    for k in range(n):
+        fin = min(n, k + p + 1)
+        fin_col = min(n, k + qu + 1)
+        columnas = np.arange(k, fin_col)
+
+        if pivoteo:
+            r = k + int(np.argmax(np.abs(W[qu:qu + fin - k, k])))
+            if r != k:
+                fila_k = qu + k - columnas
+                fila_r = qu + r - columnas
+                temporal = W[fila_k, columnas].copy()
+                W[fila_k, columnas] = W[fila_r, columnas]
+                W[fila_r, columnas] = temporal
+                D[[k, r]] = D[[r, k]]
+
+        pivote = W[qu, k]
+        if pivote == 0:
+            raise ZeroDivisionError("La matriz es singular")
+        if fin > k + 1:
+            factores = W[qu + 1:qu + fin - k, k] / pivote
+            filas = np.arange(k + 1, fin)[:, None]
+            resto = columnas[None, 1:]
+            W[qu + filas - resto, resto] -= factores[:, None] * W[qu + k - columnas[1:], columnas[1:]]
+            D[k+1:fin] -= factores[:, None] * D[k]
+
+    # Sustitucion hacia atras dentro de la banda de U
+    for k in range(n-1, -1, -1):
+        columnas = np.arange(k + 1, min(n, k + qu + 1))
+        D[k] -= W[qu + k - columnas, columnas] @ D[columnas]
+        D[k] /= W[qu, k]
+
+    return x if isinstance(d, np.ndarray) else x.tolist()
+
+
+def resolver_tridiagonal(a, b, c, d, pivoteo=False):
+    """Algoritmo de Thomas para sistemas tridiagonales.
+
+    a: subdiagonal (a[0] no se usa), b: diagonal, c: superdiagonal
+    (c[-1] no se usa), todas de longitud n. d puede ser (n,) o (n, m).
+    Con pivoteo=True se resuelve con resolver_banda pivoteando en la banda.
+    Sin pivoteo, un pivote nulo lanza ZeroDivisionError como en resolver_banda.
+    """
+    n = len(b)
+    if pivoteo:
+        ab = np.zeros((3, n))
+        ab[0, 1:] = c[:n-1]
+        ab[1] = b
+        ab[2, :n-1] = a[1:]
+        return resolver_banda(ab, d, 1, 1, pivoteo=True)
+
+    b = [float(v) for v in b]
+    x = np.array(d, dtype=float)
+
+    # eliminacion hacia adelante
+    for i in range(1, n):
+        if b[i-1] == 0:
+            raise ZeroDivisionError("La matriz es singular")
+        w = a[i] / b[i-1]
+        b[i] -= w * c[i-1]
+        x[i] -= w * x[i-1]
+    if n and b[-1] == 0:
+        raise ZeroDivisionError("La matriz es singular")
+    # sustitucion hacia atras
+    x[-1] = x[-1] / b[-1]
+    for i in range(n-2, -1, -1):
+        x[i] = (x[i] - c[i]*x[i+1]) / b[i]
+
+    return x if isinstance(d, np.ndarray) else x.tolist()
+
+
+def resolver_pentadiagonal(e, a, b, c, f, d, pivoteo=False):
+    """Resuelve un sistema pentadiagonal.
+
+    e y a son la segunda y la primera subdiagonal (e[0], e[1] y a[0] no se
+    usan), b la diagonal, c y f la primera y la segunda superdiagonal
+    (c[-1], f[-2] y f[-1] no se usan). Todas tienen longitud n.
+    """
+    n = len(b)
+    ab = np.zeros((5, n))
+    ab[0, 2:] = f[:n-2]
+    ab[1, 1:] = c[:n-1]
+    ab[2] = b
+    ab[3, :n-1] = a[1:]
+    ab[4, :n-2] = e[2:]
+    return resolver_banda(ab, d, 2, 2, pivoteo=pivoteo)
+
+
+def _jacobi_denso(A, b, x0, tolerancia, max_iter, control=None):
+    """Jacobi escalar sobre listas de listas"""
+    control = control or _Control(tolerancia, max_iter)
     n = len(A)
     if x0 is None:
         x0 = [0] * n
@@ -48,33 +1169,837 @@ def jacobi(A, b, x0=None, tolerancia=1e-5, max_iter=100):
     x_nuevo = [0] * n
     
     for iteracion in range(max_iter):
-        for i in range(n):
-            suma = 0
-            for j in range(n):
-                if i != j:
-                    suma += A[i][j] * x[j]
-            x_nuevo[i] = (b[i] - suma) / A[i][i]
-        
-        # Calcular error
-        error = max(abs(x_nuevo[i] - x[i]) for i in range(n))
-        
-        if error < tolerancia:
-            return x_nuevo, iteracion + 1
-        
-        x = x_nuevo[:]
-    
+        for i in range(n):
+            suma = 0
+            for j in range(n):
+                if i != j:
+                    suma += A[i][j] * x[j]
+            x_nuevo[i] = (b[i] - suma) / A[i][i]
+        
+        if control.convergio(iteracion, x_nuevo, x):
+            return x_nuevo, iteracion + 1
+        
+        x = x_nuevo[:]
+    
+    return x, max_iter
+
+
+def jacobi(A, b, x0=None, tolerancia=1e-5, max_iter=100, vectorizado=None,
+           devolver_info=False, filas_bloque=None, criterio='paso',
+           intervalo_control=1, historial=False):
+    """Metodo de Jacobi para sistemas lineales (A densa, MatrizCSR o en disco)
+
+    vectorizado: None lo activa para ndarray y MatrizCSR; True tambien
+    convierte listas. En todos los modos x es un ndarray si b lo es y una
+    lista si no (igual en gauss_seidel y relajacion).
+    devolver_info: si es True retorna (x, iteraciones, info) donde info
+    contiene la norma del residuo final ('residuo').
+    Si A es un np.memmap (ver abrir_matriz_disco) las filas se leen en
+    bloques de filas_bloque filas por barrido (por defecto unos
+    BYTES_BLOQUE_DISCO), con memoria acotada sin importar n.
+
+    criterio: 'paso' (||x_k+1 - x_k||_inf < tolerancia, el de siempre),
+    'paso_relativo' (respecto de ||x_k+1||_inf) o 'residuo'
+    (||b - Ax||_2 <= tolerancia ||b||_2, un producto extra por control).
+    intervalo_control: controlar solo cada k barridos.
+    historial: si es True info['historial'] tiene la medida de cada
+    control en un ndarray preasignado (implica devolver_info).
+    """
+    if vectorizado is None:
+        vectorizado = isinstance(A, (np.ndarray, MatrizCSR))
+    control = _Control(tolerancia, max_iter, criterio, intervalo_control, historial, A, b)
+
+    if isinstance(A, np.memmap):
+        x, iteraciones = _resultado_disco(
+            b, *_jacobi_disco(A, b, x0, tolerancia, max_iter, filas_bloque, control))
+    elif vectorizado:
+        x, iteraciones = _jacobi_vectorizado(A, b, x0, tolerancia, max_iter, control)
+        if not isinstance(b, np.ndarray):
+            x = x.tolist()
+    elif isinstance(A, MatrizCSR):
+        x, iteraciones = _jacobi_csr(A, b, x0, tolerancia, max_iter, control)
+    else:
+        x, iteraciones = _jacobi_denso(A, b, x0, tolerancia, max_iter, control)
+
+    return _resultado_estacionario(A, b, x, iteraciones, control, historial or devolver_info)
+
+def _compartir(arreglo, bloques):
+    """Copia un ndarray a un bloque nuevo de memoria compartida y devuelve la vista"""
+    arreglo = np.ascontiguousarray(arreglo)
+    bloque = shared_memory.SharedMemory(create=True, size=max(1, arreglo.nbytes))
+    bloques.append(bloque)
+    vista = np.ndarray(arreglo.shape, dtype=arreglo.dtype, buffer=bloque.buf)
+    vista[...] = arreglo
+    return vista
+
+
+def _abrir_compartido(descriptor, abiertos):
+    nombre, forma, tipo = descriptor
+    bloque = shared_memory.SharedMemory(name=nombre)
+    abiertos.append(bloque)
+    return np.ndarray(forma, dtype=tipo, buffer=bloque.buf)
+
+
+def _trabajador_jacobi(descriptores, disperso, i0, i1, trabajador, barrera,
+                       tolerancia, max_iter, espera):
+    """Proceso que actualiza las filas i0:i1 de Jacobi en cada barrido"""
+    abiertos = []
+    try:
+        vistas = {clave: _abrir_compartido(descriptor, abiertos)
+                  for clave, descriptor in descriptores.items()}
+        _barridos_jacobi(vistas, disperso, i0, i1, trabajador, barrera,
+                         tolerancia, max_iter, espera)
+    except threading.BrokenBarrierError:
+        # Otro proceso fallo o se agoto la espera: se termina sin traza
+        raise SystemExit(1)
+    except BaseException:
+        barrera.abort()
+        raise
+    finally:
+        # Las vistas deben liberarse antes de cerrar la memoria compartida
+        vistas = None
+        for bloque in abiertos:
+            bloque.close()
+
+
+def _barridos_jacobi(vistas, disperso, i0, i1, trabajador, barrera, tolerancia, max_iter,
+                     espera=None):
+    """Barridos de Jacobi de un bloque de filas sobre memoria compartida.
+
+    Lee el iterado de X[it % 2] y escribe su bloque en X[(it + 1) % 2]; el
+    error de cada barrido se deja en errores[it % 2]. Una sola barrera por
+    barrido alcanza: nadie vuelve a escribir un buffer hasta que todos
+    pasaron la barrera siguiente.
+    """
+    X = vistas['X']
+    errores = vistas['errores']
+    b = vistas['b'][i0:i1]
+    inv_diagonal = vistas['inv_diagonal'][i0:i1]
+    if disperso:
+        punteros = vistas['punteros']
+        p0, p1 = punteros[i0], punteros[i1]
+        R = MatrizCSR(vistas['valores'][p0:p1], vistas['indices'][p0:p1],
+                      punteros[i0:i1+1] - p0, (i1 - i0, X.shape[1]))
+        producto = R.producto
+    else:
+        R = vistas['R'][i0:i1]
+
+        def producto(v, out):
+            return np.dot(R, v, out=out)
+
+    temporal = np.empty(i1 - i0)
+    iteraciones = max_iter
+    for iteracion in range(max_iter):
+        actual = X[iteracion % 2]
+        producto(actual, out=temporal)
+        np.subtract(b, temporal, out=temporal)
+        np.multiply(temporal, inv_diagonal, out=temporal)
+        X[(iteracion + 1) % 2, i0:i1] = temporal
+
+        np.subtract(temporal, actual[i0:i1], out=temporal)
+        np.abs(temporal, out=temporal)
+        errores[iteracion % 2, trabajador] = temporal.max() if i1 > i0 else 0.0
+
+        barrera.wait(espera)
+        if errores[iteracion % 2].max() < tolerancia:
+            iteraciones = iteracion + 1
+            break
+
+    if trabajador == 0:
+        vistas['iteraciones'][0] = iteraciones
+
+
+def jacobi_paralelo(A, b, x0=None, tolerancia=1e-5, max_iter=100, procesos=None,
+                    devolver_info=False, espera=600.0):
+    """Jacobi con las filas repartidas en bloques entre varios procesos.
+
+    La matriz (ndarray, lista o MatrizCSR), b y los dos buffers del
+    iterado viven en multiprocessing.shared_memory, asi que no se serializa
+    nada por iteracion; los procesos se sincronizan una vez por barrido.
+    Los bloques de una MatrizCSR se balancean por cantidad de no nulos.
+    El resultado coincide con el de jacobi(..., vectorizado=True) salvo
+    redondeo: el producto de cada bloque de filas puede sumar en otro orden.
+
+    procesos: cantidad de procesos (por defecto os.cpu_count()).
+    espera: segundos que un proceso espera a los demas en cada barrido.
+    Si un proceso muere (por ejemplo por falta de memoria) la barrera se
+    rompe y se lanza RuntimeError en lugar de quedar bloqueado.
+    Retorna (x, iteraciones) o (x, iteraciones, info) como jacobi.
+    """
+    disperso = isinstance(A, MatrizCSR)
+    n = len(A)
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    procesos = max(1, min(procesos, n))
+
+    bloques = []
+    vistas = {}
+    try:
+        if disperso:
+            inv_diagonal = 1.0 / A.diagonal()
+            R = A.sin_diagonal()
+            for clave in ('valores', 'indices', 'punteros'):
+                vistas[clave] = _compartir(getattr(R, clave), bloques)
+            objetivos = np.arange(1, procesos) * R.nnz / procesos
+            cortes = np.searchsorted(R.punteros, objetivos)
+        else:
+            vistas['R'] = R = _compartir(np.asarray(A, dtype=float), bloques)
+            inv_diagonal = 1.0 / np.diag(R).copy()
+            np.fill_diagonal(R, 0.0)
+            cortes = np.arange(1, procesos) * n // procesos
+        limites = [0] + [int(c) for c in cortes] + [n]
+        R = None
+
+        vistas['b'] = _compartir(np.asarray(b, dtype=float), bloques)
+        vistas['inv_diagonal'] = _compartir(inv_diagonal, bloques)
+        vistas['X'] = _compartir(np.zeros((2, n)), bloques)
+        vistas['errores'] = _compartir(np.full((2, procesos), np.inf), bloques)
+        vistas['iteraciones'] = _compartir(np.zeros(1, dtype=np.int64), bloques)
+        if x0 is not None:
+            vistas['X'][0] = x0
+        descriptores = {clave: (bloque.name, vistas[clave].shape, vistas[clave].dtype.str)
+                        for clave, bloque in zip(vistas, bloques)}
+
+        contexto = multiprocessing.get_context()
+        barrera = contexto.Barrier(procesos)
+        trabajadores = [
+            contexto.Process(target=_trabajador_jacobi,
+                             args=(descriptores, disperso, limites[w], limites[w+1], w,
+                                   barrera, tolerancia, max_iter, espera))
+            for w in range(procesos)
+        ]
+        for proceso in trabajadores:
+            proceso.start()
+        # Si un proceso termina mal se rompe la barrera para liberar a los demas
+        pendientes = {proceso.sentinel: proceso for proceso in trabajadores}
+        while pendientes:
+            for sentinela in wait(list(pendientes)):
+                proceso = pendientes.pop(sentinela)
+                proceso.join()
+                if proceso.exitcode != 0:
+                    barrera.abort()
+        if any(proceso.exitcode != 0 for proceso in trabajadores):
+            codigos = [proceso.exitcode for proceso in trabajadores]
+            raise RuntimeError(f"Fallo un proceso de jacobi_paralelo (codigos de salida {codigos})")
+
+        iteraciones = int(vistas['iteraciones'][0])
+        x = vistas['X'][iteraciones % 2].copy()
+    finally:
+        # Las vistas deben liberarse antes de cerrar la memoria compartida
+        vistas.clear()
+        for bloque in bloques:
+            bloque.close()
+            bloque.unlink()
+
+    if not isinstance(b, np.ndarray):
+        x = x.tolist()
+    if devolver_info:
+        return x, iteraciones, {'residuo': _norma_residuo(A, b, x)}
+    return x, iteraciones
+
+
+# Bytes por bloque de filas al recorrer matrices en disco
+BYTES_BLOQUE_DISCO = 32 * 2**20
+
+
+class _LectorFilas:
+    """Lee bloques de filas consecutivas de una matriz en disco.
+
+    Si A es un np.memmap C-contiguo que mapea directamente el archivo, los
+    bloques se leen con readinto sobre un buffer fijo, sin dejar paginas
+    mapeadas residentes; en otro caso se copian desde la vista del mapa.
+    La memoria usada queda acotada por filas_bloque * n elementos.
+    """
+
+    def __init__(self, A, filas_bloque=None):
+        self.A = A
+        self.n_filas, self.n = A.shape
+        if filas_bloque is None:
+            filas_bloque = BYTES_BLOQUE_DISCO // max(1, self.n * A.itemsize)
+        self.filas_bloque = max(1, min(int(filas_bloque), self.n_filas))
+        self.buffer = np.empty((self.filas_bloque, self.n), dtype=A.dtype)
+        directo = (isinstance(A, np.memmap) and isinstance(A.base, mmap.mmap)
+                   and A.flags.c_contiguous and A.filename is not None)
+        self.archivo = open(A.filename, 'rb') if directo else None
+
+    def bloques(self):
+        """Itera (i0, i1, filas) sobre toda la matriz; filas se reutiliza"""
+        for i0 in range(0, self.n_filas, self.filas_bloque):
+            i1 = min(self.n_filas, i0 + self.filas_bloque)
+            filas = self.buffer[:i1 - i0]
+            if self.archivo is not None:
+                self.archivo.seek(self.A.offset + i0 * self.n * self.A.itemsize)
+                self.archivo.readinto(memoryview(filas).cast('B'))
+            else:
+                np.copyto(filas, self.A[i0:i1])
+            yield i0, i1, filas
+
+    def diagonal(self):
+        d = np.empty(min(self.n_filas, self.n))
+        for i0, i1, filas in self.bloques():
+            d[i0:i1] = filas[np.arange(i1 - i0), np.arange(i0, i1)]
+        return d
+
+    def cerrar(self):
+        if self.archivo is not None:
+            self.archivo.close()
+
+
+def _producto_disco(A, x, filas_bloque=None, lector=None):
+    propio = lector is None
+    lector = lector or _LectorFilas(A, filas_bloque)
+    try:
+        y = np.empty(lector.n_filas)
+        for i0, i1, filas in lector.bloques():
+            y[i0:i1] = filas @ x
+        return y
+    finally:
+        if propio:
+            lector.cerrar()
+
+
+def _jacobi_disco(A, b, x0, tolerancia, max_iter, filas_bloque, control=None):
+    """Jacobi sobre una matriz en disco leida por bloques de filas.
+
+    Usa x_nuevo = x + D^-1 (b - A x) para no tener que anular la diagonal.
+    """
+    control = control or _Control(tolerancia, max_iter)
+    lector = _LectorFilas(A, filas_bloque)
+    try:
+        inv_diagonal = 1.0 / lector.diagonal()
+        n = lector.n_filas
+        b = np.asarray(b, dtype=float)
+        x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+        x_nuevo = np.empty(n)
+
+        for iteracion in range(max_iter):
+            for i0, i1, filas in lector.bloques():
+                x_nuevo[i0:i1] = x[i0:i1] + (b[i0:i1] - filas @ x) * inv_diagonal[i0:i1]
+
+            if control.convergio(iteracion, x_nuevo, x):
+                return x_nuevo, iteracion + 1
+
+            x, x_nuevo = x_nuevo, x
+
+        return x, max_iter
+    finally:
+        lector.cerrar()
+
+
+def _relajacion_disco(A, b, x0, omega, tolerancia, max_iter, filas_bloque, control=None,
+                      lector=None):
+    """Gauss-Seidel/SOR sobre una matriz en disco leida por bloques de filas.
+
+    Por cada bloque i0:i1 el aporte de las columnas fuera del bloque se
+    calcula con dos productos (x[:i0] ya actualizado, x[i1:] viejo) y
+    dentro del bloque se barren las filas en orden como en el metodo clasico.
+    Si se pasa un lector abierto se usa (y no se cierra) en lugar de abrir uno.
+    """
+    control = control or _Control(tolerancia, max_iter)
+    propio = lector is None
+    lector = lector or _LectorFilas(A, filas_bloque)
+    try:
+        n = lector.n_filas
+        b = np.asarray(b, dtype=float)
+        x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+        x_viejo = np.empty(n)
+
+        for iteracion in range(max_iter):
+            if control.usa_paso(iteracion):
+                np.copyto(x_viejo, x)
+
+            for i0, i1, filas in lector.bloques():
+                externa = filas[:, :i0] @ x[:i0] + filas[:, i1:] @ x[i1:]
+                D = filas[:, i0:i1]
+                x_bloque = x[i0:i1]
+                for r in range(i1 - i0):
+                    suma = externa[r] + D[r, :r] @ x_bloque[:r] + D[r, r+1:] @ x_bloque[r+1:]
+                    x_gs = (b[i0 + r] - suma) / D[r, r]
+                    x_bloque[r] = x_gs if omega == 1 else (1 - omega) * x_bloque[r] + omega * x_gs
+
+            if control.convergio(iteracion, x, x_viejo):
+                return x, iteracion + 1
+
+        return x, max_iter
+    finally:
+        if propio:
+            lector.cerrar()
+
+
+def _verificar_ordenamiento_disco(ordenamiento):
+    if ordenamiento != 'lexicografico':
+        raise ValueError("Las matrices en disco solo admiten ordenamiento 'lexicografico'")
+
+
+def _resultado_disco(b, x, iteraciones):
+    return (x if isinstance(b, np.ndarray) else x.tolist()), iteraciones
+
+
+def abrir_matriz_disco(ruta, forma=None, dtype='float64'):
+    """Abre una matriz en disco como np.memmap de solo lectura.
+
+    Archivos .npy se abren con su encabezado. Para binarios crudos (filas
+    contiguas, sin encabezado) se indica forma (n o (n_filas, n_columnas));
+    si se omite se asume una matriz cuadrada segun el tamano del archivo.
+    """
+    if str(ruta).endswith('.npy'):
+        return np.load(ruta, mmap_mode='r')
+    dtype = np.dtype(dtype)
+    if forma is None:
+        n = int(round((os.path.getsize(ruta) // dtype.itemsize) ** 0.5))
+        forma = (n, n)
+    elif np.isscalar(forma):
+        forma = (int(forma), int(forma))
+    return np.memmap(ruta, dtype=dtype, mode='r', shape=tuple(forma))
+
+
+def _crear_matriz_disco(ruta, forma, dtype):
+    if str(ruta).endswith('.npy'):
+        return np.lib.format.open_memmap(ruta, mode='w+', dtype=dtype, shape=forma)
+    return np.memmap(ruta, dtype=dtype, mode='w+', shape=forma)
+
+
+def tripletes_a_disco(ruta, filas, columnas, valores, forma, dtype='float64',
+                      tamano_bloque=2**20):
+    """Escribe en disco la matriz densa dada por tripletes (fila, columna, valor).
+
+    El formato es .npy si la ruta termina asi, o binario crudo en otro
+    caso. Los tripletes repetidos se suman. Retorna la matriz abierta con
+    abrir_matriz_disco.
+    """
+    forma = (int(forma), int(forma)) if np.isscalar(forma) else tuple(forma)
+    filas = np.asarray(filas)
+    columnas = np.asarray(columnas)
+    valores = np.asarray(valores)
+    destino = _crear_matriz_disco(ruta, forma, dtype)
+    for k in range(0, len(valores), tamano_bloque):
+        np.add.at(destino, (filas[k:k + tamano_bloque], columnas[k:k + tamano_bloque]),
+                  valores[k:k + tamano_bloque])
+    destino.flush()
+    del destino
+    return abrir_matriz_disco(ruta, forma, dtype)
+
+
+def texto_a_disco(ruta_texto, ruta, formato='densa', forma=None, dtype='float64',
+                  lineas_bloque=4096):
+    """Convierte una matriz en texto al formato en disco, leyendo por bloques.
+
+    formato 'densa': una fila de la matriz por linea, separada por espacios.
+    formato 'tripletes': lineas 'i j valor' con indices desde 0; los
+    repetidos se suman. Las lineas vacias y las que empiezan con '%' o '#'
+    se ignoran. Si falta forma se hace una primera pasada para calcularla.
+    """
+    def bloques_de_lineas():
+        with open(ruta_texto) as archivo:
+            bloque = []
+            for linea in archivo:
+                linea = linea.strip()
+                if linea and linea[0] not in '%#':
+                    bloque.append(linea)
+                    if len(bloque) == lineas_bloque:
+                        yield bloque
+                        bloque = []
+            if bloque:
+                yield bloque
+
+    def a_numeros(bloque, columnas):
+        return np.array(' '.join(bloque).split(), dtype=float).reshape(len(bloque), columnas)
+
+    if formato == 'densa':
+        if forma is None:
+            n_filas, n_columnas = 0, None
+            for bloque in bloques_de_lineas():
+                n_filas += len(bloque)
+                if n_columnas is None:
+                    n_columnas = len(bloque[0].split())
+            forma = (n_filas, n_columnas or 0)
+        forma = (int(forma), int(forma)) if np.isscalar(forma) else tuple(forma)
+        destino = _crear_matriz_disco(ruta, forma, dtype)
+        i = 0
+        for bloque in bloques_de_lineas():
+            destino[i:i + len(bloque)] = a_numeros(bloque, forma[1])
+            i += len(bloque)
+    elif formato == 'tripletes':
+        if forma is None:
+            maximos = np.zeros(2, dtype=np.int64)
+            for bloque in bloques_de_lineas():
+                maximos = np.maximum(maximos, a_numeros(bloque, 3)[:, :2].max(axis=0).astype(np.int64))
+            forma = (int(maximos[0]) + 1, int(maximos[1]) + 1)
+        forma = (int(forma), int(forma)) if np.isscalar(forma) else tuple(forma)
+        destino = _crear_matriz_disco(ruta, forma, dtype)
+        for bloque in bloques_de_lineas():
+            datos = a_numeros(bloque, 3)
+            np.add.at(destino, (datos[:, 0].astype(np.int64), datos[:, 1].astype(np.int64)),
+                      datos[:, 2])
+    else:
+        raise ValueError("formato debe ser 'densa' o 'tripletes'")
+
+    destino.flush()
+    del destino
+    return abrir_matriz_disco(ruta, forma, dtype)
+
+# Lectura y escritura de matrices en archivos
+
+_CAMPOS_MATRIX_MARKET = ('real', 'integer', 'pattern')
+_SIMETRIAS_MATRIX_MARKET = ('general', 'symmetric', 'skew-symmetric')
+
+
+def _bloques_de_numeros(archivo, columnas, bytes_bloque):
+    """Genera arreglos (lineas, columnas) leyendo unos bytes_bloque de texto por vez"""
+    while True:
+        lineas = archivo.readlines(bytes_bloque)
+        if not lineas:
+            return
+        datos = np.loadtxt(lineas, comments='%', ndmin=2)
+        if datos.size:
+            if datos.shape[1] != columnas:
+                raise ValueError(f"se esperaban {columnas} valores por linea")
+            yield datos
+
+
+def _leer_encabezado_matrix_market(archivo):
+    """Lee el encabezado y la linea de tamanos; retorna (formato, campo, simetria, tamanos)"""
+    partes = archivo.readline().lower().split()
+    if len(partes) != 5 or partes[0] != '%%matrixmarket' or partes[1] != 'matrix':
+        raise ValueError("el archivo no tiene un encabezado Matrix Market valido")
+    formato, campo, simetria = partes[2:]
+    if formato not in ('coordinate', 'array'):
+        raise ValueError(f"formato Matrix Market no soportado: {formato}")
+    if campo not in _CAMPOS_MATRIX_MARKET or (campo == 'pattern' and formato == 'array'):
+        raise ValueError(f"campo Matrix Market no soportado: {campo}")
+    if simetria not in _SIMETRIAS_MATRIX_MARKET:
+        raise ValueError(f"simetria Matrix Market no soportada: {simetria}")
+    for linea in archivo:
+        linea = linea.strip()
+        if linea and linea[0] != '%':
+            return formato, campo, simetria, [int(t) for t in linea.split()]
+    raise ValueError("falta la linea de tamanos")
+
+
+def leer_matrix_market(ruta, bytes_bloque=BYTES_BLOQUE_DISCO):
+    """Lee una matriz en formato Matrix Market (.mtx).
+
+    El formato coordinate se devuelve como MatrizCSR y el formato array
+    como ndarray denso; ambos se pasan tal cual a los metodos del modulo.
+    Se aceptan los campos real, integer y pattern y las simetrias general,
+    symmetric y skew-symmetric (se completa el triangulo faltante). El
+    texto se procesa por bloques de bytes_bloque bytes, asi que la
+    memoria extra queda acotada por el bloque y no por el archivo.
+    """
+    with open(ruta) as archivo:
+        formato, campo, simetria, tamanos = _leer_encabezado_matrix_market(archivo)
+        if formato == 'coordinate':
+            n_filas, n_columnas, nnz = tamanos
+            columnas = 2 if campo == 'pattern' else 3
+            filas = np.empty(nnz, dtype=np.int64)
+            indices = np.empty(nnz, dtype=np.int64)
+            valores = np.ones(nnz)
+            k = 0
+            for datos in _bloques_de_numeros(archivo, columnas, bytes_bloque):
+                if k + len(datos) > nnz:
+                    raise ValueError("el archivo tiene mas entradas que las declaradas")
+                filas[k:k + len(datos)] = datos[:, 0]
+                indices[k:k + len(datos)] = datos[:, 1]
+                if columnas == 3:
+                    valores[k:k + len(datos)] = datos[:, 2]
+                k += len(datos)
+        else:
+            n_filas, n_columnas = tamanos
+            if simetria == 'general':
+                total = n_filas * n_columnas
+            else:
+                total = n_filas * (n_filas + 1) // 2 - (n_filas if simetria == 'skew-symmetric' else 0)
+            nnz = total
+            valores = np.empty(total)
+            k = 0
+            for datos in _bloques_de_numeros(archivo, 1, bytes_bloque):
+                if k + len(datos) > total:
+                    raise ValueError("el archivo tiene mas entradas que las declaradas")
+                valores[k:k + len(datos)] = datos[:, 0]
+                k += len(datos)
+    if k != nnz:
+        raise ValueError(f"se declararon {nnz} entradas pero el archivo tiene {k}")
+    if simetria != 'general' and n_filas != n_columnas:
+        raise ValueError("una matriz simetrica debe ser cuadrada")
+
+    if formato == 'array':
+        if simetria == 'general':
+            # Los valores vienen por columnas
+            return np.ascontiguousarray(valores.reshape(n_columnas, n_filas).T)
+        # Triangulo inferior por columnas: (columna, fila) recorre triu por filas
+        columna, fila = np.triu_indices(n_filas, 0 if simetria == 'symmetric' else 1)
+        A = np.zeros((n_filas, n_filas))
+        A[fila, columna] = valores
+        A[columna, fila] = valores if simetria == 'symmetric' else -valores
+        return A
+
+    filas -= 1
+    indices -= 1
+    if simetria != 'general':
+        fuera = filas != indices
+        espejo = valores[fuera] if simetria == 'symmetric' else -valores[fuera]
+        filas, indices = np.r_[filas, indices[fuera]], np.r_[indices, filas[fuera]]
+        valores = np.r_[valores, espejo]
+    return MatrizCSR.desde_tripletes(filas, indices, valores, (n_filas, n_columnas))
+
+
+def escribir_matrix_market(ruta, A, simetrica=False, entradas_bloque=2**18):
+    """Escribe una matriz en formato Matrix Market (.mtx).
+
+    Una MatrizCSR se escribe en formato coordinate y una matriz densa
+    (lista o ndarray) en formato array. Con simetrica=True solo se escribe
+    el triangulo inferior con simetria symmetric (no se verifica que A lo
+    sea). Los valores se escriben con 17 cifras, suficientes para releer
+    exactamente los mismos float64, en bloques de entradas_bloque entradas.
+    """
+    simetria = 'symmetric' if simetrica else 'general'
+    with open(ruta, 'w') as archivo:
+        if isinstance(A, MatrizCSR):
+            n_filas, n_columnas = A.forma
+            filas = np.repeat(np.arange(n_filas), np.diff(A.punteros))
+            indices, valores = A.indices, A.valores
+            if simetrica:
+                inferior = filas >= indices
+                filas, indices, valores = filas[inferior], indices[inferior], valores[inferior]
+            archivo.write(f"%%MatrixMarket matrix coordinate real {simetria}\n")
+            archivo.write(f"{n_filas} {n_columnas} {len(valores)}\n")
+            for k in range(0, len(valores), entradas_bloque):
+                bloque = slice(k, k + entradas_bloque)
+                archivo.writelines(f"{i} {j} {v!r}\n" for i, j, v in zip(
+                    (filas[bloque] + 1).tolist(), (indices[bloque] + 1).tolist(),
+                    valores[bloque].tolist()))
+        else:
+            A = np.asarray(A, dtype=float)
+            n_filas, n_columnas = A.shape
+            if simetrica and n_filas != n_columnas:
+                raise ValueError("una matriz simetrica debe ser cuadrada")
+            archivo.write(f"%%MatrixMarket matrix array real {simetria}\n")
+            archivo.write(f"{n_filas} {n_columnas}\n")
+            columnas_bloque = max(1, entradas_bloque // max(n_filas, 1))
+            for j in range(0, n_columnas, columnas_bloque):
+                if simetrica:
+                    valores = np.concatenate([A[c:, c] for c in range(j, min(j + columnas_bloque, n_columnas))])
+                else:
+                    valores = A[:, j:j + columnas_bloque].T.ravel()
+                archivo.writelines(f"{v!r}\n" for v in valores.tolist())
+
+
+# Formato binario CSR: firma, (n_filas, n_columnas, nnz) en int64, punteros e
+# indices en int64 y valores en float64, todo en orden de bytes little-endian
+_FIRMA_CSR = b'MNCSR\x00\x00\x01'
+
+
+def escribir_csr_binario(ruta, A):
+    """Escribe la matriz (MatrizCSR o densa) en el formato binario CSR del modulo"""
+    if not isinstance(A, MatrizCSR):
+        A = MatrizCSR.desde_densa(A)
+    with open(ruta, 'wb') as archivo:
+        archivo.write(_FIRMA_CSR)
+        np.array([A.forma[0], A.forma[1], A.nnz], dtype='<i8').tofile(archivo)
+        A.punteros.astype('<i8', copy=False).tofile(archivo)
+        A.indices.astype('<i8', copy=False).tofile(archivo)
+        A.valores.astype('<f8', copy=False).tofile(archivo)
+
+
+def leer_csr_binario(ruta, mapear=False):
+    """Lee una matriz escrita con escribir_csr_binario como MatrizCSR.
+
+    Con mapear=True los arreglos son np.memmap de solo lectura sobre el
+    archivo, asi que la carga es inmediata y las paginas se leen a medida
+    que los metodos recorren la matriz.
+    """
+    with open(ruta, 'rb') as archivo:
+        if archivo.read(len(_FIRMA_CSR)) != _FIRMA_CSR:
+            raise ValueError("el archivo no esta en el formato binario CSR")
+        n_filas, n_columnas, nnz = (int(t) for t in np.fromfile(archivo, dtype='<i8', count=3))
+    inicio = len(_FIRMA_CSR) + 3 * 8
+    esperado = inicio + 8 * (n_filas + 1 + 2 * nnz)
+    if os.path.getsize(ruta) != esperado:
+        raise ValueError("el tamano del archivo no coincide con su encabezado")
+
+    def arreglo(dtype, cantidad, desplazamiento):
+        if mapear:
+            return np.memmap(ruta, dtype=dtype, mode='r', offset=desplazamiento, shape=(cantidad,))
+        return np.fromfile(ruta, dtype=dtype, count=cantidad, offset=desplazamiento)
+
+    punteros = arreglo('<i8', n_filas + 1, inicio)
+    indices = arreglo('<i8', nnz, inicio + 8 * (n_filas + 1))
+    valores = arreglo('<f8', nnz, inicio + 8 * (n_filas + 1 + nnz))
+    return MatrizCSR(valores, indices, punteros, (n_filas, n_columnas))
+
+
+def coloreo_grafo(A):
+    """Coloreo voraz del grafo de adyacencia de la matriz.
+
+    Dos incognitas i, j son vecinas si a_ij o a_ji es no nulo. Incognitas
+    del mismo color no se acoplan, asi que pueden actualizarse juntas en
+    Gauss-Seidel/SOR. En grillas con esquema de 5 puntos resulta el
+    ordenamiento rojo-negro. El resultado se cachea por identidad de A
+    (se recalcula si cambia el patron de no nulos).
+
+    Retorna una lista de ndarrays con los indices de cada color.
+    """
+    return _memorizar(A, 'coloreo', _calcular_coloreo)
+
+
+def _calcular_coloreo(A):
+    M = A if isinstance(A, MatrizCSR) else MatrizCSR.desde_densa(A)
+    n = len(M)
+    filas = np.repeat(np.arange(n), np.diff(M.punteros))
+    # Patron simetrizado A + A^T
+    patron = MatrizCSR.desde_tripletes(np.concatenate([filas, M.indices]),
+                                       np.concatenate([M.indices, filas]),
+                                       np.ones(2 * M.nnz), (n, n))
+    indices = patron.indices.tolist()
+    punteros = patron.punteros.tolist()
+
+    color = [-1] * n
+    for i in range(n):
+        usados = {color[j] for j in indices[punteros[i]:punteros[i+1]] if j != i}
+        c = 0
+        while c in usados:
+            c += 1
+        color[i] = c
+
+    color = np.array(color, dtype=np.int64)
+    return [np.flatnonzero(color == c) for c in range(color.max() + 1 if n else 0)]
+
+
+def _patron_multicolor(A):
+    """Coloreo y, en CSR, posiciones de los no nulos fuera de la diagonal de cada color"""
+    colores = coloreo_grafo(A)
+    if not isinstance(A, MatrizCSR):
+        return [(indices, None, None, None) for indices in colores]
+    largos = np.diff(A.punteros)
+    fuera = np.repeat(np.arange(len(A)), largos) != A.indices
+    patron = []
+    for indices in colores:
+        largos_c = largos[indices]
+        locales = np.repeat(np.arange(len(indices)), largos_c)
+        inicios = np.zeros(len(indices), dtype=np.int64)
+        np.cumsum(largos_c[:-1], out=inicios[1:])
+        posiciones = np.repeat(A.punteros[indices] - inicios, largos_c) + np.arange(len(locales))
+        posiciones, locales = posiciones[fuera[posiciones]], locales[fuera[posiciones]]
+        punteros = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(locales, minlength=len(indices)), out=punteros[1:])
+        patron.append((indices, posiciones, A.indices[posiciones], punteros))
+    return patron
+
+
+def _bloques_multicolor(A):
+    """Filas fuera de la diagonal e inversa de la diagonal de cada color.
+
+    Solo el patron se cachea; los valores se leen de A en cada llamada.
+    """
+    patron = _memorizar(A, 'patron_multicolor', _patron_multicolor)
+    bloques = []
+    if isinstance(A, MatrizCSR):
+        diagonal = A.diagonal()
+        for indices, posiciones, columnas, punteros in patron:
+            R_c = MatrizCSR(A.valores[posiciones], columnas, punteros, (len(indices), len(A)))
+            bloques.append((indices, R_c.producto, 1.0 / diagonal[indices]))
+    else:
+        A = np.asarray(A, dtype=float)
+        for indices, _, _, _ in patron:
+            R_c = A[indices]
+            locales = np.arange(len(indices))
+            diagonal = R_c[locales, indices]
+            R_c[locales, indices] = 0.0
+
+            def producto(v, out, R_c=R_c):
+                return np.dot(R_c, v, out=out)
+
+            bloques.append((indices, producto, 1.0 / diagonal))
+    return bloques
+
+
+def _relajacion_multicolor(A, b, x0, omega, tolerancia, max_iter, control=None, bloques=None):
+    """Gauss-Seidel/SOR actualizando cada clase de color como un bloque vectorizado"""
+    control = control or _Control(tolerancia, max_iter)
+    bloques = bloques or _bloques_multicolor(A)
+    n = len(A)
+    b = np.asarray(b, dtype=float)
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    x_viejo = np.empty(n)
+    temporales = [np.empty(len(indices)) for indices, _, _ in bloques]
+
+    for iteracion in range(max_iter):
+        if control.usa_paso(iteracion):
+            np.copyto(x_viejo, x)
+
+        for (indices, producto, inv_diagonal), s in zip(bloques, temporales):
+            producto(x, out=s)
+            np.subtract(b[indices], s, out=s)
+            np.multiply(s, inv_diagonal, out=s)
+            if omega != 1:
+                s *= omega
+                s += (1 - omega) * x[indices]
+            x[indices] = s
+
+        if control.convergio(iteracion, x, x_viejo):
+            return x, iteracion + 1
+
     return x, max_iter
 
-def gauss_seidel(A, b, x0=None, tolerancia=1e-5, max_iter=100):
-    """Metodo de Gauss-Seidel para sistemas lineales"""
+
+def _resultado_multicolor(A, b, x0, omega, tolerancia, max_iter, control=None):
+    x, iteraciones = _relajacion_multicolor(A, b, x0, omega, tolerancia, max_iter, control)
+    return (x if isinstance(b, np.ndarray) else x.tolist()), iteraciones
+
+
+def _resultado_estacionario(A, b, x, iteraciones, control, con_info, info=None):
+    """Retorno comun de jacobi, gauss_seidel y relajacion: x sigue el tipo de b"""
+    if isinstance(b, np.ndarray):
+        x = np.asarray(x, dtype=float)
+    elif isinstance(x, np.ndarray):
+        x = x.tolist()
+    if not con_info:
+        return x, iteraciones
+    info = {} if info is None else info
+    info['residuo'] = _norma_residuo(A, b, x)
+    return x, iteraciones, control.info(info)
+
+
+def gauss_seidel(A, b, x0=None, tolerancia=1e-5, max_iter=100,
+                 ordenamiento='lexicografico', filas_bloque=None, criterio='paso',
+                 intervalo_control=1, historial=False, devolver_info=False):
+    """Metodo de Gauss-Seidel para sistemas lineales (A densa, MatrizCSR o en disco)
+
+    ordenamiento: 'lexicografico' recorre las filas en orden; 'multicolor'
+    usa coloreo_grafo(A) y actualiza cada color como un bloque vectorizado.
+    Si A es un np.memmap se recorre por bloques de filas (ver jacobi).
+    criterio, intervalo_control, historial y devolver_info como en jacobi.
+    """
+    control = _Control(tolerancia, max_iter, criterio, intervalo_control, historial, A, b)
+    if isinstance(A, np.memmap):
+        _verificar_ordenamiento_disco(ordenamiento)
+        x, iteraciones = _resultado_disco(
+            b, *_relajacion_disco(A, b, x0, 1, tolerancia, max_iter, filas_bloque, control))
+        return _resultado_estacionario(A, b, x, iteraciones, control, historial or devolver_info)
+    if ordenamiento == 'multicolor':
+        x, iteraciones = _resultado_multicolor(A, b, x0, 1, tolerancia, max_iter, control)
+        return _resultado_estacionario(A, b, x, iteraciones, control, historial or devolver_info)
+    if ordenamiento != 'lexicografico':
+        raise ValueError("ordenamiento debe ser 'lexicografico' o 'multicolor'")
+    if isinstance(A, MatrizCSR):
+        x, iteraciones = _relajacion_csr(A, b, x0, 1, tolerancia, max_iter, control)
+    else:
+        x, iteraciones = _gauss_seidel_denso(A, b, x0, tolerancia, max_iter, control)
+    return _resultado_estacionario(A, b, x, iteraciones, control, historial or devolver_info)
+
+
+def _gauss_seidel_denso(A, b, x0, tolerancia, max_iter, control=None):
+    """Gauss-Seidel escalar sobre listas de listas"""
+    control = control or _Control(tolerancia, max_iter)
     n = len(A)
     if x0 is None:
         x0 = [0] * n
     
-    x = x0[:]
+    x = list(x0)
     
     for iteracion in range(max_iter):
-        x_viejo = x[:]
+        # El iterado anterior solo se copia en los barridos que lo controlan
+        x_viejo = x[:] if control.usa_paso(iteracion) else None
         
         for i in range(n):
             suma = 0
@@ -83,24 +2008,23 @@ def gauss_seidel(A, b, x0=None, tolerancia=1e-5, max_iter=100):
                     suma += A[i][j] * x[j]
             x[i] = (b[i] - suma) / A[i][i]
         
-        # Calcular error
-        error = max(abs(x[i] - x_viejo[i]) for i in range(n))
-        
-        if error < tolerancia:
+        if control.convergio(iteracion, x, x_viejo):
             return x, iteracion + 1
     
     return x, max_iter
 
-def relajacion(A, b, x0=None, omega=1.25, tolerancia=1e-5, max_iter=100):
-    """Metodo de relajacion (SOR)"""
+def _relajacion_densa(A, b, x0, omega, tolerancia, max_iter, control=None):
+    """SOR escalar sobre listas de listas"""
+    control = control or _Control(tolerancia, max_iter)
     n = len(A)
     if x0 is None:
         x0 = [0] * n
     
-    x = x0[:]
+    x = list(x0)
     
     for iteracion in range(max_iter):
-        x_viejo = x[:]
+        # El iterado anterior solo se copia en los barridos que lo controlan
+        x_viejo = x[:] if control.usa_paso(iteracion) else None
         
         for i in range(n):
             suma = 0
@@ -110,10 +2034,1432 @@ def relajacion(A, b, x0=None, omega=1.25, tolerancia=1e-5, max_iter=100):
             x_gs = (b[i] - suma) / A[i][i]
             x[i] = (1 - omega) * x[i] + omega * x_gs
         
-        # Calcular error
-        error = max(abs(x[i] - x_viejo[i]) for i in range(n))
-        
-        if error < tolerancia:
+        if control.convergio(iteracion, x, x_viejo):
             return x, iteracion + 1
     
     return x, max_iter
+
+
+def _barrido_sor(A, b, ordenamiento, filas_bloque, lector):
+    """Un barrido SOR x, omega -> x_nuevo con la preparacion de A hecha una sola vez"""
+    if isinstance(A, np.memmap):
+        _verificar_ordenamiento_disco(ordenamiento)
+        return lambda x, omega: _relajacion_disco(A, b, x, omega, 0.0, 1, filas_bloque,
+                                                  lector=lector)[0]
+    if ordenamiento == 'multicolor':
+        bloques = _bloques_multicolor(A)
+        return lambda x, omega: _relajacion_multicolor(A, b, x, omega, 0.0, 1, bloques=bloques)[0]
+    if ordenamiento != 'lexicografico':
+        raise ValueError("ordenamiento debe ser 'lexicografico' o 'multicolor'")
+    if isinstance(A, MatrizCSR):
+        filas = A._filas_sin_diagonal()
+        return lambda x, omega: _relajacion_csr(A, b, x, omega, 0.0, 1, filas=filas)[0]
+    return lambda x, omega: _relajacion_densa(A, b, x, omega, 0.0, 1)[0]
+
+
+def _relajacion_adaptativa(A, b, x0, tolerancia, max_iter, ordenamiento,
+                           max_estimacion=50, control=None, filas_bloque=None):
+    """SOR que estima el omega optimo durante las primeras iteraciones.
+
+    Arranca con Gauss-Seidel (omega = 1). El cociente de normas euclideas
+    de diferencias sucesivas tiende al radio espectral de Gauss-Seidel, que
+    para matrices consistentemente ordenadas es rho_J^2. Cuando el cociente
+    se estabiliza (o tras max_estimacion iteraciones) se pasa a
+    omega = 2 / (1 + sqrt(1 - rho_J^2)).
+    Retorna (x, iteraciones, omega, rho_J) con rho_J = None si no se estimo.
+    """
+    control = control or _Control(tolerancia, max_iter)
+    n = len(A)
+    x = [0.0] * n if x0 is None else x0
+    omega = 1.0
+    rho_jacobi = None
+    norma_anterior = None
+    cociente_anterior = None
+    iteraciones = max_iter
+
+    # La preparacion de A (lector de disco, filas CSR, bloques de color) se hace una vez
+    lector = _LectorFilas(A, filas_bloque) if isinstance(A, np.memmap) else None
+    try:
+        barrido = _barrido_sor(A, b, ordenamiento, filas_bloque, lector)
+        for iteracion in range(max_iter):
+            x_nuevo = barrido(x, omega)
+            diferencia = np.subtract(x_nuevo, x)
+            convergio = n == 0 or control.convergio(iteracion, x_nuevo, x)
+            x = x_nuevo
+
+            if convergio:
+                iteraciones = iteracion + 1
+                break
+
+            norma = float(np.linalg.norm(diferencia))
+            if rho_jacobi is None and norma_anterior:
+                cociente = norma / norma_anterior
+                # La sensibilidad de omega crece como 1 / sqrt(1 - rho)
+                estable = (cociente_anterior is not None and cociente < 1
+                           and abs(cociente - cociente_anterior) <= 1e-3 * (1 - cociente))
+                if estable or iteracion + 1 >= max_estimacion:
+                    if cociente < 1:
+                        rho_jacobi = cociente ** 0.5
+                        omega = 2.0 / (1.0 + (1.0 - cociente) ** 0.5)
+                    else:
+                        # Sin convergencia no hay estimacion valida: se sigue con Gauss-Seidel
+                        rho_jacobi = float('nan')
+                cociente_anterior = cociente
+            norma_anterior = norma
+    finally:
+        if lector is not None:
+            lector.cerrar()
+
+    return x, iteraciones, omega, rho_jacobi
+
+
+def relajacion(A, b, x0=None, omega=1.25, tolerancia=1e-5, max_iter=100,
+               ordenamiento='lexicografico', devolver_info=False, filas_bloque=None,
+               criterio='paso', intervalo_control=1, historial=False):
+    """Metodo de relajacion (SOR) (A densa, MatrizCSR o en disco)
+
+    omega: factor de relajacion, o 'adaptativo' para estimar el radio
+    espectral de Jacobi en las primeras iteraciones y pasar al omega
+    optimo 2 / (1 + sqrt(1 - rho_J^2)).
+    ordenamiento: 'lexicografico' o 'multicolor' (ver gauss_seidel).
+    devolver_info: si es True retorna (x, iteraciones, info) con el
+    'omega' usado al final (para reutilizarlo en sistemas parecidos),
+    'radio_jacobi' estimado (solo en modo adaptativo) y 'residuo'.
+    Si A es un np.memmap se recorre por bloques de filas (ver jacobi).
+    criterio, intervalo_control e historial como en jacobi.
+    """
+    info = {}
+    control = _Control(tolerancia, max_iter, criterio, intervalo_control, historial, A, b)
+    if isinstance(A, np.memmap) and omega != 'adaptativo':
+        _verificar_ordenamiento_disco(ordenamiento)
+        x, iteraciones = _resultado_disco(
+            b, *_relajacion_disco(A, b, x0, omega, tolerancia, max_iter, filas_bloque, control))
+    elif omega == 'adaptativo':
+        x, iteraciones, omega, info['radio_jacobi'] = _relajacion_adaptativa(
+            A, b, x0, tolerancia, max_iter, ordenamiento, control=control,
+            filas_bloque=filas_bloque)
+    elif ordenamiento == 'multicolor':
+        x, iteraciones = _resultado_multicolor(A, b, x0, omega, tolerancia, max_iter, control)
+    elif ordenamiento != 'lexicografico':
+        raise ValueError("ordenamiento debe ser 'lexicografico' o 'multicolor'")
+    elif isinstance(A, MatrizCSR):
+        x, iteraciones = _relajacion_csr(A, b, x0, omega, tolerancia, max_iter, control)
+    else:
+        x, iteraciones = _relajacion_densa(A, b, x0, omega, tolerancia, max_iter, control)
+
+    info['omega'] = omega
+    return _resultado_estacionario(A, b, x, iteraciones, control, historial or devolver_info, info)
+
+
+def detectar_bloques(A, tamano_maximo=8):
+    """Limites de los bloques diagonales a partir de la estructura de A.
+
+    Agrupa filas consecutivas con el mismo patron de no nulos (las
+    incognitas de un mismo nodo, acopladas entre si y con los mismos
+    vecinos). Los grupos de mas de tamano_maximo filas se parten en partes
+    iguales. Retorna un ndarray [0, ..., n] con el inicio de cada bloque.
+    El resultado se cachea por identidad de A.
+    """
+    return _memorizar(A, ('bloques', tamano_maximo),
+                      lambda A: _calcular_bloques(A, tamano_maximo))
+
+
+def _calcular_bloques(A, tamano_maximo):
+    if isinstance(A, MatrizCSR):
+        n = A.forma[0]
+        largos = np.diff(A.punteros)
+        iguales = np.zeros(max(n - 1, 0), dtype=bool)
+        for i in np.flatnonzero(largos[1:] == largos[:-1]):
+            p, q = A.punteros[i], A.punteros[i + 1]
+            iguales[i] = np.array_equal(A.indices[p:q], A.indices[q:q + largos[i]])
+    else:
+        patron = np.asarray(A, dtype=float) != 0
+        n = len(patron)
+        iguales = np.all(patron[1:] == patron[:-1], axis=1)
+
+    cortes = np.concatenate(([0], np.flatnonzero(~iguales) + 1, [n]))
+    limites = [0]
+    for i0, i1 in zip(cortes[:-1], cortes[1:]):
+        partes = -(-(i1 - i0) // tamano_maximo)
+        limites.extend(i0 + ((i1 - i0) * np.arange(1, partes + 1)) // partes)
+    return np.array(limites, dtype=np.int64)
+
+
+def _limites_bloques(A, bloques):
+    """Normaliza bloques (None, un tamano o una lista de limites) a [0, ..., n]"""
+    n = len(A)
+    if bloques is None:
+        return detectar_bloques(A)
+    if np.isscalar(bloques):
+        return np.append(np.arange(0, n, int(bloques)), n).astype(np.int64)
+    limites = np.asarray(bloques, dtype=np.int64)
+    if limites[0] != 0 or limites[-1] != n or np.any(np.diff(limites) <= 0):
+        raise ValueError("bloques debe ser creciente, empezar en 0 y terminar en n")
+    return limites
+
+
+def _factorizar_bloques(A, limites):
+    """Factorizaciones LU de los bloques diagonales, en lotes por tamano.
+
+    Retorna un diccionario con 'grupos': lista de (indices, LU, perm) con
+    una pila por cada tamano de bloque, y 'posicion': para cada bloque el
+    par (grupo, lugar en la pila).
+    """
+    tamanos = np.diff(limites)
+    bloque_de = np.repeat(np.arange(len(tamanos)), tamanos)
+    if isinstance(A, MatrizCSR):
+        filas = np.repeat(np.arange(A.forma[0]), np.diff(A.punteros))
+        columnas, valores = A.indices, A.valores
+    else:
+        A = np.asarray(A, dtype=float)
+        filas, columnas = np.nonzero(A)
+        valores = A[filas, columnas]
+    dentro = bloque_de[filas] == bloque_de[columnas]
+    filas, columnas, valores = filas[dentro], columnas[dentro], valores[dentro]
+    bloque = bloque_de[filas]
+
+    grupos = []
+    posicion = np.empty((len(tamanos), 2), dtype=np.int64)
+    for tamano in np.unique(tamanos):
+        miembros = np.flatnonzero(tamanos == tamano)
+        lugar = np.empty(len(tamanos), dtype=np.int64)
+        lugar[miembros] = np.arange(len(miembros))
+        elegidos = tamanos[bloque] == tamano
+        b_elegidos = bloque[elegidos]
+        D = np.zeros((len(miembros), tamano, tamano))
+        D[lugar[b_elegidos], filas[elegidos] - limites[b_elegidos],
+          columnas[elegidos] - limites[b_elegidos]] = valores[elegidos]
+
+        LU, perm, validos = _factorizar_lu_lotes(D)
+        if not validos.all():
+            raise ZeroDivisionError("Hay un bloque diagonal singular")
+        posicion[miembros, 0] = len(grupos)
+        posicion[miembros, 1] = np.arange(len(miembros))
+        grupos.append((limites[miembros][:, None] + np.arange(tamano), LU, perm))
+
+    return {'grupos': grupos, 'posicion': posicion}
+
+
+def _factores_bloques(A, limites):
+    return _memorizar(A, ('bloques_lu', tuple(limites.tolist())),
+                      lambda A: _factorizar_bloques(A, limites), valores=True)
+
+
+def _resultado_bloques(A, b, x, iteraciones, limites, devolver_info):
+    if not isinstance(b, np.ndarray):
+        x = x.tolist()
+    if devolver_info:
+        return x, iteraciones, {'residuo': _norma_residuo(A, b, x), 'bloques': limites}
+    return x, iteraciones
+
+
+def jacobi_bloques(A, b, x0=None, tolerancia=1e-5, max_iter=100, bloques=None,
+                   devolver_info=False):
+    """Metodo de Jacobi por bloques (A densa o MatrizCSR)
+
+    Cada iteracion resuelve los bloques diagonales A_jj d_j = r_j, con
+    r = b - Ax, y hace x_j += d_j. Los bloques se factorizan una sola vez
+    (LU en lotes, cacheado por identidad de A y validado con una huella de
+    sus valores, asi que se refactoriza si A cambia) y las resoluciones de todos
+    los bloques del mismo tamano se hacen juntas.
+
+    bloques: None para detectarlos (detectar_bloques), un tamano fijo, o
+    la lista de limites [0, ..., n].
+    devolver_info: si es True retorna (x, iteraciones, info) con
+    'residuo' y los 'bloques' usados.
+    """
+    limites = _limites_bloques(A, bloques)
+    grupos = _factores_bloques(A, limites)['grupos']
+    producto = _operador(A)
+    b_arr = np.asarray(b, dtype=float)
+    n = len(b_arr)
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    x_nuevo = np.empty(n)
+
+    for iteracion in range(max_iter):
+        r = b_arr - producto(x)
+        for indices, LU, perm in grupos:
+            x_nuevo[indices] = x[indices] + _resolver_lu_lotes(LU, perm, r[indices])
+
+        # Calcular error
+        error = np.abs(x_nuevo - x).max() if n else 0.0
+        x, x_nuevo = x_nuevo, x
+
+        if error < tolerancia:
+            return _resultado_bloques(A, b, x, iteracion + 1, limites, devolver_info)
+
+    return _resultado_bloques(A, b, x, max_iter, limites, devolver_info)
+
+
+# Hasta este tamano un bloque se resuelve con sustitucion escalar en gauss_seidel_bloques
+_BLOQUE_ESCALAR = 16
+
+
+def _solucionador_bloque(LU, perm):
+    """Funcion r -> A_jj^-1 r de un solo bloque a partir de su LU empaquetada.
+
+    Los bloques chicos se resuelven con sustitucion escalar sobre listas
+    (sin el costo por llamada de NumPy); los grandes con la sustitucion por
+    filas de _resolver_lu_lotes. En ambos casos se usan los factores ya
+    calculados, sin refactorizar en cada barrido.
+    """
+    n = len(perm)
+    if n > _BLOQUE_ESCALAR:
+        LU, perm = LU[None], perm[None]
+        return lambda r: _resolver_lu_lotes(LU, perm, r[None])[0]
+
+    filas = LU.tolist()
+    perm = perm.tolist()
+
+    def solucionar(r):
+        r = r.tolist()
+        x = [r[p] for p in perm]
+        for i in range(1, n):
+            fila = filas[i]
+            suma = x[i]
+            for j in range(i):
+                suma -= fila[j] * x[j]
+            x[i] = suma
+        for i in range(n-1, -1, -1):
+            fila = filas[i]
+            suma = x[i]
+            for j in range(i+1, n):
+                suma -= fila[j] * x[j]
+            x[i] = suma / fila[i]
+        return x
+
+    return solucionar
+
+
+def gauss_seidel_bloques(A, b, x0=None, tolerancia=1e-5, max_iter=100, bloques=None,
+                         omega=1.0, devolver_info=False):
+    """Metodo de Gauss-Seidel (SOR con omega != 1) por bloques (A densa o MatrizCSR)
+
+    Recorre los bloques en orden; cada uno usa los valores ya actualizados
+    de los anteriores y resuelve su bloque diagonal con la factorizacion
+    cacheada (ver jacobi_bloques para bloques y devolver_info).
+    """
+    limites = _limites_bloques(A, bloques)
+    factores = _factores_bloques(A, limites)
+    b_arr = np.asarray(b, dtype=float)
+    n = len(b_arr)
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    x_viejo = np.empty(n)
+
+    if isinstance(A, MatrizCSR):
+        punteros, indices, valores = A.punteros, A.indices, A.valores
+        fila_local = (np.repeat(np.arange(n), np.diff(punteros))
+                      - np.repeat(limites[:-1], punteros[limites[1:]] - punteros[limites[:-1]]))
+
+        def residuo_bloque(i0, i1):
+            p, q = punteros[i0], punteros[i1]
+            return b_arr[i0:i1] - np.bincount(fila_local[p:q], valores[p:q] * x[indices[p:q]],
+                                              minlength=i1 - i0)
+    else:
+        A_arr = np.asarray(A, dtype=float)
+
+        def residuo_bloque(i0, i1):
+            return b_arr[i0:i1] - A_arr[i0:i1] @ x
+
+    bloques_rango = []
+    for j, (g, lugar) in enumerate(factores['posicion'].tolist()):
+        _, LU, perm = factores['grupos'][g]
+        bloques_rango.append((int(limites[j]), int(limites[j + 1]),
+                              _solucionador_bloque(LU[lugar], perm[lugar])))
+    for iteracion in range(max_iter):
+        np.copyto(x_viejo, x)
+        for i0, i1, solucionar in bloques_rango:
+            x[i0:i1] += solucionar(omega * residuo_bloque(i0, i1))
+
+        # Calcular error
+        error = np.abs(x - x_viejo).max() if n else 0.0
+
+        if error < tolerancia:
+            return _resultado_bloques(A, b, x, iteracion + 1, limites, devolver_info)
+
+    return _resultado_bloques(A, b, x, max_iter, limites, devolver_info)
+
+
+def crear_barrido(A, b, metodo='jacobi', omega=1.25, ordenamiento='lexicografico'):
+    """Un barrido del metodo estacionario como funcion x -> g(x) sobre ndarrays.
+
+    metodo: 'jacobi', 'gauss_seidel' o 'relajacion' (con omega y
+    ordenamiento como en relajacion). El punto fijo de g es la solucion
+    de Ax = b; sirve de entrada a aceleracion_anderson y
+    aceleracion_chebyshev.
+    """
+    b_arr = np.asarray(b, dtype=float)
+    if metodo == 'jacobi':
+        if isinstance(A, np.memmap):
+            return lambda x: _jacobi_disco(A, b_arr, x, 0.0, 1, None)[0]
+        producto = _operador(A)
+        diagonal = A.diagonal() if isinstance(A, MatrizCSR) else np.diag(np.asarray(A, dtype=float))
+        inv_diagonal = 1.0 / diagonal
+        return lambda x: x + inv_diagonal * (b_arr - producto(x))
+    if metodo == 'gauss_seidel':
+        omega = 1
+    elif metodo != 'relajacion':
+        raise ValueError("metodo debe ser 'jacobi', 'gauss_seidel' o 'relajacion'")
+
+    if isinstance(A, np.memmap) or ordenamiento == 'multicolor':
+        barrido = _barrido_sor(A, b_arr, ordenamiento, None, None)
+        return lambda x: barrido(x, omega)
+    # Las listas se recorren mas rapido que los ndarrays en el barrido escalar
+    if not isinstance(A, MatrizCSR):
+        A = np.asarray(A, dtype=float).tolist()
+    barrido = _barrido_sor(A, b_arr.tolist(), ordenamiento, None, None)
+    return lambda x: np.array(barrido(x.tolist(), omega))
+
+
+def aceleracion_anderson(barrido, x0, tolerancia=1e-5, max_iter=100, profundidad=5,
+                         devolver_info=False):
+    """Mezcla de Anderson sobre una iteracion de punto fijo x -> g(x).
+
+    Con f_k = g(x_k) - x_k, cada paso busca la combinacion de las ultimas
+    'profundidad' diferencias de f que minimiza el residuo (minimos
+    cuadrados) y la aplica a los valores de g:
+        x_{k+1} = g(x_k) - dG gamma,  gamma = argmin ||f_k - dF gamma||
+    Las diferencias se guardan en dos buffers circulares de n x profundidad,
+    asi que la memoria no crece con las iteraciones.
+
+    Se detiene, como los metodos estacionarios, cuando ||g(x) - x||_inf <
+    tolerancia. Cada iteracion cuesta un barrido.
+    Retorna (x, iteraciones), o (x, iteraciones, info) con 'historial' de
+    ||g(x) - x||_inf por iteracion si devolver_info es True.
+    """
+    x = np.array(x0, dtype=float)
+    n = len(x)
+    dF = np.empty((n, profundidad))
+    dG = np.empty((n, profundidad))
+    pasos = np.empty(max_iter)
+    f_anterior = g_anterior = None
+    g = x
+
+    iteraciones = max_iter
+    for k in range(max_iter):
+        g = barrido(x)
+        f = g - x
+        pasos[k] = np.abs(f).max() if n else 0.0
+        if pasos[k] < tolerancia:
+            iteraciones = k + 1
+            break
+
+        if f_anterior is None or profundidad == 0:
+            x = g
+        else:
+            j = (k - 1) % profundidad
+            np.subtract(f, f_anterior, out=dF[:, j])
+            np.subtract(g, g_anterior, out=dG[:, j])
+            columnas = min(k, profundidad)
+            gamma = np.linalg.lstsq(dF[:, :columnas], f, rcond=None)[0]
+            x = g - dG[:, :columnas] @ gamma
+        f_anterior, g_anterior = f, g
+
+    if devolver_info:
+        return g, iteraciones, {'historial': pasos[:iteraciones]}
+    return g, iteraciones
+
+
+def aceleracion_chebyshev(barrido, x0, limites, tolerancia=1e-5, max_iter=100,
+                          devolver_info=False):
+    """Semi-iteracion de Chebyshev sobre una iteracion lineal x -> g(x) = Gx + c.
+
+    limites = (menor, mayor): cotas reales de los autovalores de G, con
+    mayor < 1 (para Jacobi con A simetrica, (-rho_J, rho_J); para
+    Gauss-Seidel con A SPD consistentemente ordenada, (0, rho_J^2)).
+    Con gamma = 2 / (2 - menor - mayor) y rho = (mayor - menor) / (2 - menor - mayor):
+        x_{k+1} = w_{k+1} (x_k + gamma (g(x_k) - x_k) - x_{k-1}) + x_{k-1}
+    donde w_{k+1} = 1 / (1 - rho^2 w_k / 4). Guarda solo dos iterados.
+
+    Criterio de parada, retorno e info como en aceleracion_anderson.
+    """
+    menor, mayor = limites
+    if not menor <= mayor < 1:
+        raise ValueError("limites debe cumplir menor <= mayor < 1")
+    gamma = 2.0 / (2.0 - menor - mayor)
+    rho = (mayor - menor) / (2.0 - menor - mayor)
+
+    x = np.array(x0, dtype=float)
+    n = len(x)
+    x_anterior = None
+    w = 1.0
+    pasos = np.empty(max_iter)
+    g = x
+
+    iteraciones = max_iter
+    for k in range(max_iter):
+        g = barrido(x)
+        f = g - x
+        pasos[k] = np.abs(f).max() if n else 0.0
+        if pasos[k] < tolerancia:
+            iteraciones = k + 1
+            break
+
+        if x_anterior is None:
+            x, x_anterior = x + gamma * f, x
+        else:
+            w = 1.0 / (1.0 - rho ** 2 / 2) if k == 1 else 1.0 / (1.0 - rho ** 2 * w / 4)
+            x, x_anterior = w * (x + gamma * f - x_anterior) + x_anterior, x
+
+    if devolver_info:
+        return g, iteraciones, {'historial': pasos[:iteraciones]}
+    return g, iteraciones
+
+
+def acelerar(A, b, x0=None, metodo='jacobi', aceleracion='anderson', tolerancia=1e-5,
+             max_iter=100, omega=1.25, ordenamiento='lexicografico', profundidad=5,
+             limites=None, devolver_info=False):
+    """Jacobi, Gauss-Seidel o SOR acelerados con Anderson o Chebyshev
+
+    metodo, omega y ordenamiento eligen el barrido (ver crear_barrido);
+    aceleracion es 'anderson' (con 'profundidad' diferencias guardadas) o
+    'chebyshev' (requiere los 'limites' del espectro de la iteracion).
+    Mismo criterio de parada que jacobi. x es un ndarray si b lo es.
+    Con devolver_info retorna (x, iteraciones, info) con 'historial' de
+    ||g(x) - x||_inf por iteracion y 'residuo'.
+    """
+    barrido = crear_barrido(A, b, metodo, omega, ordenamiento)
+    x0 = np.zeros(len(b)) if x0 is None else x0
+    if aceleracion == 'anderson':
+        x, iteraciones, info = aceleracion_anderson(barrido, x0, tolerancia, max_iter,
+                                                    profundidad, devolver_info=True)
+    elif aceleracion == 'chebyshev':
+        if limites is None:
+            raise ValueError("La aceleracion de Chebyshev requiere los limites del espectro")
+        x, iteraciones, info = aceleracion_chebyshev(barrido, x0, limites, tolerancia, max_iter,
+                                                     devolver_info=True)
+    else:
+        raise ValueError("aceleracion debe ser 'anderson' o 'chebyshev'")
+
+    if devolver_info:
+        info['residuo'] = _norma_residuo(A, b, x)
+    if not isinstance(b, np.ndarray):
+        x = x.tolist()
+    if devolver_info:
+        return x, iteraciones, info
+    return x, iteraciones
+
+
+def _operador(A):
+    """Funcion v -> A @ v para A en lista, ndarray, MatrizCSR o funcion matvec"""
+    if callable(A):
+        return A
+    if isinstance(A, MatrizCSR):
+        return A.producto
+    M = np.asarray(A, dtype=float)
+    return lambda v: M @ v
+
+
+class _TriangularDispersa:
+    """Sustitucion triangular dispersa con planificacion por niveles.
+
+    Las filas de un mismo nivel no dependen entre si y se resuelven juntas
+    como un bloque vectorizado; en grillas hay O(sqrt(n)) niveles.
+    """
+
+    def __init__(self, estricta, diagonal, inferior=True):
+        n = len(diagonal)
+        indices = estricta.indices.tolist()
+        punteros = estricta.punteros.tolist()
+        orden = range(n) if inferior else range(n-1, -1, -1)
+
+        nivel = [0] * n
+        for i in orden:
+            dependencias = indices[punteros[i]:punteros[i+1]]
+            if dependencias:
+                nivel[i] = 1 + max(nivel[j] for j in dependencias)
+
+        nivel = np.array(nivel)
+        self.niveles = []
+        for l in range(nivel.max() + 1 if n else 0):
+            filas = np.flatnonzero(nivel == l)
+            self.niveles.append((filas, estricta.submatriz_filas(filas),
+                                 1.0 / diagonal[filas]))
+        self.n = n
+
+    def resolver(self, r):
+        x = np.zeros(self.n)
+        for filas, bloque, inv_diagonal in self.niveles:
+            x[filas] = (r[filas] - bloque.producto(x)) * inv_diagonal
+        return x
+
+
+def precondicionador_jacobi(A):
+    """Precondicionador diagonal: devuelve la funcion r -> D^-1 r"""
+    if isinstance(A, MatrizCSR):
+        diagonal = A.diagonal()
+    else:
+        diagonal = np.diag(np.asarray(A, dtype=float)).copy()
+    if np.any(diagonal == 0):
+        raise ValueError("La diagonal tiene ceros: no se puede usar el precondicionador de Jacobi")
+    inv_diagonal = 1.0 / diagonal
+    return lambda r: inv_diagonal * r
+
+
+def precondicionador_cholesky_incompleto(A, desplazamiento=0.0):
+    """Precondicionador de Cholesky incompleto IC(0) para matrices SPD.
+
+    L conserva el patron de no nulos de la parte triangular inferior de A.
+    Si aparece un pivote no positivo se reintenta factorizando
+    A + alfa*diag(A) con alfa creciente. Devuelve la funcion r -> (L L^T)^-1 r.
+    """
+    M = A if isinstance(A, MatrizCSR) else MatrizCSR.desde_densa(A)
+    n = len(M)
+    valores = M.valores.tolist()
+    indices = M.indices.tolist()
+    punteros = M.punteros.tolist()
+
+    alfa = desplazamiento
+    while True:
+        L = [dict() for _ in range(n)]
+        diagonal = [0.0] * n
+        fallo = False
+        for i in range(n):
+            fila = L[i]
+            a_ii = 0.0
+            for k in range(punteros[i], punteros[i+1]):
+                j = indices[k]
+                if j < i:
+                    fila[j] = valores[k]
+                elif j == i:
+                    a_ii = valores[k] * (1.0 + alfa)
+            # Columnas en orden creciente: L[i][j] usa los L[i][m] con m < j
+            for j in sorted(fila):
+                fila_j = L[j]
+                suma = 0.0
+                for m, l_im in fila.items():
+                    if m < j and m in fila_j:
+                        suma += l_im * fila_j[m]
+                fila[j] = (fila[j] - suma) / diagonal[j]
+            pivote = a_ii - sum(l * l for l in fila.values())
+            if pivote <= 0:
+                fallo = True
+                break
+            diagonal[i] = pivote ** 0.5
+        if not fallo:
+            break
+        alfa = 1e-3 if alfa == 0 else 10 * alfa
+
+    filas = [i for i in range(n) for _ in L[i]]
+    columnas = [j for i in range(n) for j in L[i]]
+    datos = [v for i in range(n) for v in L[i].values()]
+    estricta = MatrizCSR.desde_tripletes(filas, columnas, datos, (n, n))
+    diagonal = np.array(diagonal)
+    inferior = _TriangularDispersa(estricta, diagonal, inferior=True)
+    superior = _TriangularDispersa(estricta.transpuesta(), diagonal, inferior=False)
+    return lambda r: superior.resolver(inferior.resolver(r))
+
+
+_PRECONDICIONADORES = {
+    'jacobi': precondicionador_jacobi,
+    'cholesky_incompleto': precondicionador_cholesky_incompleto,
+}
+
+
+def _crear_precondicionador(A, precondicionador):
+    """Traduce None, un nombre o una funcion r -> M^-1 r a una funcion"""
+    if precondicionador is None:
+        return lambda r: r
+    if callable(precondicionador):
+        return precondicionador
+    if precondicionador not in _PRECONDICIONADORES:
+        raise ValueError(f"Precondicionador desconocido: {precondicionador}")
+    if callable(A):
+        raise ValueError("Con A dada como funcion el precondicionador tambien debe ser una funcion")
+    return _PRECONDICIONADORES[precondicionador](A)
+
+
+def gradiente_conjugado(A, b, x0=None, tolerancia=1e-5, max_iter=None,
+                        precondicionador=None, historial=False,
+                        devolver_info=False):
+    """Gradiente conjugado precondicionado (PCG) para matrices SPD
+
+    A puede ser densa (lista o ndarray) o MatrizCSR. Se detiene cuando
+    ||b - Ax|| <= tolerancia * ||b||.
+
+    precondicionador: None, 'jacobi', 'cholesky_incompleto' o una funcion
+    r -> M^-1 r.
+    max_iter: por defecto 10 * n.
+    historial: si es True guarda la norma del residuo de cada iteracion.
+
+    Retorna (x, iteraciones). Si historial o devolver_info son True retorna
+    (x, iteraciones, info) con 'residuo' y, si se pidio, 'historial'.
+    """
+    producto = _operador(A)
+    aplicar_M = _crear_precondicionador(A, precondicionador)
+    b_arr = np.asarray(b, dtype=float)
+    n = len(b_arr)
+    if max_iter is None:
+        max_iter = 10 * n
+
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    r = b_arr - producto(x)
+    norma_b = np.linalg.norm(b_arr)
+    umbral = tolerancia * (norma_b if norma_b > 0 else 1.0)
+    residuos = np.empty(max_iter + 1)
+    residuos[0] = norma_r = np.linalg.norm(r)
+
+    iteraciones = 0
+    if norma_r > umbral:
+        z = aplicar_M(r)
+        p = z.copy()
+        rz = r @ z
+        for iteraciones in range(1, max_iter + 1):
+            Ap = producto(p)
+            alfa = rz / (p @ Ap)
+            x += alfa * p
+            r -= alfa * Ap
+            residuos[iteraciones] = norma_r = np.linalg.norm(r)
+            if norma_r <= umbral:
+                break
+            z = aplicar_M(r)
+            rz_nuevo = r @ z
+            p *= rz_nuevo / rz
+            p += z
+            rz = rz_nuevo
+
+    return _resultado_krylov(b, x, iteraciones, norma_r, residuos,
+                             historial, devolver_info)
+
+
+def _resultado_krylov(b, x, iteraciones, norma_r, residuos, historial, devolver_info):
+    """Arma el retorno comun de los metodos de Krylov"""
+    if not isinstance(b, np.ndarray):
+        x = x.tolist()
+    if historial or devolver_info:
+        info = {'residuo': float(norma_r)}
+        if historial:
+            info['historial'] = residuos[:iteraciones + 1]
+        return x, iteraciones, info
+    return x, iteraciones
+
+
+def gmres(A, b, x0=None, tolerancia=1e-5, reinicio=30, max_iter=None,
+          precondicionador=None, historial=False, devolver_info=False):
+    """GMRES reiniciado (GMRES(m)) para sistemas no simetricos
+
+    A puede ser densa, MatrizCSR o una funcion v -> A @ v (sin matriz).
+    Usa precondicionamiento por derecha, asi que el criterio
+    ||b - Ax|| <= tolerancia * ||b|| se aplica al residuo verdadero.
+    La base de Krylov tiene a lo sumo reinicio + 1 vectores, por lo que la
+    memoria queda acotada por el largo de reinicio.
+
+    precondicionador: None, 'jacobi', 'cholesky_incompleto' o una funcion
+    r -> M^-1 r (obligatoria si A es una funcion).
+    max_iter: total de iteraciones internas, por defecto 10 * n.
+
+    Retorna (x, iteraciones) o (x, iteraciones, info) como gradiente_conjugado;
+    el historial guarda la estimacion del residuo de cada iteracion.
+    """
+    producto = _operador(A)
+    aplicar_M = _crear_precondicionador(A, precondicionador)
+    b_arr = np.asarray(b, dtype=float)
+    n = len(b_arr)
+    if max_iter is None:
+        max_iter = 10 * n
+    m = max(1, min(reinicio, n))
+
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    norma_b = np.linalg.norm(b_arr)
+    umbral = tolerancia * (norma_b if norma_b > 0 else 1.0)
+    residuos = np.empty(max_iter + 1)
+
+    # Espacio de trabajo acotado por el largo de reinicio
+    V = np.empty((m + 1, n))
+    H = np.zeros((m + 1, m))
+    g = np.zeros(m + 1)
+    cs = np.zeros(m)
+    sn = np.zeros(m)
+
+    r = b_arr - producto(x)
+    residuos[0] = norma_r = np.linalg.norm(r)
+    iteraciones = 0
+
+    while norma_r > umbral and iteraciones < max_iter:
+        H[:] = 0.0
+        g[:] = 0.0
+        g[0] = norma_r
+        V[0] = r / norma_r
+
+        k = 0
+        for j in range(m):
+            w = producto(aplicar_M(V[j]))
+
+            # Gram-Schmidt clasico con reortogonalizacion (CGS2)
+            h = V[:j+1] @ w
+            w -= V[:j+1].T @ h
+            correccion = V[:j+1] @ w
+            w -= V[:j+1].T @ correccion
+            H[:j+1, j] = h + correccion
+            H[j+1, j] = np.linalg.norm(w)
+            if H[j+1, j] > 0:
+                V[j+1] = w / H[j+1, j]
+
+            # Aplicar las rotaciones de Givens previas y calcular la nueva
+            for i in range(j):
+                temporal = cs[i] * H[i, j] + sn[i] * H[i+1, j]
+                H[i+1, j] = -sn[i] * H[i, j] + cs[i] * H[i+1, j]
+                H[i, j] = temporal
+            radio = np.hypot(H[j, j], H[j+1, j])
+            cs[j] = H[j, j] / radio if radio > 0 else 1.0
+            sn[j] = H[j+1, j] / radio if radio > 0 else 0.0
+            H[j, j] = radio
+            H[j+1, j] = 0.0
+            g[j+1] = -sn[j] * g[j]
+            g[j] = cs[j] * g[j]
+
+            k = j + 1
+            iteraciones += 1
+            residuos[iteraciones] = abs(g[j+1])
+            if abs(g[j+1]) <= umbral or iteraciones >= max_iter or H[j, j] == 0:
+                break
+
+        # Resolver el sistema triangular H y = g y actualizar x
+        y = np.zeros(k)
+        for i in range(k-1, -1, -1):
+            if H[i, i] != 0:
+                y[i] = (g[i] - H[i, i+1:k] @ y[i+1:]) / H[i, i]
+        x += aplicar_M(V[:k].T @ y)
+
+        r = b_arr - producto(x)
+        norma_r = np.linalg.norm(r)
+        if k and H[k-1, k-1] == 0:
+            # Ruptura sin progreso posible
+            break
+
+    return _resultado_krylov(b, x, iteraciones, norma_r, residuos,
+                             historial, devolver_info)
+
+
+def bicgstab(A, b, x0=None, tolerancia=1e-5, max_iter=None,
+             precondicionador=None, historial=False, devolver_info=False):
+    """Gradiente biconjugado estabilizado (BiCGSTAB) para sistemas no simetricos
+
+    Mismos argumentos y retorno que gmres, sin reinicio: usa una cantidad
+    fija de vectores de trabajo. Se detiene si ocurre una ruptura (rho u
+    omega nulos) y lo indica en info['ruptura'].
+    """
+    producto = _operador(A)
+    aplicar_M = _crear_precondicionador(A, precondicionador)
+    b_arr = np.asarray(b, dtype=float)
+    n = len(b_arr)
+    if max_iter is None:
+        max_iter = 10 * n
+
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    norma_b = np.linalg.norm(b_arr)
+    umbral = tolerancia * (norma_b if norma_b > 0 else 1.0)
+    residuos = np.empty(max_iter + 1)
+
+    r = b_arr - producto(x)
+    r_sombra = r.copy()
+    residuos[0] = norma_r = np.linalg.norm(r)
+    p = np.zeros(n)
+    v = np.zeros(n)
+    rho = alfa = omega = 1.0
+    ruptura = False
+
+    iteraciones = 0
+    while norma_r > umbral and iteraciones < max_iter:
+        rho_nuevo = r_sombra @ r
+        if rho_nuevo == 0 or omega == 0:
+            ruptura = True
+            break
+        beta = (rho_nuevo / rho) * (alfa / omega)
+        p -= omega * v
+        p *= beta
+        p += r
+        p_sombrero = aplicar_M(p)
+        v = producto(p_sombrero)
+        alfa = rho_nuevo / (r_sombra @ v)
+        s = r - alfa * v
+
+        iteraciones += 1
+        if np.linalg.norm(s) <= umbral:
+            x += alfa * p_sombrero
+            r = s
+            residuos[iteraciones] = norma_r = np.linalg.norm(r)
+            break
+
+        s_sombrero = aplicar_M(s)
+        t = producto(s_sombrero)
+        tt = t @ t
+        omega = (t @ s) / tt if tt > 0 else 0.0
+        x += alfa * p_sombrero + omega * s_sombrero
+        r = s - omega * t
+        residuos[iteraciones] = norma_r = np.linalg.norm(r)
+        rho = rho_nuevo
+
+    resultado = _resultado_krylov(b, x, iteraciones, norma_r, residuos,
+                                  historial, devolver_info)
+    if len(resultado) == 3:
+        resultado[2]['ruptura'] = ruptura
+    return resultado
+
+
+def matriz_poisson(forma):
+    """Matriz de -laplaciano con condiciones de Dirichlet en [0, 1]^d.
+
+    forma es un entero n (grilla 1-D de n puntos interiores) o una tupla
+    (nx, ny) para una grilla 2-D con el esquema de 5 puntos. El paso es
+    h = 1 / (n + 1) en cada direccion y las incognitas se numeran con
+    k = i * ny + j. Retorna una MatrizCSR.
+    """
+    forma = (forma,) if np.isscalar(forma) else tuple(forma)
+    if len(forma) not in (1, 2):
+        raise ValueError("Solo se admiten grillas 1-D y 2-D")
+    indices = np.arange(int(np.prod(forma))).reshape(forma)
+    filas, columnas, valores = [indices.ravel()], [indices.ravel()], []
+    diagonal = np.zeros(indices.size)
+
+    for eje, n_eje in enumerate(forma):
+        inv_h2 = float(n_eje + 1) ** 2
+        diagonal += 2.0 * inv_h2
+        # Vecinos a izquierda y derecha a lo largo del eje
+        izquierda = np.take(indices, np.arange(n_eje - 1), axis=eje).ravel()
+        derecha = np.take(indices, np.arange(1, n_eje), axis=eje).ravel()
+        filas += [izquierda, derecha]
+        columnas += [derecha, izquierda]
+        valores += [np.full(2 * len(izquierda), -inv_h2)]
+
+    return MatrizCSR.desde_tripletes(np.concatenate(filas), np.concatenate(columnas),
+                                     np.concatenate([diagonal] + valores),
+                                     (indices.size, indices.size))
+
+
+def restriccion(v, forma):
+    """Restriccion por ponderacion completa de una grilla fina a la gruesa.
+
+    Cada dimension de n >= 3 puntos pasa a m = (n - 1) // 2 puntos, los de
+    indice impar de la fina. Con n = 2m + 1 las grillas quedan anidadas;
+    con n par la restriccion es la transpuesta de prolongacion (escalada
+    por 1/2), que interpola los dos ultimos puntos finos hacia el borde.
+    v es el vector aplanado de la grilla fina.
+    """
+    V = np.asarray(v, dtype=float).reshape(forma)
+    for eje in range(V.ndim):
+        n = V.shape[eje]
+        m = (n - 1) // 2
+        V = np.moveaxis(V, eje, 0)
+        gruesa = 0.25 * V[0:2*m-1:2] + 0.5 * V[1:2*m:2] + 0.25 * V[2:2*m+1:2]
+        if n % 2 == 0:
+            gruesa[-1] += V[2*m] / 12 + V[2*m+1] / 6
+        V = np.moveaxis(gruesa, 0, eje)
+    return V.ravel()
+
+
+def prolongacion(v, forma):
+    """Prolongacion por interpolacion (bi)lineal a la grilla fina de forma dada"""
+    forma = (forma,) if np.isscalar(forma) else tuple(forma)
+    V = np.asarray(v, dtype=float).reshape([(n - 1) // 2 for n in forma])
+    for eje, n in enumerate(forma):
+        m = (n - 1) // 2
+        V = np.moveaxis(V, eje, 0)
+        fina = np.zeros((n,) + V.shape[1:])
+        fina[1:2*m:2] = V
+        fina[2:2*m-1:2] = 0.5 * (V[:-1] + V[1:])
+        fina[0] = 0.5 * V[0]
+        if n % 2:
+            fina[2*m] = 0.5 * V[-1]
+        else:
+            # El borde esta a 3 pasos finos del ultimo punto grueso
+            fina[2*m] = V[-1] * (2 / 3)
+            fina[2*m+1] = V[-1] / 3
+        V = np.moveaxis(fina, 0, eje)
+    return V.ravel()
+
+
+def _producto_csr(A, B):
+    """Producto A @ B de dos MatrizCSR"""
+    filas_A = np.repeat(np.arange(A.forma[0]), np.diff(A.punteros))
+    largos = np.diff(B.punteros)[A.indices]
+    desplazamientos = np.zeros(len(largos), dtype=np.int64)
+    np.cumsum(largos[:-1], out=desplazamientos[1:])
+    posiciones = np.repeat(B.punteros[A.indices] - desplazamientos, largos) + np.arange(largos.sum())
+    return MatrizCSR.desde_tripletes(np.repeat(filas_A, largos), B.indices[posiciones],
+                                     np.repeat(A.valores, largos) * B.valores[posiciones],
+                                     (A.forma[0], B.forma[1]))
+
+
+def _matriz_prolongacion(forma):
+    """prolongacion(., forma) como MatrizCSR de (fina x gruesa)"""
+    filas, columnas, valores = np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64), np.ones(1)
+    for n in forma:
+        m = (n - 1) // 2
+        k = np.arange(m)
+        # El punto grueso k esta en el fino 2k + 1 y aporta la mitad a sus vecinos
+        filas_eje = np.concatenate([2 * k + 1, 2 * k, 2 * k + 2])
+        columnas_eje = np.concatenate([k, k, k])
+        valores_eje = np.concatenate([np.ones(m), np.full(2 * m, 0.5)])
+        if n % 2 == 0:
+            filas_eje = np.append(filas_eje, n - 1)
+            columnas_eje = np.append(columnas_eje, m - 1)
+            valores_eje[-1] = 2 / 3
+            valores_eje = np.append(valores_eje, 1 / 3)
+        # Producto de Kronecker con las dimensiones ya procesadas
+        filas = (filas[:, None] * n + filas_eje[None, :]).ravel()
+        columnas = (columnas[:, None] * m + columnas_eje[None, :]).ravel()
+        valores = (valores[:, None] * valores_eje[None, :]).ravel()
+    n_fina = int(np.prod(forma))
+    n_gruesa = int(np.prod([(n - 1) // 2 for n in forma]))
+    return MatrizCSR.desde_tripletes(filas, columnas, valores, (n_fina, n_gruesa))
+
+
+# Jerarquias de multigrid recientes: (forma, operador, tamano_grueso) -> (niveles, LU gruesa)
+_CACHE_MULTIGRID = OrderedDict()
+_TAMANO_CACHE_MULTIGRID = 8
+
+# Incognitas maximas de la grilla mas gruesa, que se factoriza densa
+MAX_GRUESO_MULTIGRID = 4096
+
+
+def _jerarquia_multigrid(forma, operador, tamano_grueso):
+    """(niveles, LU de la grilla mas gruesa); niveles va de la fina a la gruesa"""
+    clave = (forma, operador, tamano_grueso)
+    if clave in _CACHE_MULTIGRID:
+        _CACHE_MULTIGRID.move_to_end(clave)
+        return _CACHE_MULTIGRID[clave]
+
+    def operador_csr(forma):
+        A = operador(forma)
+        return A if isinstance(A, MatrizCSR) else MatrizCSR.desde_densa(np.asarray(A, dtype=float))
+
+    niveles = [(forma, operador_csr(forma))]
+    while int(np.prod(forma)) > tamano_grueso and all(n >= 3 for n in forma):
+        fina, A = forma, niveles[-1][1]
+        forma = tuple((n - 1) // 2 for n in fina)
+        if all(n % 2 == 1 for n in fina):
+            niveles.append((forma, operador_csr(forma)))
+        else:
+            # Con alguna dimension par las grillas no quedan anidadas y operador(forma)
+            # no representa bien el problema grueso: se usa el operador de Galerkin R A P
+            P = _matriz_prolongacion(fina)
+            R = P.transpuesta()
+            R.valores *= 0.5 ** len(fina)
+            niveles.append((forma, _producto_csr(R, _producto_csr(A, P))))
+    n_grueso = int(np.prod(forma))
+    if n_grueso > MAX_GRUESO_MULTIGRID:
+        raise ValueError(f"la grilla mas gruesa {forma} tiene {n_grueso} incognitas "
+                         f"(maximo {MAX_GRUESO_MULTIGRID}); hace falta al menos 3 puntos "
+                         "por dimension para seguir engrosando")
+    A_gruesa = niveles[-1][1]
+    grueso = FactorizacionLU(A_gruesa.a_densa())
+
+    _CACHE_MULTIGRID[clave] = (niveles, grueso)
+    if len(_CACHE_MULTIGRID) > _TAMANO_CACHE_MULTIGRID:
+        _CACHE_MULTIGRID.popitem(last=False)
+    return niveles, grueso
+
+
+def multigrid(b, forma, x0=None, tolerancia=1e-8, max_ciclos=50, ciclo='V',
+              suavizados=(2, 2), omega=1.0, operador=matriz_poisson,
+              tamano_grueso=64, devolver_info=False):
+    """Multigrid geometrico (ciclos V o W) para problemas tipo Poisson.
+
+    Sobre grillas 1-D o 2-D estructuradas con forma n o (nx, ny). Cada
+    dimension se engrosa a (n - 1) // 2 puntos hasta tamano_grueso
+    incognitas o hasta que alguna tenga menos de 3 puntos. Los niveles con
+    todas las dimensiones impares (n = 2^k - 1 es el caso ideal) usan
+    operador(forma) (por defecto matriz_poisson; si devuelve una matriz
+    densa se convierte a MatrizCSR); si hay alguna par, el operador grueso
+    es el de Galerkin R A P. Se suaviza con relajacion
+    multicolor (Gauss-Seidel rojo-negro si omega = 1), se transfiere con
+    restriccion/prolongacion y la grilla mas gruesa se resuelve con
+    FactorizacionLU; si tiene mas de MAX_GRUESO_MULTIGRID incognitas se
+    lanza ValueError. Las jerarquias se cachean (las ultimas
+    _TAMANO_CACHE_MULTIGRID) por forma, operador y tamano_grueso.
+
+    suavizados: cantidad de barridos antes y despues de corregir.
+    Se detiene cuando ||b - Ax|| <= tolerancia * ||b||. Retorna
+    (x, ciclos) o (x, ciclos, info) con 'residuo', 'historial' y
+    'factor_convergencia' medio por ciclo.
+    """
+    if ciclo not in ('V', 'W'):
+        raise ValueError("ciclo debe ser 'V' o 'W'")
+    forma = (forma,) if np.isscalar(forma) else tuple(forma)
+    gamma = 1 if ciclo == 'V' else 2
+    pre, post = suavizados
+
+    niveles, grueso = _jerarquia_multigrid(forma, operador, tamano_grueso)
+
+    # Bloques de color de cada nivel, armados una vez por llamada
+    bloques = [_bloques_multicolor(A) for _, A in niveles[:-1]]
+
+    def suavizar(nivel, f, x, barridos):
+        if barridos == 0:
+            return x
+        x, _ = _relajacion_multicolor(niveles[nivel][1], f, x, omega, 0.0, barridos,
+                                      bloques=bloques[nivel])
+        return x
+
+    def ciclo_recursivo(nivel, x, f):
+        forma_nivel, A = niveles[nivel]
+        if nivel == len(niveles) - 1:
+            return grueso.resolver(f)
+        x = suavizar(nivel, f, x, pre)
+        r_grueso = restriccion(f - A.producto(x), forma_nivel)
+        e_grueso = np.zeros(len(r_grueso))
+        for _ in range(gamma):
+            e_grueso = ciclo_recursivo(nivel + 1, e_grueso, r_grueso)
+        x = x + prolongacion(e_grueso, forma_nivel)
+        return suavizar(nivel, f, x, post)
+
+    A = niveles[0][1]
+    b_arr = np.asarray(b, dtype=float).ravel()
+    x = np.zeros(len(b_arr)) if x0 is None else np.array(x0, dtype=float).ravel()
+    norma_b = np.linalg.norm(b_arr)
+    umbral = tolerancia * (norma_b if norma_b > 0 else 1.0)
+    residuos = np.empty(max_ciclos + 1)
+    residuos[0] = norma_r = np.linalg.norm(b_arr - A.producto(x))
+
+    ciclos = 0
+    while norma_r > umbral and ciclos < max_ciclos:
+        x = ciclo_recursivo(0, x, b_arr)
+        ciclos += 1
+        residuos[ciclos] = norma_r = np.linalg.norm(b_arr - A.producto(x))
+
+    if not isinstance(b, np.ndarray):
+        x = x.tolist()
+    if devolver_info:
+        factor = (residuos[ciclos] / residuos[0]) ** (1.0 / ciclos) if ciclos and residuos[0] > 0 else 0.0
+        return x, ciclos, {'residuo': float(norma_r), 'historial': residuos[:ciclos + 1],
+                           'factor_convergencia': float(factor)}
+    return x, ciclos
+
+
+# Seleccion automatica del metodo
+
+# Orden a partir del cual un sistema denso SPD o diagonal dominante se
+# resuelve iterando (O(n^2) por iteracion) en lugar de factorizar (O(n^3))
+UMBRAL_DIRECTO = 2000
+
+# Fraccion de no nulos por debajo de la cual una matriz densa se trata como dispersa
+UMBRAL_DISPERSA = 0.05
+
+
+def analizar_matriz(A):
+    """Caracteristicas de A que deciden el metodo de resolucion.
+
+    Retorna un diccionario con 'n', 'nnz', 'densidad', 'inferiores' y
+    'superiores' (ancho de banda), 'simetrica', 'diagonal_positiva',
+    'dominante' (estrictamente diagonal dominante por filas),
+    'spd_probable' (ver es_spd_probable), 'dispersa', 'en_disco' y
+    'norma_inf' (maxima suma absoluta por filas). Cuesta O(n^2), u O(nnz)
+    para MatrizCSR. Se cachea por identidad de A junto con una huella de
+    sus valores, asi que se recalcula si A se modifica in situ.
+    """
+    return dict(_memorizar(A, 'analisis', _calcular_analisis, valores=True))
+
+
+def _bloques_no_nulos(A):
+    """Itera (filas, columnas, valores) de los no nulos de A por bloques de filas"""
+    if isinstance(A, MatrizCSR):
+        yield np.repeat(np.arange(A.forma[0]), np.diff(A.punteros)), A.indices, A.valores
+        return
+    if isinstance(A, np.memmap):
+        lector = _LectorFilas(A)
+        try:
+            for i0, _, filas in lector.bloques():
+                r, c = np.nonzero(filas)
+                yield r + i0, c, filas[r, c]
+        finally:
+            lector.cerrar()
+        return
+    A = np.asarray(A, dtype=float)
+    r, c = np.nonzero(A)
+    yield r, c, A[r, c]
+
+
+def _calcular_analisis(A):
+    en_disco = isinstance(A, np.memmap)
+    if isinstance(A, MatrizCSR):
+        n = A.forma[0]
+        diagonal = A.diagonal()
+    elif en_disco:
+        n = A.shape[0]
+        lector = _LectorFilas(A)
+        try:
+            diagonal = lector.diagonal()
+        finally:
+            lector.cerrar()
+    else:
+        A = np.asarray(A, dtype=float)
+        n = A.shape[0]
+        diagonal = np.diag(A).copy()
+
+    nnz = inferiores = superiores = 0
+    fuera_diagonal = np.zeros(n)
+    menores = True
+    for filas, columnas, valores in _bloques_no_nulos(A):
+        nnz += len(valores)
+        if len(valores):
+            inferiores = max(inferiores, int((filas - columnas).max()))
+            superiores = max(superiores, int((columnas - filas).max()))
+        absolutos = np.abs(valores)
+        fuera_diagonal += np.bincount(filas, absolutos * (filas != columnas), minlength=n)
+        with np.errstate(invalid='ignore'):
+            menores = menores and bool(np.all(
+                absolutos <= (1 + 1e-10) * np.sqrt(diagonal[filas] * diagonal[columnas])))
+
+    if isinstance(A, MatrizCSR):
+        T = A.transpuesta()
+        simetrica = (np.array_equal(A.punteros, T.punteros) and np.array_equal(A.indices, T.indices)
+                     and np.allclose(A.valores, T.valores, rtol=1e-10, atol=0))
+    elif en_disco:
+        # Sonda aleatoria u^T (A v) = v^T (A u): dos pasadas en lugar de leer A por columnas
+        generador = np.random.default_rng(0)
+        u, v = generador.standard_normal(n), generador.standard_normal(n)
+        a, b = u @ _producto_disco(A, v), v @ _producto_disco(A, u)
+        simetrica = abs(a - b) <= 1e-10 * max(abs(a), abs(b), 1.0)
+    else:
+        simetrica = inferiores == superiores and np.allclose(A, A.T, rtol=1e-10, atol=0)
+
+    diagonal_positiva = bool(np.all(diagonal > 0))
+    densidad = nnz / (n * n) if n else 1.0
+    return {
+        'n': n,
+        'nnz': nnz,
+        'densidad': densidad,
+        'inferiores': inferiores,
+        'superiores': superiores,
+        'simetrica': bool(simetrica),
+        'diagonal_positiva': diagonal_positiva,
+        'dominante': bool(np.all(np.abs(diagonal) > fuera_diagonal)),
+        'spd_probable': bool(simetrica) and diagonal_positiva and menores,
+        'dispersa': isinstance(A, MatrizCSR) or densidad <= UMBRAL_DISPERSA,
+        'en_disco': en_disco,
+        'norma_inf': float((np.abs(diagonal) + fuera_diagonal).max(initial=0.0)),
+    }
+
+
+def _elegir_metodo(analisis):
+    """Retorna (metodo, motivo) segun el resultado de analizar_matriz"""
+    n = analisis['n']
+    p, q = analisis['inferiores'], analisis['superiores']
+    estable = analisis['dominante'] or analisis['spd_probable']
+
+    if analisis['en_disco']:
+        if estable:
+            return 'gauss_seidel', ("matriz en disco diagonal dominante o SPD: Gauss-Seidel "
+                                    "converge y recorre A por bloques de filas")
+        return 'gmres', ("matriz en disco sin garantia de convergencia de Gauss-Seidel: GMRES "
+                         "recorriendo A por bloques de filas")
+    # En una dispersa la banda debe estar casi llena: el relleno de la eliminacion la completa
+    banda_llena = analisis['nnz'] >= 0.5 * n * (p + q + 1)
+    if p + q + 1 <= max(3, n // 10) and (banda_llena or not analisis['dispersa']):
+        return 'banda', (f"matriz banda ({p} inferiores, {q} superiores): eliminacion O(n * ancho^2)"
+                         + ("" if estable else " con pivoteo en la banda"))
+    if analisis['dispersa']:
+        if analisis['spd_probable']:
+            return 'gradiente_conjugado', "dispersa y SPD: gradiente conjugado con Cholesky incompleto"
+        if analisis['dominante']:
+            return 'bicgstab', "dispersa y diagonal dominante: BiCGSTAB con precondicionador de Jacobi"
+        return 'gmres', "dispersa general: GMRES con precondicionador de Jacobi"
+    if n >= UMBRAL_DIRECTO and analisis['spd_probable']:
+        return 'gradiente_conjugado', f"densa SPD con n >= {UMBRAL_DIRECTO}: iterar cuesta O(n^2) por paso"
+    if n >= UMBRAL_DIRECTO and analisis['dominante']:
+        return 'bicgstab', f"densa diagonal dominante con n >= {UMBRAL_DIRECTO}: iterar cuesta O(n^2) por paso"
+    if analisis['spd_probable']:
+        return 'cholesky', "densa y SPD: Cholesky hace la mitad de operaciones que LU"
+    return 'lu', "densa general: eliminacion gaussiana con pivoteo parcial"
+
+
+def _memoria_disponible():
+    """Bytes de memoria fisica libre, o None si el sistema no lo informa"""
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _resolver_metodo(A, b, metodo, analisis, tolerancia, max_iter, lector):
+    """Aplica el metodo elegido; retorna (x, iteraciones)"""
+    if metodo == 'banda':
+        p, q = analisis['inferiores'], analisis['superiores']
+        pivoteo = not (analisis['dominante'] or analisis['spd_probable'])
+        return resolver_banda(matriz_a_banda(A, p, q), b, p, q, pivoteo=pivoteo), 0
+    if metodo == 'cholesky':
+        return FactorizacionCholesky(A).resolver(b), 0
+    if metodo == 'lu':
+        densa = A.a_densa() if isinstance(A, MatrizCSR) else np.asarray(A, dtype=float)
+        return FactorizacionLU(densa).resolver(b), 0
+    if metodo == 'gauss_seidel':
+        # El criterio de gauss_seidel es sobre el paso: se ajusta hasta cumplir el del residuo
+        max_iter = max_iter or 10 * analisis['n']
+        x, iteraciones = gauss_seidel(A, b, tolerancia=tolerancia, max_iter=max_iter)
+        tolerancia_paso = tolerancia
+        while (iteraciones < max_iter and tolerancia_paso > 0
+               and _norma_residuo(A, b, x) > tolerancia * np.linalg.norm(b)):
+            tolerancia_paso /= 10
+            x, extra = gauss_seidel(A, b, x, tolerancia_paso, max_iter - iteraciones)
+            iteraciones += extra
+        return np.asarray(x, dtype=float), iteraciones
+
+    krylov = {'gradiente_conjugado': gradiente_conjugado, 'bicgstab': bicgstab, 'gmres': gmres}
+    if lector is not None:
+        # En disco: productos por bloques de filas con un solo lector abierto
+        diagonal = lector.diagonal()
+        precondicionador = None if np.any(diagonal == 0) else (lambda r, d=1.0 / diagonal: d * r)
+        operador = lambda v: _producto_disco(A, v, lector=lector)
+        return krylov[metodo](operador, b, tolerancia=tolerancia, max_iter=max_iter,
+                              precondicionador=precondicionador)
+    if metodo == 'gradiente_conjugado' and isinstance(A, MatrizCSR):
+        precondicionador = 'cholesky_incompleto'
+    else:
+        precondicionador = 'jacobi'
+    return krylov[metodo](A, b, tolerancia=tolerancia, max_iter=max_iter,
+                          precondicionador=precondicionador)
+
+
+def resolver(A, b, tolerancia=1e-10, max_iter=None):
+    """Resuelve Ax = b eligiendo el metodo a partir de analizar_matriz(A).
+
+    A puede ser una lista, un ndarray, una MatrizCSR o una matriz en disco
+    (abrir_matriz_disco). Jacobi, Gauss-Seidel y SOR solo se eligen cuando
+    su convergencia esta garantizada. El residuo se verifica en todos los
+    caminos: se acepta si ||b - Ax|| <= tolerancia ||b|| o si no supera el
+    error de redondeo de un metodo directo (10 n eps ||A|| ||x||, normas
+    infinito); si no, se recurre a eliminacion gaussiana. Una matriz en
+    disco solo se carga para eso si cabe en la memoria libre. Si el
+    resultado final no cumple el criterio se emite un RuntimeWarning.
+
+    Retorna (x, info) con 'metodo' usado, 'motivo' de la eleccion,
+    'analisis', 'residuo' (norma euclidea de b - Ax), 'iteraciones'
+    (0 en los metodos directos) y 'convergio'.
+    """
+    analisis = analizar_matriz(A)
+    metodo, motivo = _elegir_metodo(analisis)
+    b_arr = np.asarray(b, dtype=float)
+    norma_b = np.linalg.norm(b_arr)
+    redondeo = 10 * analisis['n'] * np.finfo(float).eps * analisis['norma_inf']
+
+    def aceptable(x, residuo):
+        umbral = max(tolerancia * (norma_b if norma_b > 0 else 1.0),
+                     redondeo * np.abs(x).max(initial=0.0))
+        return residuo <= umbral
+
+    krylov = ('gradiente_conjugado', 'bicgstab', 'gmres')
+    lector = _LectorFilas(A) if analisis['en_disco'] and metodo in krylov else None
+    try:
+        x, iteraciones = _resolver_metodo(A, b_arr, metodo, analisis, tolerancia, max_iter, lector)
+        residuo = _norma_residuo(A, b_arr, x)
+        if not aceptable(x, residuo) and metodo != 'lu':
+            disponible = _memoria_disponible() if analisis['en_disco'] else None
+            if analisis['en_disco'] and (disponible is None or 2 * A.nbytes > disponible):
+                motivo += (f"; {metodo} no alcanzo la tolerancia y la matriz en disco no cabe "
+                           "en memoria para eliminacion gaussiana")
+            else:
+                motivo += f"; {metodo} no alcanzo la tolerancia: se recurrio a eliminacion gaussiana"
+                metodo = 'lu'
+                x, _ = _resolver_metodo(A, b_arr, metodo, analisis, tolerancia, max_iter, None)
+                residuo = _norma_residuo(A, b_arr, x)
+    finally:
+        if lector is not None:
+            lector.cerrar()
+
+    convergio = bool(aceptable(x, residuo))
+    if not convergio:
+        warnings.warn(f"resolver: el residuo {residuo:.3g} de {metodo} no cumple la tolerancia",
+                      RuntimeWarning, stacklevel=2)
+    if not isinstance(b, np.ndarray):
+        x = x.tolist()
+    return x, {'metodo': metodo, 'motivo': motivo, 'analisis': analisis,
+               'residuo': residuo, 'iteraciones': iteraciones, 'convergio': convergio}
+
+
+class SesionSistemas:
+    """Resuelve una secuencia de sistemas A_k x = b_k con A que cambia poco
+
+    Pensada para pasos de tiempo: cada llamada a resolver(A, b) arranca
+    desde la solucion anterior y usa la ultima factorizacion (de una A
+    anterior, ver factorizar) como precondicionador del metodo iterativo.
+    Mientras A cambie poco el metodo converge en pocas iteraciones y cada
+    paso cuesta O(n^2) en lugar de O(n^3). Si no converge en
+    max_iter_reuso iteraciones se refactoriza con la A actual.
+
+    metodo: 'gmres' o 'refinamiento' (x += M^-1 (b - Ax), mas barato por
+    iteracion pero solo converge si A y la A factorizada son parecidas),
+    o 'jacobi', 'gauss_seidel', 'relajacion' para usar solo el arranque
+    en caliente (opciones se pasa a esos metodos, por ejemplo omega; x0,
+    devolver_info e historial los maneja la sesion y lanzan ValueError).
+
+    Atributos: pasos, refactorizaciones, iteraciones (total acumulado) e
+    info del ultimo paso ('metodo', 'iteraciones', 'refactorizo', 'residuo').
+    """
+
+    METODOS = ('gmres', 'refinamiento', 'jacobi', 'gauss_seidel', 'relajacion')
+
+    def __init__(self, metodo='gmres', tolerancia=1e-10, max_iter_reuso=20, **opciones):
+        if metodo not in self.METODOS:
+            raise ValueError(f"metodo debe ser uno de {', '.join(self.METODOS)}")
+        reservadas = sorted({'x0', 'devolver_info', 'historial'} & opciones.keys())
+        if reservadas:
+            raise ValueError(f"SesionSistemas no admite las opciones {', '.join(reservadas)}")
+        self.metodo = metodo
+        self.tolerancia = tolerancia
+        self.max_iter_reuso = max_iter_reuso
+        self.opciones = opciones
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Olvida la solucion y la factorizacion guardadas (no los contadores)"""
+        self.x = None
+        self.factorizacion = None
+        if not hasattr(self, 'pasos'):
+            self.pasos = self.refactorizaciones = self.iteraciones = 0
+            self.info = {}
+
+    def resolver(self, A, b):
+        """Resuelve A x = b para el paso actual. x es un ndarray si b lo es."""
+        b_arr = np.asarray(b, dtype=float)
+        n = len(b_arr)
+        if self.x is not None and len(self.x) != n:
+            self.reiniciar()
+
+        if self.metodo in ('jacobi', 'gauss_seidel', 'relajacion'):
+            metodo = {'jacobi': jacobi, 'gauss_seidel': gauss_seidel, 'relajacion': relajacion}
+            x, iteraciones = metodo[self.metodo](A, b_arr, x0=self.x, tolerancia=self.tolerancia,
+                                                 **self.opciones)
+            refactorizo = False
+        else:
+            x, iteraciones, refactorizo = self._resolver_precondicionado(A, b_arr)
+
+        self.x = np.array(x, dtype=float)
+        self.pasos += 1
+        self.iteraciones += iteraciones
+        self.refactorizaciones += refactorizo
+        self.info = {'metodo': 'directo' if refactorizo else self.metodo,
+                     'iteraciones': iteraciones, 'refactorizo': refactorizo,
+                     'residuo': _norma_residuo(A, b_arr, self.x)}
+        return self.x.copy() if isinstance(b, np.ndarray) else self.x.tolist()
+
+    def _resolver_precondicionado(self, A, b):
+        """Retorna (x, iteraciones, refactorizo)"""
+        if self.factorizacion is not None:
+            norma_b = np.linalg.norm(b)
+            umbral = self.tolerancia * (norma_b if norma_b > 0 else 1.0)
+            x0 = np.zeros(len(b)) if self.x is None else self.x
+            M = self.factorizacion.resolver
+
+            if self.metodo == 'gmres':
+                x, iteraciones, info = gmres(A, b, x0, self.tolerancia, reinicio=self.max_iter_reuso,
+                                             max_iter=self.max_iter_reuso, precondicionador=M,
+                                             devolver_info=True)
+                convergio = info['residuo'] <= umbral
+            else:
+                producto = _operador(A)
+                x = x0.copy()
+                convergio = False
+                for iteraciones in range(self.max_iter_reuso + 1):
+                    r = b - producto(x)
+                    if np.linalg.norm(r) <= umbral:
+                        convergio = True
+                        break
+                    if iteraciones < self.max_iter_reuso:
+                        x += M(r)
+            if convergio:
+                return x, iteraciones, False
+
+        # Sin factorizacion o convergencia degradada: se factoriza la A actual
+        self.factorizacion = factorizar(A.a_densa() if isinstance(A, MatrizCSR) else A)
+        return self.factorizacion.resolver(b), 0, True
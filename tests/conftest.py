@@ -0,0 +1,32 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+@pytest.fixture
+def matriz_dominante(rng):
+    """Fabrica de matrices aleatorias estrictamente diagonal dominantes por filas"""
+    def crear(n, densidad=1.0):
+        A = rng.uniform(-1, 1, (n, n)) * (rng.random((n, n)) < densidad)
+        np.fill_diagonal(A, 0.0)
+        np.fill_diagonal(A, np.abs(A).sum(axis=1) + 1.0)
+        return A
+    return crear
+
+
+@pytest.fixture
+def matriz_spd(rng):
+    """Fabrica de matrices simetricas definidas positivas bien condicionadas"""
+    def crear(n):
+        M = rng.standard_normal((n, n))
+        return M @ M.T + n * np.eye(n)
+    return crear
@@ -0,0 +1,237 @@
+import numpy as np
+import pytest
+
+from metodos_numericos.sistemas_lineales import (
+    MatrizCSR, coloreo_grafo, detectar_bloques, gauss_seidel, gauss_seidel_bloques, jacobi,
+    jacobi_bloques, matriz_a_banda, matriz_poisson, relajacion, resolver_banda,
+    resolver_pentadiagonal, resolver_tridiagonal
+)
+
+
+def test_csr_coincide_con_densa(rng):
+    A = rng.standard_normal((9, 7)) * (rng.random((9, 7)) < 0.4)
+    C = MatrizCSR.desde_densa(A)
+    x = rng.standard_normal(7)
+    assert C.nnz == np.count_nonzero(A)
+    np.testing.assert_array_equal(C.a_densa(), A)
+    np.testing.assert_allclose(C.producto(x), A @ x)
+
+
+def test_csr_desde_tripletes_suma_repetidos():
+    C = MatrizCSR.desde_tripletes([0, 1, 0, 1], [1, 0, 1, 1], [1.0, 2.0, 3.0, 4.0], (2, 2))
+    np.testing.assert_array_equal(C.a_densa(), [[0.0, 4.0], [2.0, 4.0]])
+    np.testing.assert_array_equal(C.diagonal(), [0.0, 4.0])
+
+
+@pytest.mark.parametrize('metodo,opciones', [
+    (jacobi, {}), (gauss_seidel, {}), (relajacion, {'omega': 1.3}),
+])
+def test_estacionarios_csr_contra_densa(rng, matriz_dominante, metodo, opciones):
+    A = matriz_dominante(40, densidad=0.2)
+    b = rng.standard_normal(40)
+    x, iteraciones = metodo(MatrizCSR.desde_densa(A), b, tolerancia=1e-12, max_iter=1000,
+                            **opciones)
+    assert iteraciones < 1000
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), atol=1e-10)
+
+
+@pytest.mark.parametrize('disperso', [False, True])
+def test_jacobi_vectorizado_igual_a_escalar(rng, matriz_dominante, disperso):
+    A = matriz_dominante(30, densidad=0.3)
+    b = rng.standard_normal(30)
+    M = MatrizCSR.desde_densa(A) if disperso else A
+    x, iteraciones = jacobi(M, b, tolerancia=1e-12, max_iter=500, vectorizado=True)
+    x_escalar, iteraciones_escalar = jacobi(A.tolist(), b.tolist(), tolerancia=1e-12,
+                                            max_iter=500, vectorizado=False)
+    assert isinstance(x, np.ndarray) and isinstance(x_escalar, list)
+    assert abs(iteraciones - iteraciones_escalar) <= 1
+    np.testing.assert_allclose(x, x_escalar, atol=1e-11)
+
+
+def test_coloreo_sin_vecinos_del_mismo_color(matriz_dominante):
+    A = matriz_dominante(30, densidad=0.1)
+    colores = coloreo_grafo(MatrizCSR.desde_densa(A + A.T))
+    assert sorted(np.concatenate(colores).tolist()) == list(range(30))
+    vecinos = (A + A.T) != 0
+    for indices in colores:
+        bloque = vecinos[np.ix_(indices, indices)]
+        assert not (bloque & ~np.eye(len(indices), dtype=bool)).any()
+
+
+@pytest.mark.parametrize('metodo,opciones', [
+    (gauss_seidel, {'ordenamiento': 'multicolor'}),
+    (relajacion, {'omega': 1.3, 'ordenamiento': 'multicolor'}),
+])
+@pytest.mark.parametrize('disperso', [False, True])
+def test_multicolor_contra_densa(rng, matriz_dominante, metodo, opciones, disperso):
+    A = matriz_dominante(40, densidad=0.2)
+    b = rng.standard_normal(40)
+    x, iteraciones = metodo(MatrizCSR.desde_densa(A) if disperso else A, b,
+                            tolerancia=1e-12, max_iter=1000, **opciones)
+    assert isinstance(x, np.ndarray) and iteraciones < 1000
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), atol=1e-10)
+
+
+def test_banda_tridiagonal_y_pentadiagonal(rng):
+    n = 30
+    A = (np.diag(rng.uniform(4, 5, n)) + np.diag(rng.uniform(-1, 1, n - 1), 1)
+         + np.diag(rng.uniform(-1, 1, n - 1), -1) + np.diag(rng.uniform(-1, 1, n - 2), 2)
+         + np.diag(rng.uniform(-1, 1, n - 2), -2))
+    d = rng.standard_normal((n, 3))
+    esperado = np.linalg.solve(A, d)
+
+    np.testing.assert_allclose(resolver_banda(matriz_a_banda(A, 2, 2), d, 2, 2), esperado,
+                               rtol=1e-10)
+    np.testing.assert_allclose(resolver_banda(matriz_a_banda(A, 2, 2), d, 2, 2, pivoteo=True),
+                               esperado, rtol=1e-10)
+    e = np.r_[0, 0, np.diag(A, -2)]
+    a = np.r_[0, np.diag(A, -1)]
+    c = np.r_[np.diag(A, 1), 0]
+    f = np.r_[np.diag(A, 2), 0, 0]
+    np.testing.assert_allclose(resolver_pentadiagonal(e, a, np.diag(A), c, f, d), esperado,
+                               rtol=1e-10)
+
+    T = np.diag(np.diag(A)) + np.diag(np.diag(A, 1), 1) + np.diag(np.diag(A, -1), -1)
+    for pivoteo in (False, True):
+        np.testing.assert_allclose(resolver_tridiagonal(a, np.diag(A), c, d[:, 0], pivoteo),
+                                   np.linalg.solve(T, d[:, 0]), rtol=1e-10)
+
+
+@pytest.mark.parametrize('ordenamiento', ['lexicografico', 'multicolor'])
+def test_relajacion_adaptativa(rng, ordenamiento):
+    # Laplaciano 1-D: Gauss-Seidel converge lento y el omega estimado acelera mucho
+    n = 40
+    A = 2 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    b = rng.standard_normal(n)
+    x, iteraciones, info = relajacion(A, b, omega='adaptativo', tolerancia=1e-10,
+                                      max_iter=20000, ordenamiento=ordenamiento,
+                                      devolver_info=True)
+    _, iteraciones_gs = gauss_seidel(A, b, tolerancia=1e-10, max_iter=20000,
+                                     ordenamiento=ordenamiento)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-6)
+    assert 1 < info['omega'] < 2
+    assert iteraciones < iteraciones_gs / 5
+
+
+def test_matriz_a_banda_desde_csr(rng):
+    A = np.diag(rng.uniform(4, 5, 12)) + np.diag(rng.uniform(-1, 1, 11), 1) + np.eye(12, k=-2)
+    np.testing.assert_array_equal(matriz_a_banda(MatrizCSR.desde_densa(A), 2, 1),
+                                  matriz_a_banda(A, 2, 1))
+
+
+def _matriz_nodos(rng, nodos=10, grados=3):
+    """Matriz con bloques de grados x grados por nodo, acoplados a los nodos vecinos"""
+    n = nodos * grados
+    A = np.zeros((n, n))
+    for i in range(nodos):
+        for j in (i - 1, i, i + 1):
+            if 0 <= j < nodos:
+                bloque = rng.uniform(-1, 1, (grados, grados))
+                A[i*grados:(i+1)*grados, j*grados:(j+1)*grados] = bloque
+    A += np.diag(np.abs(A).sum(axis=1) + 1.0)
+    return A
+
+
+def test_detectar_bloques(rng):
+    A = _matriz_nodos(rng)
+    # Los nodos interiores comparten patron y se agrupan hasta tamano_maximo
+    limites = detectar_bloques(A, tamano_maximo=3)
+    assert limites[0] == 0 and limites[-1] == 30 and np.all(np.diff(limites) <= 3)
+    np.testing.assert_array_equal(limites, detectar_bloques(MatrizCSR.desde_densa(A), 3))
+
+
+@pytest.mark.parametrize('metodo,opciones', [
+    (jacobi_bloques, {}), (gauss_seidel_bloques, {}), (gauss_seidel_bloques, {'omega': 1.1}),
+])
+@pytest.mark.parametrize('disperso', [False, True])
+def test_metodos_por_bloques(rng, metodo, opciones, disperso):
+    A = _matriz_nodos(rng)
+    b = rng.standard_normal(30)
+    M = MatrizCSR.desde_densa(A) if disperso else A
+    x, iteraciones, info = metodo(M, b, tolerancia=1e-12, max_iter=500, bloques=3,
+                                  devolver_info=True, **opciones)
+    assert iteraciones < 500 and info['residuo'] < 1e-9
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), atol=1e-10)
+
+
+def test_bloques_invalidos(rng):
+    A = _matriz_nodos(rng)
+    with pytest.raises(ValueError):
+        jacobi_bloques(A, np.ones(30), bloques=[0, 10, 5, 30])
+    A[:3, :3] = 0
+    with pytest.raises(ZeroDivisionError):
+        jacobi_bloques(A, np.ones(30), bloques=3)
+
+
+@pytest.mark.parametrize('metodo', [jacobi, gauss_seidel, relajacion])
+def test_criterio_residuo_con_intervalo(rng, matriz_dominante, metodo):
+    A = matriz_dominante(30)
+    b = rng.standard_normal(30)
+    x, iteraciones, info = metodo(A, b, tolerancia=1e-10, max_iter=1000, criterio='residuo',
+                                  intervalo_control=4, historial=True)
+    assert iteraciones % 4 == 0
+    assert np.linalg.norm(b - A @ np.asarray(x)) <= 1e-10 * np.linalg.norm(b)
+    assert len(info['historial']) == iteraciones // 4
+    assert info['historial'][-1] <= 1e-10 * np.linalg.norm(b)
+    with pytest.raises(ValueError):
+        metodo(A, b, criterio='absoluto')
+
+
+@pytest.mark.parametrize('metodo', [gauss_seidel, relajacion])
+def test_x0_en_ndarray_no_se_modifica(rng, matriz_dominante, metodo):
+    A = matriz_dominante(10).tolist()
+    b = rng.standard_normal(10).tolist()
+    x0 = np.zeros(10)
+    x, iteraciones = metodo(A, b, x0=x0, tolerancia=1e-12, max_iter=500)
+    assert not x0.any() and iteraciones > 2
+    np.testing.assert_allclose(np.dot(A, x), b, atol=1e-10)
+
+
+def test_multicolor_recalcula_tras_modificar_valores(rng):
+    A = matriz_poisson((8, 8))
+    b = rng.standard_normal(64)
+    gauss_seidel(A, b, ordenamiento='multicolor')
+    A.valores *= 2
+    x, _ = gauss_seidel(A, b, tolerancia=1e-12, max_iter=2000, ordenamiento='multicolor')
+    np.testing.assert_allclose(A.producto(x), b, atol=1e-8)
+
+
+def test_tridiagonal_pivote_nulo():
+    a, b, c = np.ones(3), np.array([0.0, 1.0, 1.0]), np.ones(3)
+    with pytest.raises(ZeroDivisionError):
+        resolver_tridiagonal(a, b, c, np.ones(3))
+    with pytest.raises(ZeroDivisionError):
+        resolver_banda(matriz_a_banda(np.diag(b) + np.eye(3, k=1) + np.eye(3, k=-1), 1, 1),
+                       np.ones(3), 1, 1)
+    np.testing.assert_allclose(resolver_tridiagonal(a, b, c, np.ones(3), pivoteo=True),
+                               np.linalg.solve(np.diag(b) + np.eye(3, k=1) + np.eye(3, k=-1),
+                                               np.ones(3)))
+
+
+@pytest.mark.parametrize('metodo', [jacobi_bloques, gauss_seidel_bloques])
+def test_bloques_refactoriza_si_cambia_la_matriz(rng, metodo):
+    A = _matriz_nodos(rng)
+    b = rng.standard_normal(30)
+    metodo(A, b, bloques=3)
+    A *= 3
+    x, iteraciones = metodo(A, b, tolerancia=1e-12, max_iter=500, bloques=3)
+    assert iteraciones < 500
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), atol=1e-10)
+
+
+def test_estacionarios_siguen_el_tipo_de_b(rng, matriz_dominante):
+    A = matriz_dominante(10)
+    b = rng.standard_normal(10)
+    for metodo in (jacobi, gauss_seidel, relajacion, jacobi_bloques, gauss_seidel_bloques):
+        assert isinstance(metodo(A.tolist(), b)[0], np.ndarray)
+        assert isinstance(metodo(A, b.tolist())[0], list)
+
+
+def test_gauss_seidel_bloques_grandes(rng):
+    # Bloques de mas de 16 filas usan la sustitucion vectorizada
+    A = _matriz_nodos(rng)
+    b = rng.standard_normal(30)
+    x, iteraciones = gauss_seidel_bloques(A, b, tolerancia=1e-12, max_iter=500,
+                                          bloques=[0, 20, 30])
+    assert iteraciones < 500
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), atol=1e-10)
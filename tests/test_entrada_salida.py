@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from metodos_numericos.sistemas_lineales import (
+    MatrizCSR, abrir_matriz_disco, escribir_csr_binario, escribir_matrix_market, gauss_seidel,
+    jacobi, leer_csr_binario, leer_matrix_market, relajacion, texto_a_disco, tripletes_a_disco
+)
+
+
+@pytest.mark.parametrize('nombre', ['A.npy', 'A.bin'])
+def test_tripletes_a_disco(rng, matriz_dominante, tmp_path, nombre):
+    A = matriz_dominante(25, densidad=0.15)
+    filas, columnas = np.nonzero(A)
+    # Los repetidos se suman
+    filas, columnas = np.r_[filas, filas[:5]], np.r_[columnas, columnas[:5]]
+    valores = np.r_[A[filas[:-5], columnas[:-5]], np.ones(5)]
+    esperada = A.copy()
+    np.add.at(esperada, (filas[:5], columnas[:5]), 1.0)
+    D = tripletes_a_disco(tmp_path / nombre, filas, columnas, valores, len(A), tamano_bloque=16)
+    assert isinstance(D, np.memmap)
+    np.testing.assert_array_equal(D, esperada)
+    np.testing.assert_array_equal(abrir_matriz_disco(tmp_path / nombre, len(A)), esperada)
+
+
+def test_texto_a_disco(matriz_dominante, tmp_path):
+    A = matriz_dominante(12, densidad=0.15)
+    densa = tmp_path / 'A.txt'
+    densa.write_text("# matriz\n" + "\n".join(" ".join(map(repr, fila)) for fila in A.tolist()))
+    np.testing.assert_array_equal(texto_a_disco(densa, tmp_path / 'A.npy', lineas_bloque=5), A)
+
+    filas, columnas = np.nonzero(A)
+    tripletes = tmp_path / 'T.txt'
+    tripletes.write_text("\n".join(f"{i} {j} {float(A[i, j])!r}" for i, j in zip(filas, columnas)))
+    D = texto_a_disco(tripletes, tmp_path / 'T.bin', formato='tripletes', forma=12)
+    np.testing.assert_array_equal(D, A)
+    with pytest.raises(ValueError):
+        texto_a_disco(tripletes, tmp_path / 'X.npy', formato='csv')
+
+
+@pytest.mark.parametrize('metodo,opciones', [
+    (jacobi, {}), (gauss_seidel, {}), (relajacion, {'omega': 1.1}),
+    (relajacion, {'omega': 'adaptativo'}),
+])
+def test_metodos_en_disco_igual_que_en_memoria(rng, matriz_dominante, tmp_path, metodo,
+                                               opciones):
+    A = matriz_dominante(40, densidad=0.15)
+    np.save(tmp_path / 'A.npy', A)
+    D = abrir_matriz_disco(tmp_path / 'A.npy')
+    b = rng.standard_normal(40)
+    x_disco, iteraciones_disco = metodo(D, b, tolerancia=1e-12, max_iter=500, filas_bloque=7,
+                                        **opciones)
+    x, iteraciones = metodo(A, b, tolerancia=1e-12, max_iter=500, **opciones)
+    assert isinstance(x_disco, np.ndarray)
+    np.testing.assert_allclose(x_disco, np.linalg.solve(A, b), atol=1e-10)
+    assert abs(iteraciones_disco - iteraciones) <= 1
+
+
+@pytest.mark.parametrize('simetrica', [False, True])
+def test_matrix_market_coordinate(matriz_dominante, tmp_path, simetrica):
+    A = matriz_dominante(25, densidad=0.15)
+    if simetrica:
+        A = A + A.T
+    ruta = tmp_path / 'A.mtx'
+    escribir_matrix_market(ruta, MatrizCSR.desde_densa(A), simetrica=simetrica,
+                           entradas_bloque=7)
+    leida = leer_matrix_market(ruta, bytes_bloque=64)
+    assert isinstance(leida, MatrizCSR)
+    np.testing.assert_array_equal(leida.a_densa(), A)
+
+
+def test_matrix_market_array(rng, tmp_path):
+    A = rng.standard_normal((4, 3))
+    ruta = tmp_path / 'A.mtx'
+    escribir_matrix_market(ruta, A.tolist())
+    np.testing.assert_array_equal(leer_matrix_market(ruta), A)
+
+
+def test_matrix_market_simetrias_y_pattern(tmp_path):
+    ruta = tmp_path / 'B.mtx'
+    ruta.write_text("%%MatrixMarket matrix coordinate integer skew-symmetric\n"
+                    "% comentario\n3 3 2\n2 1 5\n3 2 -1\n")
+    np.testing.assert_array_equal(leer_matrix_market(ruta).a_densa(),
+                                  [[0, -5, 0], [5, 0, 1], [0, -1, 0]])
+    ruta.write_text("%%MatrixMarket matrix coordinate pattern general\n2 2 2\n1 1\n2 1\n")
+    np.testing.assert_array_equal(leer_matrix_market(ruta).a_densa(), [[1, 0], [1, 0]])
+    ruta.write_text("%%MatrixMarket matrix coordinate complex general\n1 1 1\n1 1 1 0\n")
+    with pytest.raises(ValueError):
+        leer_matrix_market(ruta)
+
+
+@pytest.mark.parametrize('mapear', [False, True])
+def test_csr_binario(rng, matriz_dominante, tmp_path, mapear):
+    A = matriz_dominante(25, densidad=0.15)
+    ruta = tmp_path / 'A.csr'
+    escribir_csr_binario(ruta, MatrizCSR.desde_densa(A))
+    leida = leer_csr_binario(ruta, mapear=mapear)
+    np.testing.assert_array_equal(leida.a_densa(), A)
+    b = rng.standard_normal(len(A))
+    np.testing.assert_allclose(jacobi(leida, b, tolerancia=1e-12, max_iter=500)[0],
+                               np.linalg.solve(A, b), atol=1e-10)
+    escribir_csr_binario(ruta, A)
+    np.testing.assert_array_equal(leer_csr_binario(ruta).a_densa(), A)
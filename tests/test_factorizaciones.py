@@ -0,0 +1,169 @@
+import numpy as np
+import pytest
+
+from metodos_numericos.interpolacion import eliminacion_gaussiana_simple
+from metodos_numericos.sistemas_lineales import (
+    FactorizacionCholesky, FactorizacionLDL, FactorizacionLU, UMBRAL_VECTORIZADO, cholesky,
+    desempaquetar_simetrica, eliminacion_gaussiana, eliminacion_gaussiana_lotes,
+    empaquetar_simetrica, es_spd_probable, factorizar, ldlt
+)
+
+
+@pytest.mark.parametrize('n', [1, 5, 40])
+def test_lu_coincide_con_numpy(rng, n):
+    A = rng.standard_normal((n, n)) + n * np.eye(n)
+    b = rng.standard_normal(n)
+    x = FactorizacionLU(A.tolist()).resolver(b.tolist())
+    assert isinstance(x, list)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-10, atol=1e-12)
+
+
+def test_lu_varios_lados_derechos(rng):
+    A = rng.standard_normal((30, 30)) + 30 * np.eye(30)
+    B = rng.standard_normal((30, 4))
+    lu = FactorizacionLU(A.tolist())
+    np.testing.assert_allclose(lu.resolver(B.tolist()), np.linalg.solve(A, B), rtol=1e-10)
+    for j in range(4):
+        np.testing.assert_allclose(lu.resolver(B[:, j].tolist()), np.linalg.solve(A, B[:, j]),
+                                   rtol=1e-10)
+
+
+def test_lu_igual_a_eliminacion_gaussiana(rng, matriz_dominante):
+    A = matriz_dominante(12).tolist()
+    b = rng.standard_normal(12).tolist()
+    assert FactorizacionLU(A).resolver(b) == eliminacion_gaussiana(A, b)
+
+
+@pytest.mark.parametrize('n', [5, 40])
+def test_lu_con_ndarray(rng, n):
+    A = rng.standard_normal((n, n)) + n * np.eye(n)
+    b = rng.standard_normal(n)
+    x = FactorizacionLU(A).resolver(b)
+    assert isinstance(x, np.ndarray)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-10)
+    np.testing.assert_allclose(FactorizacionLU(A).resolver(np.c_[b, 2 * b]),
+                               np.linalg.solve(A, np.c_[b, 2 * b]), rtol=1e-10)
+
+
+@pytest.mark.parametrize('eliminar', [eliminacion_gaussiana, eliminacion_gaussiana_simple])
+def test_eliminacion_vectorizada(rng, matriz_dominante, eliminar):
+    # Con ndarrays y con listas de orden >= UMBRAL_VECTORIZADO se usa el nucleo de NumPy
+    for n in (8, UMBRAL_VECTORIZADO + 8):
+        A = matriz_dominante(n)
+        b = rng.standard_normal(n)
+        esperado = np.linalg.solve(A, b)
+        np.testing.assert_allclose(eliminar(A, b), esperado, rtol=1e-10)
+        np.testing.assert_allclose(eliminar(A.tolist(), b.tolist()), esperado, rtol=1e-10)
+
+
+def test_eliminacion_lotes(rng):
+    A = rng.standard_normal((7, 4, 4)) + 4 * np.eye(4)
+    A[3] = 1.0
+    b = rng.standard_normal((7, 4))
+    x, validos = eliminacion_gaussiana_lotes(A, b)
+    assert validos.tolist() == [True, True, True, False, True, True, True]
+    assert np.isnan(x[3]).all()
+    for s in np.flatnonzero(validos):
+        np.testing.assert_allclose(x[s], np.linalg.solve(A[s], b[s]), rtol=1e-10)
+
+
+def test_eliminacion_mixta(rng, matriz_dominante):
+    A = matriz_dominante(50)
+    b = rng.standard_normal(50)
+    x, info = eliminacion_gaussiana(A, b, precision='mixta', devolver_info=True)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-12, atol=1e-14)
+    assert info['precision'] == 'mixta' and not info['respaldo']
+
+    hilbert = 1.0 / (np.arange(12)[:, None] + np.arange(12) + 1)
+    _, info = eliminacion_gaussiana(hilbert, np.ones(12), precision='mixta', devolver_info=True)
+    assert info['respaldo']
+
+    with pytest.raises(ValueError):
+        eliminacion_gaussiana(A, b, precision='media')
+
+
+def test_empaquetado_simetrico(matriz_spd):
+    A = matriz_spd(6)
+    P = empaquetar_simetrica(A)
+    assert P.shape == (21,)
+    np.testing.assert_array_equal(desempaquetar_simetrica(P), np.tril(A) + np.tril(A, -1).T)
+
+
+@pytest.mark.parametrize('n', [1, 8, 60])
+def test_cholesky_y_ldlt(rng, matriz_spd, n):
+    A = matriz_spd(n)
+    b = rng.standard_normal(n)
+    esperado = np.linalg.solve(A, b)
+    factor = FactorizacionCholesky(A)
+    assert factor.completa
+    np.testing.assert_allclose(factor.resolver(b), esperado, rtol=1e-10)
+    np.testing.assert_allclose(cholesky(A, b), esperado, rtol=1e-10)
+    np.testing.assert_allclose(ldlt(A, b), esperado, rtol=1e-10)
+    np.testing.assert_allclose(FactorizacionCholesky(empaquetar_simetrica(A)).resolver(b),
+                               esperado, rtol=1e-10)
+
+
+def test_ldlt_indefinida(rng):
+    A = np.diag([4.0, -3.0, 2.0, -5.0]) + 0.1 * np.ones((4, 4))
+    b = rng.standard_normal(4)
+    np.testing.assert_allclose(ldlt(A, b), np.linalg.solve(A, b), rtol=1e-10)
+    assert FactorizacionLDL(A).completa
+    assert not es_spd_probable(A)
+
+
+def test_cholesky_no_definida_sigue_con_lu(rng):
+    A = np.array([[4.0, 2.0, 0.0], [2.0, 1.0, 3.0], [0.0, 3.0, 2.0]])
+    b = rng.standard_normal(3)
+    factor = FactorizacionCholesky(A)
+    assert not factor.completa
+    np.testing.assert_allclose(factor.resolver(b), np.linalg.solve(A, b), rtol=1e-10)
+
+
+def test_factorizar_elige_segun_matriz(rng, matriz_spd):
+    assert isinstance(factorizar(matriz_spd(10)), FactorizacionCholesky)
+    assert isinstance(factorizar(rng.standard_normal((10, 10))), FactorizacionLU)
+
+
+def test_lu_transpuesta_y_determinante(rng):
+    A = rng.standard_normal((20, 20)) + 5 * np.eye(20)
+    b = rng.standard_normal(20)
+    lu = FactorizacionLU(A)
+    np.testing.assert_allclose(lu.resolver_transpuesta(b), np.linalg.solve(A.T, b), rtol=1e-10)
+    np.testing.assert_allclose(lu.determinante(), np.linalg.det(A), rtol=1e-10)
+    signo, logaritmo = lu.determinante(logaritmo=True)
+    np.testing.assert_allclose((signo, logaritmo), np.linalg.slogdet(A), rtol=1e-10)
+
+
+@pytest.mark.parametrize('como_lista', [False, True])
+def test_lu_diagnosticos(rng, como_lista):
+    A = rng.standard_normal((30, 30)) + 3 * np.eye(30)
+    lu = FactorizacionLU(A.tolist() if como_lista else A)
+    condicion = np.linalg.cond(A, 1)
+    assert condicion / 10 <= lu.estimar_condicion() <= condicion * (1 + 1e-8)
+    assert lu.factor_crecimiento() >= 1 - 1e-12
+    hilbert = 1.0 / (np.arange(10)[:, None] + np.arange(10) + 1)
+    assert FactorizacionLU(hilbert).estimar_condicion() > 1e12
+
+
+def test_lu_singular():
+    with pytest.raises(ZeroDivisionError):
+        FactorizacionLU(np.ones((3, 3))).resolver(np.ones(3))
+    assert FactorizacionLU(np.ones((3, 3))).estimar_condicion() == float('inf')
+
+
+def test_eliminacion_lotes_singular_numerica(rng):
+    # Sin pivotes exactamente nulos: la tercera fila es la suma de las dos primeras
+    A = rng.standard_normal((3, 5, 5)) + 5 * np.eye(5)
+    A[1, 2] = 0.1 * A[1, 0] + 0.3 * A[1, 1]
+    x, validos = eliminacion_gaussiana_lotes(A, rng.standard_normal((3, 5)))
+    assert validos.tolist() == [True, False, True]
+    assert np.isnan(x[1]).all()
+
+
+def test_lu_diagnosticos_no_dependen_de_a_modificada(rng):
+    A = rng.standard_normal((20, 20)) + 3 * np.eye(20)
+    lu = FactorizacionLU(A)
+    condicion, crecimiento = lu.estimar_condicion(), lu.factor_crecimiento()
+    A *= 1000
+    assert lu.estimar_condicion() == condicion
+    assert lu.factor_crecimiento() == crecimiento
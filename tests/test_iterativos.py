@@ -0,0 +1,258 @@
+import numpy as np
+import pytest
+
+from metodos_numericos import sistemas_lineales
+from metodos_numericos.sistemas_lineales import (
+    MatrizCSR, SesionSistemas, aceleracion_anderson, aceleracion_chebyshev, acelerar,
+    analizar_matriz, bicgstab, crear_barrido, gauss_seidel, gmres, gradiente_conjugado, jacobi,
+    jacobi_paralelo, matriz_poisson, multigrid, precondicionador_cholesky_incompleto,
+    precondicionador_jacobi, prolongacion, relajacion, resolver, restriccion, tripletes_a_disco
+)
+
+
+def _laplaciano(m):
+    """Laplaciano 2-D con diferencias finitas en una grilla de m x m puntos"""
+    T = 2 * np.eye(m) - np.eye(m, k=1) - np.eye(m, k=-1)
+    return MatrizCSR.desde_densa(np.kron(np.eye(m), T) + np.kron(T, np.eye(m)))
+
+
+@pytest.mark.parametrize('precondicionador', [None, 'jacobi', 'cholesky_incompleto'])
+def test_gradiente_conjugado_converge(rng, precondicionador):
+    A = _laplaciano(12)
+    b = rng.standard_normal(144)
+    x, iteraciones, info = gradiente_conjugado(A, b, tolerancia=1e-10,
+                                               precondicionador=precondicionador,
+                                               devolver_info=True)
+    assert info['residuo'] <= 1e-10 * np.linalg.norm(b) * 1.01
+    np.testing.assert_allclose(x, np.linalg.solve(A.a_densa(), b), rtol=1e-7)
+    if precondicionador == 'cholesky_incompleto':
+        assert iteraciones < gradiente_conjugado(A, b, tolerancia=1e-10)[1]
+
+
+def test_gradiente_conjugado_denso(rng, matriz_spd):
+    A = matriz_spd(30)
+    b = rng.standard_normal(30)
+    x, _ = gradiente_conjugado(A, b, tolerancia=1e-12)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-9)
+
+
+def test_cholesky_incompleto_exacto_en_tridiagonal(rng):
+    # Sin relleno posible IC(0) es la factorizacion de Cholesky completa
+    A = MatrizCSR.desde_densa(2 * np.eye(20) - np.eye(20, k=1) - np.eye(20, k=-1))
+    r = rng.standard_normal(20)
+    aplicar = precondicionador_cholesky_incompleto(A)
+    np.testing.assert_allclose(aplicar(r), np.linalg.solve(A.a_densa(), r), rtol=1e-10)
+
+
+@pytest.mark.parametrize('metodo', [gmres, bicgstab])
+@pytest.mark.parametrize('disperso', [False, True])
+def test_krylov_no_simetricos(rng, metodo, disperso):
+    A = rng.standard_normal((60, 60)) * (rng.random((60, 60)) < 0.1) + 4 * np.eye(60)
+    b = rng.standard_normal(60)
+    M = MatrizCSR.desde_densa(A) if disperso else A
+    x, iteraciones = metodo(M, b, tolerancia=1e-10, precondicionador='jacobi')
+    assert np.linalg.norm(b - A @ x) <= 1e-9 * np.linalg.norm(b)
+
+
+def test_gmres_sin_matriz_y_reinicio(rng, matriz_dominante):
+    A = matriz_dominante(50)
+    b = rng.standard_normal(50)
+    precondicionador = precondicionador_jacobi(A)
+    x, _ = gmres(lambda v: A @ v, b, tolerancia=1e-10, reinicio=5,
+                 precondicionador=precondicionador, max_iter=500)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-8)
+
+
+@pytest.mark.parametrize('forma', [31, (15, 15)])
+def test_multigrid_converge(rng, forma):
+    b = rng.standard_normal(int(np.prod(forma)))
+    x, ciclos, info = multigrid(b, forma, tolerancia=1e-10, devolver_info=True)
+    A = matriz_poisson(forma)
+    assert np.linalg.norm(b - A.producto(x)) <= 1e-10 * np.linalg.norm(b) * 1.01
+    assert info['factor_convergencia'] < 0.35
+
+
+def test_matriz_poisson_es_el_laplaciano_escalado():
+    # Con h = 1 / 7 entre puntos
+    np.testing.assert_allclose(matriz_poisson((6, 6)).a_densa(), 49 * _laplaciano(6).a_densa())
+
+
+def test_jacobi_paralelo_coincide_con_serial(rng, matriz_dominante):
+    A = matriz_dominante(80, densidad=0.2)
+    b = rng.standard_normal(80)
+    x_serial, iteraciones_serial = jacobi(A, b, tolerancia=1e-10, max_iter=500)
+    for M in (A, MatrizCSR.desde_densa(A)):
+        x, iteraciones = jacobi_paralelo(M, b, tolerancia=1e-10, max_iter=500, procesos=2)
+        # Solo el orden de las sumas por fila puede cambiar
+        assert abs(iteraciones - iteraciones_serial) <= 1
+        np.testing.assert_allclose(x, x_serial, rtol=1e-9)
+
+
+def test_analizar_matriz(matriz_spd):
+    A = matriz_spd(20)
+    analisis = analizar_matriz(A)
+    assert analisis['simetrica'] and analisis['spd_probable'] and not analisis['dispersa']
+    assert not analizar_matriz(A + np.triu(np.ones_like(A), 1))['simetrica']
+    P = analizar_matriz(matriz_poisson(50))
+    assert (P['inferiores'], P['superiores']) == (1, 1) and P['dispersa']
+
+
+@pytest.mark.parametrize('caso', ['dominante', 'spd', 'tridiagonal', 'general'])
+def test_resolver_elige_metodo(rng, matriz_dominante, matriz_spd, caso):
+    n = 40
+    A = {'dominante': lambda: matriz_dominante(n, densidad=0.1),
+         'spd': lambda: matriz_spd(n),
+         'tridiagonal': lambda: matriz_poisson(n),
+         'general': lambda: rng.standard_normal((n, n))}[caso]()
+    b = rng.standard_normal(n)
+    x, info = resolver(A, b)
+    densa = A.a_densa() if isinstance(A, MatrizCSR) else A
+    np.testing.assert_allclose(x, np.linalg.solve(densa, b), rtol=1e-6, atol=1e-8)
+    assert isinstance(resolver(A, b.tolist())[0], list)
+
+
+def test_acelerar_anderson_y_chebyshev(rng):
+    A = matriz_poisson(40)
+    b = rng.standard_normal(40)
+    esperado = np.linalg.solve(A.a_densa(), b)
+    _, iteraciones_jacobi = jacobi(A, b, tolerancia=1e-13, max_iter=20000)
+
+    x, iteraciones = acelerar(A, b, tolerancia=1e-13, max_iter=20000)
+    np.testing.assert_allclose(x, esperado, rtol=1e-6)
+    assert iteraciones < iteraciones_jacobi / 2
+
+    rho = np.cos(np.pi / 41)
+    x, iteraciones = acelerar(A, b, aceleracion='chebyshev', limites=(-rho, rho),
+                              tolerancia=1e-13, max_iter=20000)
+    np.testing.assert_allclose(x, esperado, rtol=1e-6)
+    assert iteraciones < iteraciones_jacobi / 10
+
+    with pytest.raises(ValueError):
+        acelerar(A, b, aceleracion='chebyshev')
+
+
+def test_barrido_y_aceleradores_genericos(rng, matriz_dominante):
+    A = matriz_dominante(30)
+    b = rng.standard_normal(30)
+    barrido = crear_barrido(A, b, metodo='gauss_seidel')
+    x_gs, _ = gauss_seidel(A, b, tolerancia=1e-12, max_iter=500)
+    x, _, info = aceleracion_anderson(barrido, np.zeros(30), tolerancia=1e-12,
+                                      devolver_info=True)
+    np.testing.assert_allclose(x, x_gs, atol=1e-10)
+    assert len(info['historial']) > 0
+    x, _ = aceleracion_chebyshev(crear_barrido(A, b), np.zeros(30), (-0.9, 0.9),
+                                 tolerancia=1e-12, max_iter=2000)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), atol=1e-10)
+
+
+@pytest.mark.parametrize('metodo', ['gmres', 'refinamiento', 'gauss_seidel'])
+def test_sesion_reutiliza_factorizacion(rng, matriz_dominante, metodo):
+    A = matriz_dominante(30)
+    sesion = SesionSistemas(metodo=metodo, tolerancia=1e-10)
+    for paso in range(4):
+        A_paso = A + 0.01 * paso * np.eye(30)
+        b = rng.standard_normal(30)
+        x = sesion.resolver(A_paso, b)
+        np.testing.assert_allclose(A_paso @ x, b, atol=1e-8)
+    assert sesion.pasos == 4
+    if metodo != 'gauss_seidel':
+        assert sesion.refactorizaciones == 1
+
+
+@pytest.mark.parametrize('forma', [40, (16, 21)])
+def test_multigrid_grillas_pares(rng, forma):
+    b = rng.standard_normal(int(np.prod(forma)))
+    x, ciclos, info = multigrid(b, forma, tolerancia=1e-10, devolver_info=True)
+    A = matriz_poisson(forma)
+    assert np.linalg.norm(b - A.producto(x)) <= 1e-10 * np.linalg.norm(b) * 1.01
+    assert info['factor_convergencia'] < 0.35
+
+
+def test_restriccion_transpuesta_de_prolongacion():
+    for forma in (7, 8, (7, 6)):
+        fina = int(np.prod(forma))
+        gruesa = len(restriccion(np.zeros(fina), forma))
+        R = np.array([restriccion(e, forma) for e in np.eye(fina)]).T
+        P = np.array([prolongacion(e, forma) for e in np.eye(gruesa)]).T
+        np.testing.assert_allclose(R, P.T / 2 ** len(np.atleast_1d(forma)), atol=1e-15)
+
+
+@pytest.mark.parametrize('caso', ['dominante', 'general'])
+def test_resolver_informa_convergencia(rng, matriz_dominante, caso):
+    n = 40
+    A = matriz_dominante(n, densidad=0.1) if caso == 'dominante' else rng.standard_normal((n, n))
+    b = rng.standard_normal(n)
+    x, info = resolver(A, b)
+    assert info['convergio']
+    assert np.linalg.norm(b - A @ x) <= 1e-8 * np.linalg.norm(b)
+
+
+def test_analizar_matriz_tras_modificarla(matriz_spd):
+    A = matriz_spd(20)
+    assert analizar_matriz(A)['simetrica']
+    A[0, 1] += 1.0
+    assert not analizar_matriz(A)['simetrica']
+
+
+def test_resolver_reanaliza_si_la_matriz_cambia(rng):
+    n = 30
+    A = np.diag(np.full(n, 4.0)) + np.eye(n, k=1) + np.eye(n, k=-1)
+    b = rng.standard_normal(n)
+    assert resolver(A, b)[1]['metodo'] == 'banda'
+    A[:] = rng.standard_normal((n, n))
+    x, info = resolver(A, b)
+    assert info['metodo'] != 'banda' and info['convergio']
+    np.testing.assert_allclose(A @ x, b, atol=1e-8)
+
+
+def test_resolver_matriz_en_disco_sin_cargarla(rng, tmp_path):
+    n = 50
+    A = rng.standard_normal((n, n)) + 2 * np.sqrt(n) * np.eye(n)
+    filas, columnas = np.nonzero(A)
+    D = tripletes_a_disco(tmp_path / 'A.npy', filas, columnas, A[filas, columnas], (n, n))
+    b = rng.standard_normal(n)
+    x, info = resolver(D, b)
+    assert info['metodo'] == 'gmres' and info['convergio']
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-7)
+
+
+def test_resolver_en_disco_recurre_a_lu_solo_si_cabe(rng, tmp_path, monkeypatch):
+    n = 50
+    A = rng.standard_normal((n, n)) + np.sqrt(n) * np.eye(n)
+    filas, columnas = np.nonzero(A)
+    D = tripletes_a_disco(tmp_path / 'A.npy', filas, columnas, A[filas, columnas], (n, n))
+    b = rng.standard_normal(n)
+    x, info = resolver(D, b, max_iter=2)
+    assert info['metodo'] == 'lu' and info['convergio']
+
+    monkeypatch.setattr(sistemas_lineales, '_memoria_disponible', lambda: 0)
+    with pytest.warns(RuntimeWarning):
+        x, info = resolver(D, b, max_iter=2)
+    assert info['metodo'] == 'gmres' and not info['convergio']
+    assert 'no cabe en memoria' in info['motivo']
+
+
+@pytest.mark.parametrize('ordenamiento', ['lexicografico', 'multicolor'])
+def test_barrido_csr_igual_a_un_paso_de_relajacion(rng, ordenamiento):
+    A = matriz_poisson((6, 7))
+    b = rng.standard_normal(42)
+    x0 = rng.standard_normal(42)
+    barrido = crear_barrido(A, b, 'relajacion', 1.3, ordenamiento)
+    esperado, _ = relajacion(A, b, x0, 1.3, 0.0, 1, ordenamiento)
+    np.testing.assert_array_equal(barrido(x0), esperado)
+    with pytest.raises(ValueError):
+        crear_barrido(A, b, 'gauss_seidel', ordenamiento='rojo_negro')
+
+
+@pytest.mark.parametrize('forma', [(15, 15), (16, 14)])
+def test_multigrid_con_operador_denso(rng, forma):
+    b = rng.standard_normal(int(np.prod(forma)))
+    x, _ = multigrid(b, forma, tolerancia=1e-10, operador=lambda f: matriz_poisson(f).a_densa())
+    A = matriz_poisson(forma)
+    assert np.linalg.norm(b - A.producto(x)) <= 1e-10 * np.linalg.norm(b) * 1.01
+
+
+def test_sesion_rechaza_opciones_propias():
+    for opcion in ('devolver_info', 'historial', 'x0'):
+        with pytest.raises(ValueError):
+            SesionSistemas('gauss_seidel', **{opcion: True})
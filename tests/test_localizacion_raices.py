@@ -0,0 +1,92 @@
+import math
+
+import numpy as np
+import pytest
+
+from metodos_numericos.localizacion_raices import biseccion, brent, regula_falsi, secante
+from metodos_numericos.localizacion_raices_lotes import (
+    biseccion_lotes, regula_falsi_lotes, secante_lotes
+)
+
+
+PARAMETROS = np.array([0.5, 2.0, 3.0, 10.0])
+
+
+def cubica(x, c):
+    return x * x * x - c
+
+
+@pytest.mark.parametrize('lotes,escalar', [
+    (biseccion_lotes, biseccion), (regula_falsi_lotes, regula_falsi),
+])
+@pytest.mark.parametrize('tipo_error', ['absoluto', 'relativo'])
+def test_intervalos_en_lotes_igual_a_escalares(lotes, escalar, tipo_error):
+    raices, residuos, iteraciones = lotes(cubica, 0.0, 4.0, 1e-10, tipo_error, 200,
+                                          args=(PARAMETROS,))
+    for c, raiz, residuo in zip(PARAMETROS, raices, residuos):
+        esperado = escalar(lambda x: cubica(x, c), 0.0, 4.0, 1e-10, tipo_error, 200)
+        assert (raiz, residuo) == esperado[:2]
+    np.testing.assert_allclose(raices, np.cbrt(PARAMETROS), rtol=1e-8)
+    assert iteraciones.dtype == np.int64 and np.all(iteraciones > 0)
+
+
+def test_secante_en_lotes_igual_a_escalar():
+    raices, residuos, _ = secante_lotes(cubica, 1.0, 2.0, 1e-12, args=(PARAMETROS,))
+    for c, raiz, residuo in zip(PARAMETROS, raices, residuos):
+        assert (raiz, residuo) == secante(lambda x: cubica(x, c), 1.0, 2.0, 1e-12)[:2]
+
+
+def test_lotes_conservan_la_forma():
+    c = PARAMETROS.reshape(2, 2)
+    a = np.zeros((2, 1))
+    raices, residuos, iteraciones = biseccion_lotes(cubica, a, 4.0, 1e-10, args=(c,))
+    assert raices.shape == residuos.shape == iteraciones.shape == (2, 2)
+    np.testing.assert_allclose(raices, np.cbrt(c), rtol=1e-8)
+
+
+def test_secante_en_lotes_marca_fallidos():
+    raices, residuos, _ = secante_lotes(lambda x, c: (x - c) ** 2 + 1.0, 1.0, 1.0,
+                                        args=(np.array([0.0, 1.0]),))
+    assert np.isnan(raices).all() and np.isnan(residuos).all()
+
+
+@pytest.mark.parametrize('f,a,b,raiz', [
+    (lambda x: x * x * x - 2, 0.0, 4.0, 2 ** (1 / 3)),
+    (math.cos, 0.0, 3.0, math.pi / 2),
+    (lambda x: math.exp(x) - 10, -5.0, 5.0, math.log(10)),
+    (lambda x: x - 1, -3.0, 4.0, 1.0),
+])
+def test_brent(f, a, b, raiz):
+    x, fx, error, evaluaciones = brent(f, a, b, tolerancia=1e-12)
+    assert abs(x - raiz) <= 1e-10
+    assert fx == f(x) and (fx == 0 or error <= 1e-12)
+    assert evaluaciones < 100
+
+
+def test_brent_menos_evaluaciones_que_biseccion():
+    f = lambda x: math.exp(x) - 10
+    _, _, _, evaluaciones = brent(f, -5.0, 5.0, tolerancia=1e-12)
+    # La biseccion necesita log2(10 / 1e-12) ~ 43 evaluaciones
+    assert evaluaciones < 20
+
+
+def test_brent_sin_cambio_de_signo():
+    with pytest.raises(ValueError):
+        brent(lambda x: x * x + 1, -1.0, 1.0)
+
+
+@pytest.mark.parametrize('lotes', [biseccion_lotes, regula_falsi_lotes])
+def test_intervalos_sin_cambio_de_signo_quedan_nan(lotes):
+    c = np.array([2.0, -1.0, 5.0])
+    raices, residuos, iteraciones = lotes(cubica, 0.0, 4.0, 1e-10, args=(c,))
+    assert np.isnan(raices[1]) and np.isnan(residuos[1]) and iteraciones[1] == 0
+    np.testing.assert_allclose(raices[[0, 2]], [2 ** (1 / 3), 5 ** (1 / 3)], rtol=1e-8)
+
+    raices, _, iteraciones = lotes(cubica, 0.0, 4.0, args=(np.array([-1.0, -2.0]),))
+    assert np.isnan(raices).all() and not iteraciones.any()
+
+
+@pytest.mark.parametrize('lotes', [biseccion_lotes, regula_falsi_lotes])
+def test_intervalos_en_lotes_sin_iteraciones(lotes):
+    with pytest.raises(ValueError):
+        lotes(cubica, 0.0, 4.0, max_iter=0, args=(PARAMETROS,))